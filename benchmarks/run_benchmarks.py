@@ -0,0 +1,478 @@
+"""
+Headless performance benchmarks for MediaPlayer.
+
+Drives the real MediaPlayer with VLC's dummy video and audio outputs and
+Qt's offscreen platform against media generated on the fly, and writes
+the results as JSON. A stored result can be passed as a baseline to flag
+regressions:
+
+    python benchmarks/run_benchmarks.py --output results.json
+    python benchmarks/run_benchmarks.py --baseline results.json
+
+The exit code is 1 if any metric regressed against the baseline and 2 if
+VLC could not be initialized.
+"""
+import os
+import sys
+import gc
+import json
+import time
+import random
+import argparse
+import platform
+import tempfile
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtCore import QCoreApplication, QEventLoop, QTimer
+
+from benchmarks.synthetic_media import generate_media_set
+from src.core.media_player import MediaPlayer
+from src.core.metadata_cache import MetadataCache
+from src.core.vlc_events import VlcEventBridge
+
+HEADLESS_VLC_ARGS = ['--vout=dummy', '--aout=dummy', '--no-audio-time-stretch']
+
+
+def summarize(samples, unit="ms"):
+    """
+    Summarize a list of samples.
+    
+    Returns:
+        dict: Unit, sample count, median, mean, 95th percentile and maximum
+    """
+    values = sorted(samples)
+    count = len(values)
+    if not count:
+        return {'unit': unit, 'samples': 0}
+    return {
+        'unit': unit,
+        'samples': count,
+        'median': round(values[count // 2], 2),
+        'mean': round(sum(values) / count, 2),
+        'p95': round(values[min(count - 1, int(count * 0.95))], 2),
+        'max': round(values[-1], 2),
+    }
+
+
+def get_rss_kb():
+    """Get the resident set size of this process in kilobytes."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError, AttributeError):
+        import resource
+        # Peak instead of current RSS; kilobytes on Linux, bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def wait_until(predicate, timeout):
+    """
+    Run the Qt event loop until predicate() is true.
+    
+    Returns:
+        bool: False if the timeout in seconds expired first
+    """
+    if predicate():
+        return True
+    loop = QEventLoop()
+    deadline = time.perf_counter() + timeout
+    
+    def check():
+        if predicate() or time.perf_counter() > deadline:
+            loop.quit()
+    
+    timer = QTimer()
+    timer.timeout.connect(check)
+    timer.start(1)
+    loop.exec_()
+    timer.stop()
+    return predicate()
+
+
+def idle(seconds):
+    """Run the Qt event loop for a while."""
+    deadline = time.perf_counter() + seconds
+    wait_until(lambda: time.perf_counter() >= deadline, seconds + 1)
+
+
+class StallMonitor:
+    """
+    Measures how long the Qt event loop is blocked.
+    
+    A timer is due every INTERVAL milliseconds; any delay beyond that is
+    time the event loop could not run.
+    """
+    
+    INTERVAL = 5
+    
+    def __init__(self):
+        self.stalls = []
+        self._last = None
+        self._timer = QTimer()
+        self._timer.timeout.connect(self._tick)
+    
+    def start(self):
+        self._last = time.perf_counter()
+        self._timer.start(self.INTERVAL)
+    
+    def stop(self):
+        self._timer.stop()
+    
+    def _tick(self):
+        now = time.perf_counter()
+        self.stalls.append(max(0.0, (now - self._last) * 1000 - self.INTERVAL))
+        self._last = now
+
+
+class EventRecorder:
+    """
+    Timestamps VLC events on VLC's event thread.
+    
+    Only event types MediaPlayer does not attach itself are used, since
+    libvlc keeps one callback per event type.
+    """
+    
+    def __init__(self, media_player):
+        import vlc
+        
+        self.bridge = VlcEventBridge()
+        self.clear()
+        event_manager = media_player.player.event_manager()
+        self.bridge.attach(event_manager, vlc.EventType.MediaPlayerMediaChanged,
+                           lambda value: self.events.append(('media', value)),
+                           lambda event: time.perf_counter())
+        self.bridge.attach(event_manager, vlc.EventType.MediaPlayerPositionChanged,
+                           lambda value: self.events.append(('position', value)),
+                           lambda event: time.perf_counter())
+    
+    def first_frame_after(self, started):
+        """
+        Get the time of the first position report of media set after started.
+        
+        The first position report is when VLC has output the first frame
+        or audio buffer.
+        
+        Returns:
+            float: perf_counter timestamp, or None if there was none yet
+        """
+        media_set = False
+        for kind, timestamp in self.events:
+            if timestamp < started:
+                continue
+            if kind == 'media':
+                media_set = True
+            elif media_set:
+                return timestamp
+        return None
+    
+    def clear(self):
+        """Drop the events recorded so far."""
+        self.events = []
+    
+    def detach(self):
+        self.bridge.detach_all()
+
+
+class PlayerBenchmark:
+    """Runs the individual benchmarks against one MediaPlayer."""
+    
+    def __init__(self, media_player, media, timeout=10.0):
+        self.media_player = media_player
+        self.media = media
+        self.timeout = timeout
+        self.recorder = EventRecorder(media_player)
+        self.failures = []
+        
+        self._changed_at = None
+        media_player.current_media_changed.connect(self._on_current_media_changed)
+    
+    def _on_current_media_changed(self, _):
+        self._changed_at = time.perf_counter()
+    
+    def stop(self):
+        """Stop playback and wait for VLC to settle."""
+        self.media_player.stop()
+        wait_until(lambda: not self.media_player.player.is_playing(), self.timeout)
+        idle(0.05)
+    
+    def load(self, path):
+        """
+        Load a media file and wait for its first frame.
+        
+        Returns:
+            tuple: Load latency and time to first frame in milliseconds,
+                   or None on timeout
+        """
+        self.stop()
+        self._changed_at = None
+        self.recorder.clear()
+        started = time.perf_counter()
+        self.media_player.load(path)
+        
+        if not wait_until(lambda: self._changed_at is not None
+                          and self.recorder.first_frame_after(started) is not None, self.timeout):
+            self.failures.append(f"Timed out loading {os.path.basename(path)}")
+            return None
+        first_frame = self.recorder.first_frame_after(started)
+        return (self._changed_at - started) * 1000, (first_frame - started) * 1000
+    
+    def run_loads(self, count):
+        """Measure load latency and time to first frame."""
+        load_latency, first_frame = [], []
+        paths = [self.media['video'], self.media['video_alt'], self.media['audio']]
+        for index in range(count):
+            result = self.load(paths[index % len(paths)])
+            if result is not None:
+                load_latency.append(result[0])
+                first_frame.append(result[1])
+        return {
+            'load_latency': summarize(load_latency),
+            'time_to_first_frame': summarize(first_frame),
+        }
+    
+    def run_seeks(self, count, seed=1):
+        """Measure exact seek latency and coalescing while scrubbing."""
+        if self.load(self.media['video']) is None:
+            return {}
+        wait_until(lambda: self.media_player.get_duration() > 0, self.timeout)
+        duration = self.media_player.get_duration()
+        rng = random.Random(seed)
+        
+        # Exact seeks, one at a time
+        latencies = []
+        for _ in range(count):
+            started = time.perf_counter()
+            self.media_player.seek(rng.randint(0, duration - 1000))
+            if wait_until(lambda: not self.media_player.seek_scheduler.is_seeking(), self.timeout):
+                latencies.append((time.perf_counter() - started) * 1000)
+            else:
+                self.failures.append("Timed out waiting for a seek")
+        
+        # A scrub: fast seeks requested at display rate, then one exact seek
+        self.media_player.seek_scheduler.reset_stats()
+        started = time.perf_counter()
+        for step in range(60):
+            self.media_player.seek(duration * step // 60, exact=False)
+            idle(1 / 60)
+        self.media_player.seek(duration // 2)
+        wait_until(lambda: not self.media_player.seek_scheduler.is_seeking(), self.timeout)
+        scrub = summarize([(time.perf_counter() - started) * 1000])
+        scrub.update({
+            'requests': 61,
+            'issued': self.media_player.get_seek_stats()['issued'],
+        })
+        
+        return {
+            'seek_latency': summarize(latencies),
+            'scrub_settle': scrub,
+        }
+    
+    def run_switches(self, count):
+        """Measure skipping to a preloaded next item and gapless handover gaps."""
+        switches, gaps = [], []
+        for _ in range(count):
+            if self.load(self.media['video']) is None:
+                continue
+            self.media_player.set_next(self.media['video_alt'])
+            idle(0.3)   # Let the preload parse
+            
+            self.recorder.clear()
+            started = time.perf_counter()
+            if not self.media_player.play_next():
+                self.failures.append("Next item was not preloaded")
+                continue
+            if wait_until(lambda: self.recorder.first_frame_after(started) is not None, self.timeout):
+                switches.append((self.recorder.first_frame_after(started) - started) * 1000)
+            else:
+                self.failures.append("Timed out switching to the next item")
+        
+        for _ in range(count):
+            if self.load(self.media['clip_a']) is None:
+                continue
+            self.media_player.last_gap = None
+            self.media_player.set_next(self.media['clip_b'])
+            if wait_until(lambda: self.media_player.last_gap is not None, self.timeout):
+                gaps.append(self.media_player.last_gap)
+            else:
+                self.failures.append("Timed out waiting for the gapless handover")
+        
+        return {
+            'playlist_switch': summarize(switches),
+            'gapless_gap': summarize(gaps),
+        }
+    
+    def run_memory(self, count):
+        """Measure resident memory growth over repeated loads."""
+        paths = [self.media['video'], self.media['audio']]
+        
+        # Warm up so one-time allocations are not counted
+        for path in paths:
+            self.load(path)
+        gc.collect()
+        before = get_rss_kb()
+        for index in range(count):
+            self.load(paths[index % len(paths)])
+        self.stop()
+        gc.collect()
+        after = get_rss_kb()
+        
+        growth = summarize([after - before], unit="kB")
+        growth['loads'] = count
+        growth['per_load'] = round((after - before) / max(1, count), 2)
+        return {'memory_growth': growth}
+
+
+def run(options):
+    """
+    Run all benchmarks.
+    
+    Returns:
+        dict: Results, or None if VLC could not be initialized
+    """
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv[:1])
+    work_dir = options.media_dir or tempfile.mkdtemp(prefix="onaplay-bench-")
+    media = generate_media_set(work_dir)
+    
+    stall_monitor = StallMonitor()
+    stall_monitor.start()
+    
+    cache = MetadataCache(os.path.join(work_dir, "metadata.db"))
+    media_player = MediaPlayer(vlc_args=HEADLESS_VLC_ARGS, metadata_cache=cache)
+    started = time.perf_counter()
+    
+    # ready is emitted once VLC initialization is over, whether it worked or not
+    initialized, errors = [], []
+    media_player.ready.connect(lambda: initialized.append(True))
+    media_player.error_occurred.connect(errors.append)
+    wait_until(lambda: initialized, 30)
+    if not media_player.is_ready():
+        reason = errors[0] if errors else "VLC did not initialize within 30 s"
+        print(f"Benchmarks need VLC: {reason}", file=sys.stderr)
+        media_player.cleanup()
+        return None
+    startup = summarize([(time.perf_counter() - started) * 1000])
+    
+    benchmark = PlayerBenchmark(media_player, media, timeout=options.timeout)
+    metrics = {'vlc_startup': startup}
+    metrics.update(benchmark.run_loads(options.loads))
+    metrics.update(benchmark.run_seeks(options.seeks))
+    metrics.update(benchmark.run_switches(options.switches))
+    metrics.update(benchmark.run_memory(options.memory_loads))
+    
+    stall_monitor.stop()
+    stalls = summarize(stall_monitor.stalls)
+    stalls['over_50ms'] = sum(1 for stall in stall_monitor.stalls if stall > 50)
+    metrics['event_loop_stall'] = stalls
+    
+    benchmark.recorder.detach()
+    media_player.cleanup()
+    app.processEvents()
+    
+    import vlc
+    return {
+        'meta': {
+            'timestamp': time.strftime("%Y-%m-%dT%H:%M:%S"),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'libvlc': vlc.libvlc_get_version().decode('utf-8', 'replace'),
+            'python_vlc': getattr(vlc, '__version__', ''),
+        },
+        'metrics': metrics,
+        'failures': benchmark.failures,
+    }
+
+
+def compare(results, baseline, tolerance=0.2, min_delta=None):
+    """
+    Compare results against a baseline.
+    
+    All metrics are lower-is-better. A metric regressed when its median
+    grew by more than the relative tolerance and by more than a minimum
+    absolute amount, so noise on tiny values does not count.
+    
+    Args:
+        results (dict): Results of run()
+        baseline (dict): Earlier results
+        tolerance (float): Allowed relative growth
+        min_delta (dict): Minimum absolute growth per unit
+    
+    Returns:
+        dict: Metric name to comparison, with a 'regressed' flag
+    """
+    min_delta = min_delta or {'ms': 2.0, 'kB': 1024}
+    comparison = {}
+    for name, current in results['metrics'].items():
+        previous = baseline.get('metrics', {}).get(name)
+        if not previous or 'median' not in previous or 'median' not in current:
+            continue
+        old, new = previous['median'], current['median']
+        delta = new - old
+        comparison[name] = {
+            'baseline': old,
+            'current': new,
+            'change': round(delta / old, 3) if old else None,
+            'regressed': delta > old * tolerance and delta > min_delta.get(current['unit'], 0),
+        }
+    return comparison
+
+
+def print_report(results, file=sys.stderr):
+    """Print a human readable summary of the results."""
+    comparison = results.get('comparison', {})
+    for name, metric in results['metrics'].items():
+        line = f"{name:<22} median {metric.get('median', '-'):>10} {metric['unit']:<3}"
+        line += f"  p95 {metric.get('p95', '-'):>10}  max {metric.get('max', '-'):>10}"
+        if name in comparison:
+            entry = comparison[name]
+            change = entry['change']
+            line += f"  vs {entry['baseline']:>10}"
+            if change is not None:
+                line += f" ({change:+.0%})"
+            if entry['regressed']:
+                line += "  REGRESSED"
+        print(line, file=file)
+    for failure in results['failures']:
+        print(f"failure: {failure}", file=file)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless MediaPlayer benchmarks")
+    parser.add_argument("--output", help="Write the JSON results to this file instead of stdout")
+    parser.add_argument("--baseline", help="Compare against the JSON results in this file")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Relative growth of a median counted as a regression")
+    parser.add_argument("--media-dir", help="Directory for the generated media (kept between runs)")
+    parser.add_argument("--loads", type=int, default=20)
+    parser.add_argument("--seeks", type=int, default=20)
+    parser.add_argument("--switches", type=int, default=5)
+    parser.add_argument("--memory-loads", type=int, default=50)
+    parser.add_argument("--timeout", type=float, default=10.0,
+                        help="Seconds to wait for each operation")
+    options = parser.parse_args()
+    
+    results = run(options)
+    if results is None:
+        return 2
+    
+    regressed = False
+    if options.baseline:
+        with open(options.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        results['comparison'] = compare(results, baseline, options.tolerance)
+        regressed = any(entry['regressed'] for entry in results['comparison'].values())
+    
+    print_report(results)
+    output = json.dumps(results, indent=2)
+    if options.output:
+        with open(options.output, 'w', encoding='utf-8') as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+    return 1 if regressed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+import os
+import math
+import wave
+import array
+
+
+def write_wav(path, seconds, sample_rate=44100, frequency=440.0):
+    """
+    Write a mono 16-bit sine tone.
+    
+    Args:
+        path (str): Output file
+        seconds (float): Duration
+        sample_rate (int): Samples per second
+        frequency (float): Tone frequency in Hz
+    """
+    # One period repeated over the whole file, written a second at a time
+    period = [int(12000 * math.sin(2 * math.pi * i / sample_rate * frequency))
+              for i in range(sample_rate)]
+    second = array.array('h', period).tobytes()
+    total = int(seconds * sample_rate)
+    
+    with wave.open(path, 'wb') as output:
+        output.setnchannels(1)
+        output.setsampwidth(2)
+        output.setframerate(sample_rate)
+        written = 0
+        while written < total:
+            count = min(sample_rate, total - written)
+            output.writeframes(second[:count * 2])
+            written += count
+
+
+def write_y4m(path, seconds, width=160, height=120, fps=25):
+    """
+    Write an uncompressed YUV4MPEG2 video of a bar moving across a gray frame.
+    
+    VLC plays Y4M without any codec, so the files need no encoder to create.
+    
+    Args:
+        path (str): Output file
+        seconds (float): Duration
+        width (int): Frame width, must be even
+        height (int): Frame height, must be even
+        fps (int): Frames per second
+    """
+    chroma = bytes([128]) * (width // 2 * height // 2 * 2)
+    bar = max(2, width // 16)
+    frames = int(seconds * fps)
+    
+    with open(path, 'wb') as output:
+        output.write(f"YUV4MPEG2 W{width} H{height} F{fps}:1 Ip A1:1 C420jpeg\n".encode('ascii'))
+        for index in range(frames):
+            x = index * 4 % (width - bar)
+            row = bytes([64]) * x + bytes([235]) * bar + bytes([64]) * (width - x - bar)
+            output.write(b"FRAME\n")
+            output.write(row * height)
+            output.write(chroma)
+
+
+def generate_media_set(directory):
+    """
+    Create the media used by the benchmarks.
+    
+    Args:
+        directory (str): Directory to write the files to
+    
+    Returns:
+        dict: Role name to file path
+    """
+    os.makedirs(directory, exist_ok=True)
+    media = {
+        'video': (write_y4m, 'video.y4m', 15),
+        'video_alt': (write_y4m, 'video_alt.y4m', 5),
+        'audio': (write_wav, 'audio.wav', 10),
+        'clip_a': (write_wav, 'clip_a.wav', 1),
+        'clip_b': (write_wav, 'clip_b.wav', 1),
+    }
+    
+    paths = {}
+    for role, (writer, name, seconds) in media.items():
+        path = os.path.join(directory, name)
+        if not os.path.exists(path):
+            writer(path, seconds)
+        paths[role] = path
+    return paths
@@ -1,20 +1,35 @@
 import sys
 import os
+import argparse
 import traceback
 
-from PyQt5.QtWidgets import QApplication, QMessageBox, QSplashScreen
-from PyQt5.QtCore import Qt, QTimer
-from PyQt5.QtGui import QPixmap, QIcon
-
 # Add the project root to the Python path
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-from src.ui.main_window import MainWindow
-from src.core.media_player import MediaPlayer
+from src.utils import startup_profile, tracing
+
+from PyQt5.QtWidgets import QApplication, QMessageBox, QSplashScreen
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtGui import QPixmap, QIcon
+
 from src.utils.file_utils import get_asset_path
 
+log = tracing.get_logger("app")
+
+# Used when the stylesheet cannot be found
+FALLBACK_STYLESHEET = """
+    QMainWindow {
+        background-color: #1e1e1e;
+    }
+    
+    QWidget {
+        color: #ffffff;
+        font-family: Arial, sans-serif;
+    }
+"""
+
 def show_splash_screen():
     """Show a splash screen while the application is loading."""
     splash_pix = QPixmap(get_asset_path("images/splash.png"))
@@ -41,40 +56,45 @@ def setup_application():
         app.setOrganizationName("OnaPlay")
         
         # Set application icon
-        icon_path = r"C:\Users\goon\Documents\New folder (10)\onaplay\assets\icons\app_icon.ico"
+        icon_path = get_asset_path("icons/app_icon.ico")
         if os.path.exists(icon_path):
             app.setWindowIcon(QIcon(icon_path))
         else:
-            print(f"Warning: Icon file not found at {icon_path}")
+            log.warning("Icon file not found at %s", icon_path)
             # Try alternative paths
             alt_paths = [
-                r"C:\Users\goon\Documents\New folder (10)\onaplay\assets\icons\app_icon_256.png",
-                r"C:\Users\goon\Documents\New folder (10)\onaplay\assets\icons\app_icon_128.png",
-                r"C:\Users\goon\Documents\New folder (10)\onaplay\assets\icons\app_icon_64.png",
+                get_asset_path("icons/app_icon_256.png"),
+                get_asset_path("icons/app_icon_128.png"),
+                get_asset_path("icons/app_icon_64.png"),
             ]
             for path in alt_paths:
                 if os.path.exists(path):
                     app.setWindowIcon(QIcon(path))
-                    print(f"Using alternative icon: {path}")
+                    log.info("Using alternative icon: %s", path)
                     break
         
         # Set application style
         app.setStyle("Fusion")
         
-        # Load and apply stylesheet
-        style_path = r"C:\Users\goon\Documents\New folder (10)\onaplay\assets\styles\dark_theme.qss"
+        startup_profile.mark("qapplication")
+        
+        # Load and apply stylesheet; this is the only place it is loaded
+        style_path = get_asset_path("styles/dark_theme.qss")
+        stylesheet = FALLBACK_STYLESHEET
         if os.path.exists(style_path):
             try:
                 with open(style_path, "r") as f:
-                    app.setStyleSheet(f.read())
+                    stylesheet = f.read()
             except Exception as e:
-                print(f"Error loading stylesheet: {e}")
+                log.error("Error loading stylesheet: %s", e)
         else:
-            print(f"Stylesheet not found at {style_path}")
+            log.warning("Stylesheet not found at %s", style_path)
+        app.setStyleSheet(stylesheet)
+        startup_profile.mark("stylesheet")
         
         return app
     except Exception as e:
-        print(f"Error in setup_application: {e}")
+        log.error("Error in setup_application: %s", e)
         raise
 
 def handle_exception(exc_type, exc_value, exc_traceback):
@@ -90,8 +110,8 @@ def handle_exception(exc_type, exc_value, exc_traceback):
     {''.join(traceback.format_tb(exc_traceback))}
     """
     
-    # Print to console
-    print(error_msg, file=sys.stderr)
+    # Log to the console
+    log.critical(error_msg)
     
     # Show error dialog if possible
     app = QApplication.instance()
@@ -106,20 +126,129 @@ def handle_exception(exc_type, exc_value, exc_traceback):
     
     return True  # Prevent default exception hook
 
+def parse_arguments():
+    """
+    Parse the command line.
+    
+    Unknown options are left in sys.argv for Qt.
+    
+    Returns:
+        argparse.Namespace: Parsed options
+    """
+    parser = argparse.ArgumentParser(prog="onaplay", description="OnaPlay media player")
+    parser.add_argument("paths", nargs="*", help="Files, folders, playlists or URLs to open")
+    parser.add_argument("--enqueue", action="store_true",
+                        help="Add to the playlist instead of playing right away")
+    parser.add_argument("--new-instance", action="store_true",
+                        help="Start a new window even if OnaPlay is already running")
+    parser.add_argument("--startup-profile", action="store_true",
+                        help="Print a per-phase startup timing breakdown")
+    
+    diagnostics = parser.add_argument_group("logging and tracing")
+    diagnostics.add_argument("--log-level", choices=tracing.LEVELS, default="warning",
+                             help="Lowest level of log messages written to standard error")
+    diagnostics.add_argument("--log-categories", default="",
+                             help="Comma separated categories that log at --log-level, "
+                                  "e.g. player,probe; all others only log warnings and errors")
+    diagnostics.add_argument("--trace", metavar="FILE",
+                             help="Record load, parse, seek and first frame spans and write "
+                                  "them to FILE as Chrome trace JSON on exit")
+    diagnostics.add_argument("--stall-threshold", type=int, default=200, metavar="MS",
+                             help="Record the call stack whenever the event loop is blocked "
+                                  "for longer than MS milliseconds; 0 turns this off. Stalls "
+                                  "are logged in the stall category at info level")
+    diagnostics.add_argument("--stall-report", metavar="FILE",
+                             help="Write the recorded event loop stalls to FILE as JSON on exit")
+    
+    probe = parser.add_argument_group("headless probing")
+    probe.add_argument("--probe", action="store_true",
+                       help="Print the media info of the given files, folders and URLs "
+                            "as JSON Lines instead of starting the player")
+    probe.add_argument("--jobs", type=int, default=None,
+                       help="Number of probe processes (default: number of CPUs)")
+    probe.add_argument("--timeout", type=int, default=5000,
+                       help="Milliseconds before probing a single media is given up")
+    probe.add_argument("--no-cache", action="store_true",
+                       help="Neither read nor fill the metadata cache")
+    options, qt_args = parser.parse_known_args(sys.argv[1:])
+    sys.argv = sys.argv[:1] + qt_args
+    return options
+
 def main():
     """Main application entry point."""
     # Set up exception handling first
     sys.excepthook = handle_exception
+    options = parse_arguments()
+    categories = [name.strip() for name in options.log_categories.split(",") if name.strip()]
+    tracing.configure(options.log_level, categories)
+    if options.trace:
+        tracing.enable()
+    
+    # Headless probing needs neither widgets nor a running instance
+    if options.probe:
+        from src.core.batch_probe import run_probe
+        return run_probe(options.paths, options.jobs, options.timeout, not options.no_cache)
+    
+    # Print a per-phase timing breakdown once the window is interactive
+    # and VLC is ready
+    if options.startup_profile:
+        startup_profile.enable(report_after=("interactive", "vlc ready"))
+    startup_profile.mark("python imports")
+    
+    # Hand the arguments to a running instance and exit before starting
+    # the UI or libvlc
+    from src.utils.single_instance import (InstanceServer, forward_to_running_instance,
+                                           normalize_arguments)
+    paths = normalize_arguments(options.paths)
+    if not options.new_instance and forward_to_running_instance(paths, options.enqueue):
+        log.info("Arguments handed over to the running instance")
+        return 0
+    startup_profile.mark("single instance check")
     
     try:
-        print("Starting OnaPlay...")
+        log.info("Starting OnaPlay")
         
         # Set up and show splash screen
         app = setup_application()
+        
+        # Claim the instance name before the slow UI startup, so a launch
+        # racing this one forwards to us instead of starting a second window.
+        # Hand-offs arriving before the window exists are held until then.
+        instance_server = None
+        held_messages = []
+        if not options.new_instance:
+            instance_server = InstanceServer(app)
+            instance_server.message_received.connect(
+                lambda *message: held_messages.append(message))
+            if not instance_server.listen(remove_stale=False):
+                # Another launch claimed the name since the first check
+                if forward_to_running_instance(paths, options.enqueue):
+                    log.info("Arguments handed over to the running instance")
+                    return 0
+                instance_server.listen()
+            startup_profile.mark("single instance server")
+        
         splash = show_splash_screen()
+        startup_profile.mark("splash screen")
+        
+        # Import the UI only once the splash screen is up
+        from src.ui.main_window import MainWindow
+        startup_profile.mark("ui imports")
+        
+        # Watch the event loop for stalls once startup is done
+        watchdog = None
+        if options.stall_threshold > 0:
+            from src.utils.stall_watchdog import StallWatchdog
+            watchdog = StallWatchdog(options.stall_threshold, parent=app)
+            QTimer.singleShot(0, watchdog.start)
         
         # Create main window
-        window = MainWindow()
+        window = MainWindow(watchdog)
+        
+        def on_vlc_ready():
+            startup_profile.add("vlc init", window.media_player.vlc_init_time)
+            startup_profile.mark("vlc ready")
+        window.media_player.ready.connect(on_vlc_ready)
         
         # Close splash and show main window
         splash.finish(window)
@@ -131,20 +260,36 @@ def main():
         window.activateWindow()
         window.setFocus()
         
-        # Check for command line arguments
-        if len(sys.argv) > 1:
-            file_path = sys.argv[1]
-            if os.path.exists(file_path):
-                window.open_file(file_path)
+        # Accept arguments of later launches
+        if instance_server is not None:
+            instance_server.message_received.disconnect()
+            instance_server.message_received.connect(window.on_remote_open)
+        
+        # Open command line arguments, then whatever later launches sent
+        if paths:
+            window.open_paths(paths, options.enqueue)
+        for held_paths, held_enqueue in held_messages:
+            window.on_remote_open(held_paths, held_enqueue)
         
-        print("Application started successfully")
+        log.info("Application started")
+        startup_profile.mark("window shown")
+        QTimer.singleShot(0, lambda: startup_profile.mark("interactive"))
         
         # Run application
-        sys.exit(app.exec_())
+        exit_code = app.exec_()
+        if watchdog is not None:
+            watchdog.stop()
+            if options.stall_report:
+                count = watchdog.dump(options.stall_report)
+                log.info("Wrote %d stalls to %s", count, options.stall_report)
+        if options.trace:
+            count = tracing.export(options.trace)
+            log.info("Wrote %d trace events to %s", count, options.trace)
+        return exit_code
         
     except Exception as e:
         handle_exception(type(e), e, e.__traceback__)
         return 1
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
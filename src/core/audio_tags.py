@@ -0,0 +1,127 @@
+import os
+
+try:
+    import mutagen
+except ImportError:
+    mutagen = None
+
+from src.utils.file_utils import format_size
+
+# Audio containers whose tags and stream info mutagen reads without VLC
+TAG_EXTENSIONS = {'.mp3', '.flac', '.ogg', '.m4a', '.wma', '.wav'}
+
+# Mutagen stream info class name to the codec fourcc VLC would report
+_CODECS = {
+    'MPEGInfo': 'mpga',
+    'StreamInfo': 'flac',
+    'OggVorbisInfo': 'vorb',
+    'OggOpusInfo': 'opus',
+    'OggFLACStreamInfo': 'flac',
+    'OggSpeexInfo': 'spx ',
+    'MP4Info': 'mp4a',
+    'ASFInfo': 'wma2',
+    'WaveStreamInfo': 'araw',
+}
+
+# Tag keys per field, covering ID3/MP4 (easy mode), Vorbis comments and ASF
+_TAG_KEYS = {
+    'title': ('title', 'Title'),
+    'artist': ('artist', 'Author', 'albumartist', 'WM/AlbumArtist'),
+    'album': ('album', 'WM/AlbumTitle'),
+    'genre': ('genre', 'WM/Genre'),
+}
+
+
+def is_available():
+    """Check if mutagen is installed."""
+    return mutagen is not None
+
+
+def _first_tag(tags, keys):
+    """Get the first non-empty value of the given tag keys as a string."""
+    if not tags:
+        return None
+    for key in keys:
+        try:
+            values = tags.get(key)
+        except (KeyError, ValueError):
+            continue
+        if not values:
+            continue
+        value = values[0] if isinstance(values, list) else values
+        value = str(value).strip()
+        if value:
+            return value
+    return None
+
+
+def read_audio_info(file_path):
+    """
+    Read tags and stream information of an audio file with mutagen.
+    
+    Only the container headers and tags are read; nothing is decoded and
+    no libvlc call is made, so it is fast and safe to call from several
+    threads or processes at once.
+    
+    Args:
+        file_path (str): Local path of the audio file
+    
+    Returns:
+        dict: Media information in the same form as build_media_info, or
+              None when VLC has to be used instead, e.g. because mutagen is
+              not installed, the format is not supported or the file has no
+              usable stream information
+    """
+    if mutagen is None:
+        return None
+    ext = os.path.splitext(file_path)[1].lower()
+    if ext not in TAG_EXTENSIONS:
+        return None
+    
+    try:
+        audio = mutagen.File(file_path, easy=True)
+    except Exception:
+        return None     # Damaged or unexpected files are left to VLC
+    if audio is None or audio.info is None or not getattr(audio.info, 'length', 0):
+        return None
+    
+    stream = audio.info
+    duration = int(stream.length * 1000)
+    channels = getattr(stream, 'channels', 0) or 0
+    rate = getattr(stream, 'sample_rate', 0) or 0
+    bitrate = getattr(stream, 'bitrate', 0) or 0
+    
+    codec = _CODECS.get(type(stream).__name__, '')
+    fourcc = int.from_bytes(codec.encode('ascii').ljust(4)[:4], 'little') if codec else 0
+    track = {
+        'id': 0,
+        'codec': codec.strip(),
+        'fourcc': fourcc,
+        'bitrate': bitrate,
+        'language': '',
+        'type': 'audio',
+        'channels': channels,
+        'rate': rate,
+    }
+    
+    file_size = os.path.getsize(file_path)
+    name = os.path.basename(file_path)
+    tags = audio.tags
+    
+    return {
+        'file': name,
+        'path': file_path,
+        'size': format_size(file_size) if file_size > 0 else "-",
+        'duration': duration,
+        'format': ext[1:].upper(),
+        'resolution': "-",
+        'fps': "-",
+        'video_codec': "-",
+        'audio': f"{channels} channels, {rate // 1000} kHz" if channels else "-",
+        'bitrate': f"{bitrate // 1000} kbps" if bitrate >= 1000 else "-",
+        'title': _first_tag(tags, _TAG_KEYS['title']) or name,
+        'artist': _first_tag(tags, _TAG_KEYS['artist']) or 'Unknown',
+        'album': _first_tag(tags, _TAG_KEYS['album']) or 'Unknown',
+        'genre': _first_tag(tags, _TAG_KEYS['genre']) or 'Unknown',
+        'tracks': [track],
+    }
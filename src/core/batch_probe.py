@@ -0,0 +1,262 @@
+import os
+import sys
+import json
+import time
+import contextlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+from PyQt5.QtCore import QUrl
+
+from src.core.media_probe import probe_media
+from src.utils.file_utils import iter_media_files
+from src.utils import tracing
+
+log = tracing.get_logger("probe")
+
+# Seconds added to a chunk's deadline for starting the worker
+DEADLINE_MARGIN = 10
+
+# State of a pool worker process, set up once by _init_worker
+_worker = {}
+
+
+def _init_worker(vlc_args, use_cache, timeout):
+    """Create the VLC instance and metadata cache of a pool worker."""
+    from src.core.metadata_cache import MetadataCache
+    
+    # Standard output is reserved for the JSON Lines of the parent
+    sys.stdout = sys.stderr
+    try:
+        import vlc
+        _worker['instance'] = vlc.Instance(' '.join(vlc_args))
+    except Exception as e:
+        log.error("Failed to initialize VLC: %s", e)
+        _worker['instance'] = None
+    _worker['cache'] = MetadataCache() if use_cache else None
+    _worker['timeout'] = timeout
+
+
+def _probe_chunk(paths):
+    """
+    Probe a chunk of media in a pool worker.
+    
+    Returns:
+        list: One result record per path
+    """
+    instance = _worker['instance']
+    cache = _worker['cache']
+    records = []
+    for path in paths:
+        started = time.perf_counter()
+        hits = cache.hits if cache is not None else 0
+        record = {'path': path, 'ok': False}
+        try:
+            record['info'] = probe_media(instance, path, cache, _worker['timeout'])
+            record['ok'] = True
+            record['cached'] = cache is not None and cache.hits > hits
+        except Exception as e:
+            record['error'] = str(e) or type(e).__name__
+        record['ms'] = round((time.perf_counter() - started) * 1000, 2)
+        records.append(record)
+    if cache is not None:
+        # Pool workers exit without closing the cache
+        cache.flush()
+    return records
+
+
+def iter_probe_targets(paths):
+    """
+    Yield the media to probe: media files under the given paths, and URLs.
+    
+    Files given explicitly are probed whatever their extension; file://
+    URIs are treated as local paths. An argument that is neither a URL
+    nor an existing file or directory yields an error record instead.
+    
+    Args:
+        paths (iterable): Files, directories and URLs
+    
+    Yields:
+        str or dict: Path or URL to probe, or the result record of an
+                     argument that cannot be probed
+    """
+    for path in paths:
+        if path.startswith('file:'):
+            path = QUrl(path).toLocalFile() or path
+        elif '://' in path:
+            yield path
+            continue
+        
+        if os.path.isdir(path):
+            yield from iter_media_files([path])
+        elif os.path.isfile(path):
+            yield path
+        else:
+            yield {'path': path, 'ok': False, 'error': "No such file or directory"}
+
+
+def _start_pool(jobs, vlc_args, use_cache, timeout):
+    """Start a process pool whose workers are set up by _init_worker."""
+    return ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                               initargs=(vlc_args, use_cache, timeout))
+
+
+def _kill_pool(executor):
+    """Shut a process pool down without waiting for chunks that hang."""
+    # The executor has no public way to stop a worker stuck in a call
+    processes = list((getattr(executor, '_processes', None) or {}).values())
+    for process in processes:
+        if process.is_alive():
+            process.terminate()
+    executor.shutdown(wait=False)
+    for process in processes:
+        process.join(1)
+
+
+def _failed(paths, error):
+    """Result records for media that could not be probed."""
+    return [{'path': path, 'ok': False, 'error': error} for path in paths]
+
+
+def run_probe(paths, jobs=None, timeout=5000, use_cache=True, chunk_size=16, output=None):
+    """
+    Probe media on a process pool and stream the results as JSON Lines.
+    
+    Every worker process has its own libvlc instance, so probing scales
+    across all cores instead of serializing on one instance. Files are
+    handed out in small chunks and only one chunk per worker is in flight,
+    so huge libraries are streamed instead of listed up front.
+    Each line holds the path, whether probing succeeded, the media info or
+    the error, and the time taken; a summary goes to standard error.
+    
+    A chunk that takes longer than timeout per media, plus a margin for
+    starting the worker, is given up: the pool is restarted and the chunk
+    is retried one media at a time, so only the media that hangs is
+    reported with a "timeout" error. Chunks that crash their worker are
+    retried the same way and reported with a "worker crashed" error.
+    
+    Args:
+        paths (list): Files, directories and URLs to probe
+        jobs (int): Number of worker processes, defaults to the CPU count
+        timeout (int): Milliseconds before probing a single media is given up
+        use_cache (bool): Read and fill the persistent metadata cache
+        chunk_size (int): Number of media handed to a worker at once
+        output: Text stream for the JSON Lines, defaults to standard output
+    
+    Returns:
+        int: Exit code, 1 if any media failed to probe
+    """
+    output = output or sys.stdout
+    jobs = max(1, jobs or os.cpu_count() or 1)
+    vlc_args = ['--quiet', '--no-video-title-show', '--vout=dummy', '--aout=dummy']
+    
+    started = time.perf_counter()
+    probed = failed = 0
+    
+    retry = deque()     # (paths, attempt) to submit before any new chunk
+    pending = {}        # Future to (paths, attempt, deadline)
+    
+    def write(records):
+        nonlocal probed, failed
+        for record in records:
+            probed += 1
+            failed += not record['ok']
+            output.write(json.dumps(record, ensure_ascii=False) + '\n')
+        output.flush()
+    
+    def give_up(paths, attempt, error):
+        """Retry a chunk one media at a time, or fail a single media."""
+        if len(paths) > 1:
+            retry.extend(([path], 0) for path in paths)
+            return []
+        if error == "worker crashed" and attempt == 0:
+            # Another worker's media may have crashed the pool
+            retry.append((paths, 1))
+            return []
+        return _failed(paths, error)
+    
+    # Anything printed while walking directories goes to standard error
+    with contextlib.redirect_stdout(sys.stderr):
+        executor = _start_pool(jobs, vlc_args, use_cache, timeout)
+        targets = iter_probe_targets(paths)
+        invalid = []    # Result records of arguments that cannot be probed
+        
+        def next_chunk():
+            chunk = []
+            for target in targets:
+                if isinstance(target, dict):
+                    invalid.append(target)
+                    continue
+                chunk.append(target)
+                if len(chunk) == chunk_size:
+                    break
+            return chunk or None
+        
+        try:
+            while True:
+                # A retry after a crash runs alone, so a crash is its own fault
+                while len(pending) < jobs and not any(a for _, a, _ in pending.values()):
+                    if retry:
+                        if retry[0][1] and pending:
+                            break
+                        chunk, attempt = retry.popleft()
+                    else:
+                        chunk, attempt = next_chunk(), 0
+                        if chunk is None:
+                            break
+                    deadline = None
+                    if timeout:
+                        deadline = (time.monotonic() + timeout * len(chunk) / 1000
+                                    + DEADLINE_MARGIN)
+                    pending[executor.submit(_probe_chunk, chunk)] = (chunk, attempt, deadline)
+                if invalid:
+                    write(invalid)
+                    invalid.clear()
+                if not pending:
+                    break
+                
+                wait_for = None
+                if timeout:
+                    nearest = min(deadline for _, _, deadline in pending.values())
+                    wait_for = max(0.0, nearest - time.monotonic())
+                done, _ = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+                
+                records = []
+                restart = False
+                for future in done:
+                    chunk, attempt, _ = pending.pop(future)
+                    try:
+                        records += future.result()
+                    except BrokenProcessPool:
+                        restart = True
+                        records += give_up(chunk, attempt, "worker crashed")
+                    except Exception as e:
+                        records += _failed(chunk, str(e) or type(e).__name__)
+                
+                now = time.monotonic()
+                for future, (chunk, attempt, deadline) in list(pending.items()):
+                    if deadline is not None and deadline <= now:
+                        del pending[future]
+                        restart = True
+                        log.warning("Probing %d media timed out, restarting the pool", len(chunk))
+                        records += give_up(chunk, attempt, "timeout")
+                
+                if restart:
+                    # Chunks still running on the old pool start over on the new one
+                    retry.extend((chunk, attempt) for chunk, attempt, _ in pending.values())
+                    pending.clear()
+                    _kill_pool(executor)
+                    executor = _start_pool(jobs, vlc_args, use_cache, timeout)
+                
+                write(records)
+        finally:
+            if pending:
+                _kill_pool(executor)
+            else:
+                executor.shutdown()
+    
+    elapsed = time.perf_counter() - started
+    rate = probed / elapsed if elapsed > 0 else 0.0
+    print(f"Probed {probed} media ({failed} failed) in {elapsed:.1f} s, "
+          f"{rate:.1f} per second with {jobs} workers", file=sys.stderr)
+    return 1 if failed else 0
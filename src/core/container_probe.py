@@ -0,0 +1,426 @@
+import os
+import mmap
+import array
+import struct
+import sys
+
+from src.utils.file_utils import format_size
+
+MP4_EXTENSIONS = {'.mp4', '.m4v', '.mov'}
+MKV_EXTENSIONS = {'.mkv', '.webm'}
+
+# Container codec ids to the codec names VLC reports
+_MP4_CODECS = {
+    'avc1': 'h264', 'avc3': 'h264', 'hev1': 'hevc', 'hvc1': 'hevc',
+    'vp08': 'VP80', 'vp09': 'VP90', 'av01': 'av01', 'mp4v': 'mp4v',
+    'mp4a': 'mp4a', 'Opus': 'Opus', 'ac-3': 'a52', 'ec-3': 'eac3',
+    'alac': 'alac', 'fLaC': 'flac', '.mp3': 'mpga',
+    'tx3g': 'tx3g', 'wvtt': 'wvtt', 'c608': 'c608',
+}
+
+_MKV_CODECS = {
+    'V_MPEG4/ISO/AVC': 'h264', 'V_MPEGH/ISO/HEVC': 'hevc', 'V_VP8': 'VP80',
+    'V_VP9': 'VP90', 'V_AV1': 'av01', 'V_MPEG4/ISO/ASP': 'mp4v', 'V_MPEG2': 'mpgv',
+    'V_THEORA': 'theo', 'A_AAC': 'mp4a', 'A_OPUS': 'Opus', 'A_VORBIS': 'vorb',
+    'A_AC3': 'a52', 'A_EAC3': 'eac3', 'A_DTS': 'dts', 'A_FLAC': 'flac',
+    'A_MPEG/L3': 'mpga', 'A_MPEG/L2': 'mpga', 'A_PCM/INT/LIT': 'araw',
+    'S_TEXT/UTF8': 'subt', 'S_TEXT/ASS': 'ssa', 'S_TEXT/SSA': 'ssa',
+    'S_TEXT/WEBVTT': 'wvtt', 'S_HDMV/PGS': 'pgs', 'S_VOBSUB': 'spu',
+}
+
+_MP4_HANDLERS = {'vide': 'video', 'soun': 'audio', 'sbtl': 'subtitle',
+                 'text': 'subtitle', 'subt': 'subtitle', 'clcp': 'subtitle'}
+_MKV_TRACK_TYPES = {1: 'video', 2: 'audio', 17: 'subtitle'}
+
+
+class ContainerError(Exception):
+    """Raised when a container header is malformed or incomplete."""
+
+
+def _fourcc(codec):
+    """Pack a codec name into a VLC style little-endian fourcc."""
+    return int.from_bytes(codec.encode('ascii', 'replace').ljust(4)[:4], 'little')
+
+
+def _track(track_id, kind, codec, language='', bitrate=0):
+    return {
+        'id': track_id,
+        'codec': codec,
+        'fourcc': _fourcc(codec) if codec else 0,
+        'bitrate': bitrate,
+        'language': language,
+        'type': kind,
+    }
+
+
+# MP4 / QuickTime
+def _mp4_boxes(data, start, end):
+    """
+    Yield (type, payload start, box end) for the boxes between start and end.
+    """
+    offset = start
+    while offset + 8 <= end:
+        size, box_type = struct.unpack_from('>I4s', data, offset)
+        header = 8
+        if size == 1:
+            if offset + 16 > end:
+                raise ContainerError("Truncated box header")
+            size = struct.unpack_from('>Q', data, offset + 8)[0]
+            header = 16
+        elif size == 0:
+            size = end - offset
+        if size < header or offset + size > end:
+            raise ContainerError("Box extends past its parent")
+        yield box_type.decode('latin-1'), offset + header, offset + size
+        offset += size
+
+
+def _mp4_child(data, start, end, box_type):
+    for child_type, child_start, child_end in _mp4_boxes(data, start, end):
+        if child_type == box_type:
+            return child_start, child_end
+    return None
+
+
+def _mp4_path(data, start, end, *path):
+    """Find a nested box, e.g. _mp4_path(data, s, e, 'mdia', 'minf', 'stbl')."""
+    for box_type in path:
+        found = _mp4_child(data, start, end, box_type)
+        if found is None:
+            return None
+        start, end = found
+    return start, end
+
+
+def _mp4_language(code):
+    """Decode the packed ISO-639-2 language of an mdhd box."""
+    if code in (0, 0x7FFF):
+        return ''
+    return ''.join(chr(((code >> shift) & 0x1F) + 0x60) for shift in (10, 5, 0))
+
+
+def _mp4_sample_bytes(data, start):
+    """Get the sample count and total sample size from an stsz box."""
+    sample_size, count = struct.unpack_from('>II', data, start + 4)
+    if sample_size:
+        return count, sample_size * count
+    # The size table only has to be summed, so read it in one go
+    sizes = array.array('I')
+    sizes.frombytes(data[start + 12:start + 12 + count * 4])
+    if sys.byteorder == 'little':
+        sizes.byteswap()
+    return count, sum(sizes)
+
+
+def _mp4_track(data, start, end):
+    """Describe the track of a trak box."""
+    tkhd = _mp4_child(data, start, end, 'tkhd')
+    mdia = _mp4_child(data, start, end, 'mdia')
+    if tkhd is None or mdia is None:
+        return None, 0
+    
+    version = data[tkhd[0]]
+    track_id = struct.unpack_from('>I', data, tkhd[0] + (20 if version == 1 else 12))[0]
+    
+    mdhd = _mp4_child(data, mdia[0], mdia[1], 'mdhd')
+    hdlr = _mp4_child(data, mdia[0], mdia[1], 'hdlr')
+    if mdhd is None or hdlr is None:
+        return None, 0
+    if data[mdhd[0]] == 1:
+        timescale, duration = struct.unpack_from('>IQ', data, mdhd[0] + 20)
+        language = struct.unpack_from('>H', data, mdhd[0] + 32)[0]
+    else:
+        timescale, duration = struct.unpack_from('>II', data, mdhd[0] + 12)
+        language = struct.unpack_from('>H', data, mdhd[0] + 20)[0]
+    seconds = duration / timescale if timescale else 0.0
+    
+    handler = data[hdlr[0] + 8:hdlr[0] + 12].decode('latin-1')
+    kind = _MP4_HANDLERS.get(handler)
+    if kind is None:
+        return None, 0
+    
+    stbl = _mp4_path(data, mdia[0], mdia[1], 'minf', 'stbl')
+    if stbl is None:
+        return None, 0
+    stsd = _mp4_child(data, stbl[0], stbl[1], 'stsd')
+    codec_id = ''
+    entry = None
+    if stsd is not None and struct.unpack_from('>I', data, stsd[0] + 4)[0] > 0:
+        entry = stsd[0] + 8
+        codec_id = data[entry + 4:entry + 8].decode('latin-1')
+    
+    samples = total_bytes = 0
+    stsz = _mp4_child(data, stbl[0], stbl[1], 'stsz')
+    if stsz is not None:
+        samples, total_bytes = _mp4_sample_bytes(data, stsz[0])
+    
+    bitrate = int(total_bytes * 8 / seconds) if seconds > 0 else 0
+    track = _track(track_id, kind, _MP4_CODECS.get(codec_id, codec_id.strip()),
+                   _mp4_language(language), bitrate)
+    
+    # Sample entries: 8 byte box header, 8 bytes of SampleEntry, then the
+    # visual or audio fields
+    if kind == 'video' and entry is not None:
+        track['width'], track['height'] = struct.unpack_from('>HH', data, entry + 32)
+        track['fps'] = samples / seconds if seconds > 0 else 0.0
+    elif kind == 'audio' and entry is not None:
+        track['channels'] = struct.unpack_from('>H', data, entry + 24)[0]
+        track['rate'] = struct.unpack_from('>I', data, entry + 32)[0] >> 16
+    return track, int(seconds * 1000)
+
+
+def probe_mp4(data):
+    """
+    Read duration and tracks from the moov box of an MP4/QuickTime file.
+    
+    Only the top level box headers and the moov box are read, wherever
+    moov is in the file.
+    
+    Returns:
+        tuple: (duration in milliseconds, list of track dicts)
+    """
+    moov = _mp4_child(data, 0, len(data), 'moov')
+    if moov is None:
+        raise ContainerError("No moov box")
+    
+    duration = 0
+    mvhd = _mp4_child(data, moov[0], moov[1], 'mvhd')
+    if mvhd is not None:
+        if data[mvhd[0]] == 1:
+            timescale, length = struct.unpack_from('>IQ', data, mvhd[0] + 20)
+        else:
+            timescale, length = struct.unpack_from('>II', data, mvhd[0] + 12)
+        if timescale:
+            duration = int(length * 1000 / timescale)
+    
+    tracks = []
+    for box_type, start, end in _mp4_boxes(data, moov[0], moov[1]):
+        if box_type != 'trak':
+            continue
+        track, track_duration = _mp4_track(data, start, end)
+        if track is not None:
+            tracks.append(track)
+            duration = duration or track_duration
+    return duration, tracks
+
+
+# Matroska / WebM
+_EBML = 0x1A45DFA3
+_SEGMENT = 0x18538067
+_CLUSTER = 0x1F43B675
+_INFO = 0x1549A966
+_TRACKS = 0x1654AE6B
+_TRACK_ENTRY = 0xAE
+
+
+def _ebml_id(data, offset):
+    first = data[offset]
+    length = 1
+    mask = 0x80
+    while length <= 4 and not first & mask:
+        mask >>= 1
+        length += 1
+    if length > 4:
+        raise ContainerError("Invalid element id")
+    return int.from_bytes(data[offset:offset + length], 'big'), offset + length
+
+
+def _ebml_size(data, offset):
+    """Read an element size; returns None for the unknown size."""
+    first = data[offset]
+    length = 1
+    mask = 0x80
+    while length <= 8 and not first & mask:
+        mask >>= 1
+        length += 1
+    if length > 8:
+        raise ContainerError("Invalid element size")
+    value = first & (mask - 1)
+    for byte in data[offset + 1:offset + length]:
+        value = (value << 8) | byte
+    if value == (1 << (7 * length)) - 1:
+        return None, offset + length
+    return value, offset + length
+
+
+def _ebml_elements(data, start, end):
+    """Yield (id, payload start, payload end) for the elements between start and end."""
+    offset = start
+    while offset < end:
+        element_id, offset = _ebml_id(data, offset)
+        size, offset = _ebml_size(data, offset)
+        payload_end = end if size is None else offset + size
+        if payload_end > end:
+            if element_id == _SEGMENT:
+                payload_end = end   # Truncated file; its headers are still usable
+            else:
+                raise ContainerError("Element extends past its parent")
+        yield element_id, offset, payload_end
+        if size is None:
+            return      # Elements of unknown size run to the end of the parent
+        offset = payload_end
+
+
+def _ebml_uint(data, start, end):
+    return int.from_bytes(data[start:end], 'big')
+
+
+def _ebml_float(data, start, end):
+    if end - start == 4:
+        return struct.unpack_from('>f', data, start)[0]
+    if end - start == 8:
+        return struct.unpack_from('>d', data, start)[0]
+    return 0.0
+
+
+def _ebml_string(data, start, end):
+    return bytes(data[start:end]).rstrip(b'\0').decode('utf-8', 'replace')
+
+
+def _mkv_track(data, start, end):
+    values = {}
+    for element_id, child_start, child_end in _ebml_elements(data, start, end):
+        if element_id in (0xE0, 0xE1):      # Video, Audio
+            for sub_id, sub_start, sub_end in _ebml_elements(data, child_start, child_end):
+                values[sub_id] = (sub_start, sub_end)
+        else:
+            values[element_id] = (child_start, child_end)
+    
+    def uint(element_id, default=0):
+        return _ebml_uint(data, *values[element_id]) if element_id in values else default
+    
+    kind = _MKV_TRACK_TYPES.get(uint(0x83))    # TrackType
+    if kind is None:
+        return None
+    codec_id = _ebml_string(data, *values[0x86]) if 0x86 in values else ''
+    language = _ebml_string(data, *values[0x22B59C]) if 0x22B59C in values else ''
+    track = _track(uint(0xD7), kind, _MKV_CODECS.get(codec_id, codec_id), language)
+    
+    if kind == 'video':
+        track['width'] = uint(0xB0)
+        track['height'] = uint(0xBA)
+        frame_duration = uint(0x23E383)     # DefaultDuration in nanoseconds
+        track['fps'] = 1e9 / frame_duration if frame_duration else 0.0
+    elif kind == 'audio':
+        track['channels'] = uint(0x9F, 1)
+        track['rate'] = int(_ebml_float(data, *values[0xB5])) if 0xB5 in values else 8000
+    return track
+
+
+def probe_mkv(data):
+    """
+    Read duration, title and tracks from the headers of a Matroska/WebM file.
+    
+    The segment's top level elements are stepped over by their sizes, so
+    clusters holding the actual frames are never read.
+    
+    Returns:
+        tuple: (duration in milliseconds, title, list of track dicts)
+    """
+    elements = _ebml_elements(data, 0, len(data))
+    header = next(elements, None)
+    if header is None or header[0] != _EBML:
+        raise ContainerError("Not an EBML file")
+    segment = next((e for e in elements if e[0] == _SEGMENT), None)
+    if segment is None:
+        raise ContainerError("No segment")
+    
+    duration = 0
+    title = None
+    tracks = None
+    for element_id, start, end in _ebml_elements(data, segment[1], segment[2]):
+        if element_id == _INFO:
+            scale = 1000000
+            length = 0.0
+            for child_id, child_start, child_end in _ebml_elements(data, start, end):
+                if child_id == 0x2AD7B1:
+                    scale = _ebml_uint(data, child_start, child_end)
+                elif child_id == 0x4489:
+                    length = _ebml_float(data, child_start, child_end)
+                elif child_id == 0x7BA9:
+                    title = _ebml_string(data, child_start, child_end) or None
+            duration = int(length * scale / 1000000)
+        elif element_id == _TRACKS:
+            tracks = []
+            for child_id, child_start, child_end in _ebml_elements(data, start, end):
+                if child_id == _TRACK_ENTRY:
+                    track = _mkv_track(data, child_start, child_end)
+                    if track is not None:
+                        tracks.append(track)
+        elif element_id == _CLUSTER and tracks is not None:
+            break
+        if tracks is not None and duration:
+            break
+    
+    if tracks is None:
+        raise ContainerError("No track headers before the first cluster")
+    return duration, title, tracks
+
+
+def read_container_info(file_path):
+    """
+    Read media information from MP4 or Matroska headers without decoding.
+    
+    The file is memory-mapped and only the header structures are touched:
+    the moov box of MP4 files and the segment headers of Matroska files,
+    so a library scan costs a few page reads per file.
+    
+    Args:
+        file_path (str): Local path of the media file
+    
+    Returns:
+        dict: Media information in the same form as build_media_info, or
+              None when the container is not supported or its headers
+              cannot be read, so VLC has to be used instead
+    """
+    ext = os.path.splitext(file_path)[1].lower()
+    if ext not in MP4_EXTENSIONS and ext not in MKV_EXTENSIONS:
+        return None
+    
+    title = None
+    try:
+        with open(file_path, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if ext in MP4_EXTENSIONS:
+                duration, tracks = probe_mp4(data)
+            else:
+                duration, title, tracks = probe_mkv(data)
+    except (OSError, ValueError, IndexError, struct.error, ContainerError):
+        return None
+    if duration <= 0 or not tracks:
+        return None
+    
+    file_size = os.path.getsize(file_path)
+    video_track = next((t for t in tracks if t['type'] == 'video'), None)
+    audio_track = next((t for t in tracks if t['type'] == 'audio'), None)
+    
+    resolution = fps = video_codec = audio = "-"
+    if video_track:
+        resolution = f"{video_track['width']}×{video_track['height']}"
+        if video_track['fps'] > 0:
+            fps = f"{video_track['fps']:.2f}"
+        video_codec = f"{video_track['codec'] or 'Unknown'} ({video_track['fourcc']:08x})"
+    if audio_track:
+        audio = f"{audio_track['channels']} channels, {audio_track['rate'] // 1000} kHz"
+    
+    # Stream bitrates are only known for MP4; otherwise use the average
+    bitrate = sum(t['bitrate'] for t in tracks) // 1000 or file_size * 8 // duration
+    
+    name = os.path.basename(file_path)
+    return {
+        'file': name,
+        'path': file_path,
+        'size': format_size(file_size) if file_size > 0 else "-",
+        'duration': duration,
+        'format': ext[1:].upper(),
+        'resolution': resolution,
+        'fps': fps,
+        'video_codec': video_codec,
+        'audio': audio,
+        'bitrate': f"{bitrate} kbps",
+        'title': title or name,
+        'artist': 'Unknown',
+        'album': 'Unknown',
+        'genre': 'Unknown',
+        'tracks': tracks,
+    }
@@ -0,0 +1,88 @@
+import time
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from src.utils import tracing
+
+log = tracing.get_logger("library")
+
+
+class ImportWorker(QThread):
+    """
+    Streams paths from a generator on a worker thread in batches.
+    
+    The source is iterated entirely on the worker thread, so slow file
+    systems never block the GUI. Paths are delivered through batch_ready
+    whenever batch_size paths have been collected or batch_interval seconds
+    have passed, so the playlist fills in while the import is running.
+    """
+    
+    # Signals
+    batch_ready = pyqtSignal(list)              # Paths found since the last batch
+    progress = pyqtSignal(int)                  # Total number of paths found so far
+    scan_progress = pyqtSignal(int, int)        # Directories and entries scanned so far
+    import_finished = pyqtSignal(int, bool)     # Total number of paths, cancelled
+    
+    def __init__(self, source, batch_size=500, batch_interval=0.2, parent=None):
+        """
+        Args:
+            source: Callable taking this worker and returning an iterable of
+                    paths, called on the worker thread. Sources that scan a
+                    lot per path can use is_cancelled and report_scan.
+            batch_size (int): Maximum number of paths per batch
+            batch_interval (float): Maximum seconds between batches
+        """
+        super().__init__(parent)
+        self.source = source
+        self.batch_size = batch_size
+        self.batch_interval = batch_interval
+        self._cancelled = False
+        self._last_scan_report = 0.0
+    
+    def cancel(self):
+        """Stop the import after the current path."""
+        self._cancelled = True
+    
+    def is_cancelled(self):
+        """Check if the import was cancelled."""
+        return self._cancelled
+    
+    def report_scan(self, directories, entries):
+        """
+        Report scanning progress from the source, at most every batch_interval.
+        
+        Args:
+            directories (int): Directories scanned so far
+            entries (int): Directory entries scanned so far
+        """
+        now = time.monotonic()
+        if now - self._last_scan_report >= self.batch_interval:
+            self._last_scan_report = now
+            self.scan_progress.emit(directories, entries)
+    
+    def run(self):
+        total = 0
+        batch = []
+        last_flush = time.monotonic()
+        
+        try:
+            for path in self.source(self):
+                if self._cancelled:
+                    break
+                batch.append(path)
+                
+                now = time.monotonic()
+                if len(batch) >= self.batch_size or now - last_flush >= self.batch_interval:
+                    total += len(batch)
+                    self.batch_ready.emit(batch)
+                    self.progress.emit(total)
+                    batch = []
+                    last_flush = now
+        except Exception as e:
+            log.exception("Error during import: %s", e)
+        
+        if batch and not self._cancelled:
+            total += len(batch)
+            self.batch_ready.emit(batch)
+            self.progress.emit(total)
+        
+        self.import_finished.emit(total, self._cancelled)
@@ -0,0 +1,382 @@
+import os
+import re
+import sqlite3
+import threading
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from src.core.media_probe import probe_media
+from src.utils.file_utils import get_cache_dir, get_file_info, file_info_from_stat
+from src.utils import tracing
+
+log = tracing.get_logger("library")
+
+
+def _meta(value):
+    """Normalize a metadata value, treating VLC's placeholder as empty."""
+    if not value or value == 'Unknown':
+        return ''
+    return str(value)
+
+
+def build_match_query(text):
+    """
+    Turn search box text into an FTS5 MATCH expression.
+    
+    Every word must match as a prefix, so results show up while the user
+    is still typing and "bea abb" finds "Abbey Road" by "The Beatles".
+    
+    Args:
+        text (str): Raw search text
+    
+    Returns:
+        str: MATCH expression, or an empty string if there is nothing to search
+    """
+    words = re.findall(r'\w+', text)
+    if not words:
+        return ''
+    return ' '.join(f'"{word}"*' for word in words)
+
+
+class MediaLibrary:
+    """
+    Persistent, full-text searchable index of media files.
+    
+    Each file is stored once with its size and modification time, so
+    re-indexing only touches files that were added or changed since they
+    were last seen. Title, artist, album, genre and file name are kept in
+    an FTS5 index that triggers keep in sync with the main table.
+    
+    Writes may come from any thread. Searches use their own connection,
+    so they never wait for indexing to finish a write.
+    """
+    
+    def __init__(self, db_path=None):
+        """
+        Open (or create) the library database.
+        
+        Args:
+            db_path (str): Path to the SQLite file, defaults to the user cache dir
+        """
+        if db_path is None:
+            db_path = os.path.join(get_cache_dir(), "library.db")
+        
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS library (
+                id INTEGER PRIMARY KEY,
+                path TEXT NOT NULL UNIQUE,
+                name TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                mtime REAL NOT NULL,
+                title TEXT NOT NULL DEFAULT '',
+                artist TEXT NOT NULL DEFAULT '',
+                album TEXT NOT NULL DEFAULT '',
+                genre TEXT NOT NULL DEFAULT '',
+                duration INTEGER NOT NULL DEFAULT -1,
+                codec TEXT NOT NULL DEFAULT '',
+                width INTEGER NOT NULL DEFAULT 0,
+                height INTEGER NOT NULL DEFAULT 0
+            );
+            
+            CREATE VIRTUAL TABLE IF NOT EXISTS library_fts USING fts5(
+                name, title, artist, album, genre,
+                content='library', content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2',
+                prefix='1 2 3'
+            );
+            
+            CREATE TRIGGER IF NOT EXISTS library_ai AFTER INSERT ON library BEGIN
+                INSERT INTO library_fts (rowid, name, title, artist, album, genre)
+                VALUES (new.id, new.name, new.title, new.artist, new.album, new.genre);
+            END;
+            
+            CREATE TRIGGER IF NOT EXISTS library_ad AFTER DELETE ON library BEGIN
+                INSERT INTO library_fts (library_fts, rowid, name, title, artist, album, genre)
+                VALUES ('delete', old.id, old.name, old.title, old.artist, old.album, old.genre);
+            END;
+            
+            CREATE TRIGGER IF NOT EXISTS library_au AFTER UPDATE ON library BEGIN
+                INSERT INTO library_fts (library_fts, rowid, name, title, artist, album, genre)
+                VALUES ('delete', old.id, old.name, old.title, old.artist, old.album, old.genre);
+                INSERT INTO library_fts (rowid, name, title, artist, album, genre)
+                VALUES (new.id, new.name, new.title, new.artist, new.album, new.genre);
+            END;
+        """)
+        self._conn.commit()
+        
+        # Read-only connection for searches from the GUI thread
+        self._search_conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._search_lock = threading.Lock()
+    
+    def is_current(self, file_path, file_info=None):
+        """
+        Check if a file is indexed and unchanged since it was indexed.
+        
+        Args:
+            file_path (str): Local path of the media file
+            file_info (dict): Result of get_file_info, looked up if omitted
+        """
+        if file_info is None:
+            file_info = get_file_info(file_path)
+        if file_info is None:
+            return False
+        
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT size, mtime FROM library WHERE path = ?", (file_path,)).fetchone()
+        return row is not None and row[0] == file_info['size'] and row[1] == file_info['modified']
+    
+    def update(self, file_path, info, file_info=None):
+        """
+        Add or refresh the entry for a file.
+        
+        Args:
+            file_path (str): Local path of the media file
+            info (dict): Media information dict from get_media_info
+            file_info (dict): Result of get_file_info, looked up if omitted
+        """
+        if file_info is None:
+            file_info = get_file_info(file_path)
+        if file_info is None:
+            return
+        
+        tracks = info.get('tracks') or []
+        video = next((t for t in tracks if t.get('type') == 'video'), None)
+        codec_track = video or next((t for t in tracks if t.get('type') == 'audio'), None)
+        
+        name = os.path.basename(file_path)
+        title = _meta(info.get('title'))
+        values = (
+            name, file_info['size'], file_info['modified'],
+            '' if title == name else title,
+            _meta(info.get('artist')), _meta(info.get('album')), _meta(info.get('genre')),
+            int(info.get('duration') or -1),
+            codec_track['codec'] if codec_track else '',
+            video['width'] if video else 0,
+            video['height'] if video else 0,
+        )
+        
+        with self._lock:
+            # Update in place so the row id and its FTS entry stay stable
+            cursor = self._conn.execute(
+                "UPDATE library SET name = ?, size = ?, mtime = ?, title = ?, artist = ?, "
+                "album = ?, genre = ?, duration = ?, codec = ?, width = ?, height = ? "
+                "WHERE path = ?", values + (file_path,))
+            if cursor.rowcount == 0:
+                self._conn.execute(
+                    "INSERT INTO library (name, size, mtime, title, artist, album, genre, "
+                    "duration, codec, width, height, path) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", values + (file_path,))
+            self._conn.commit()
+    
+    def remove(self, file_path):
+        """Remove the entry for a file."""
+        with self._lock:
+            self._conn.execute("DELETE FROM library WHERE path = ?", (file_path,))
+            self._conn.commit()
+    
+    def prune_missing(self, batch_size=1000):
+        """
+        Remove entries whose files no longer exist.
+        
+        Returns:
+            int: Number of entries removed
+        """
+        with self._lock:
+            paths = [row[0] for row in self._conn.execute("SELECT path FROM library")]
+        
+        missing = [path for path in paths if not os.path.exists(path)]
+        for start in range(0, len(missing), batch_size):
+            with self._lock:
+                self._conn.executemany(
+                    "DELETE FROM library WHERE path = ?",
+                    ((path,) for path in missing[start:start + batch_size]))
+                self._conn.commit()
+        return len(missing)
+    
+    def search(self, text, limit=500):
+        """
+        Find entries matching search text.
+        
+        Every word of the text has to appear in the name, title, artist,
+        album or genre of an entry; words may be incomplete.
+        
+        Args:
+            text (str): Search text as typed by the user
+            limit (int): Maximum number of results
+        
+        Returns:
+            list: (path, duration) tuples in library order
+        """
+        query = build_match_query(text)
+        if not query:
+            return []
+        
+        # Results come back in rowid order, so the LIMIT stops the scan early
+        with self._search_lock:
+            return self._search_conn.execute(
+                "SELECT library.path, library.duration FROM library_fts "
+                "JOIN library ON library.id = library_fts.rowid "
+                "WHERE library_fts MATCH ? LIMIT ?", (query, limit)).fetchall()
+    
+    def count(self):
+        """Get the number of indexed files."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM library").fetchone()[0]
+    
+    def close(self):
+        """Close the database connections."""
+        with self._lock:
+            self._conn.close()
+        with self._search_lock:
+            self._search_conn.close()
+
+
+class _IndexTask(QRunnable):
+    """Runnable that indexes a batch of files on the indexer thread."""
+    
+    def __init__(self, indexer, paths, stats=None):
+        super().__init__()
+        self.indexer = indexer
+        self.paths = paths
+        self.stats = stats
+    
+    def run(self):
+        indexer = self.indexer
+        indexed = 0
+        for i, path in enumerate(self.paths):
+            if indexer.is_stopped():
+                break
+            if self.stats is not None:
+                file_info = file_info_from_stat(path, self.stats[i])
+            else:
+                file_info = get_file_info(path)
+            if file_info is None or indexer.library.is_current(path, file_info):
+                continue
+            try:
+                info = probe_media(indexer.instance, path, indexer.cache)
+                indexer.library.update(path, info, file_info)
+                indexed += 1
+            except Exception as e:
+                log.warning("Error indexing %s: %s", path, e)
+        if indexed:
+            indexer.batch_indexed.emit(indexed)
+
+
+class _UpdateTask(QRunnable):
+    """Runnable that stores the media info of a single file."""
+    
+    def __init__(self, indexer, path, info):
+        super().__init__()
+        self.indexer = indexer
+        self.path = path
+        self.info = info
+    
+    def run(self):
+        try:
+            self.indexer.library.update(self.path, self.info)
+        except Exception as e:
+            log.warning("Error indexing %s: %s", self.path, e)
+
+
+class _PruneTask(QRunnable):
+    """Runnable that drops entries of deleted files."""
+    
+    def __init__(self, indexer):
+        super().__init__()
+        self.indexer = indexer
+    
+    def run(self):
+        try:
+            self.indexer.library.prune_missing()
+        except Exception as e:
+            log.error("Error pruning library: %s", e)
+
+
+class LibraryIndexer(QObject):
+    """
+    Keeps a MediaLibrary up to date in the background.
+    
+    Files are indexed on a single worker thread, one batch at a time.
+    Files that are already indexed and unchanged are skipped without
+    touching VLC, so feeding the same folders again is cheap.
+    """
+    
+    # Signals
+    batch_indexed = pyqtSignal(int)    # Number of files added or refreshed
+    
+    def __init__(self, library, instance, cache=None, parent=None):
+        """
+        Args:
+            library (MediaLibrary): Library to keep up to date
+            instance: vlc.Instance used for probing, may be set later with set_instance
+            cache: Optional MetadataCache shared with the player
+        """
+        super().__init__(parent)
+        self.library = library
+        self.instance = instance
+        self.cache = cache
+        self._stopped = False
+        self._waiting = []    # Batches queued before the instance was set
+        
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+    
+    def is_stopped(self):
+        """Check if the indexer was shut down."""
+        return self._stopped
+    
+    def add_paths(self, paths, stats=None):
+        """
+        Queue local files for indexing; URLs are ignored.
+        
+        Args:
+            paths (list): Paths of the files
+            stats (list): os.stat_result of each path if already known,
+                          e.g. from iter_media_files(with_stat=True)
+        """
+        if stats is not None:
+            local = [(path, stat) for path, stat in zip(paths, stats) if '://' not in path]
+            paths = [path for path, _ in local]
+            stats = [stat for _, stat in local]
+        else:
+            paths = [path for path in paths if '://' not in path]
+        if not paths or self._stopped:
+            return
+        if self.instance is None:
+            self._waiting.append((paths, stats))
+            return
+        self.pool.start(_IndexTask(self, paths, stats))
+    
+    def update(self, path, info):
+        """
+        Queue storing media info that is already known, e.g. from playback.
+        
+        Args:
+            path (str): Local path of the media file
+            info (dict): Media information dict from get_media_info
+        """
+        if not self._stopped:
+            self.pool.start(_UpdateTask(self, path, info))
+    
+    def set_instance(self, instance):
+        """Set the vlc.Instance used for probing and start waiting batches."""
+        self.instance = instance
+        waiting, self._waiting = self._waiting, []
+        for paths, stats in waiting:
+            self.add_paths(paths, stats)
+    
+    def prune(self):
+        """Queue removal of entries whose files were deleted."""
+        if not self._stopped:
+            self.pool.start(_PruneTask(self))
+    
+    def shutdown(self, timeout=2000):
+        """Drop queued batches and wait for the running one to stop."""
+        self._stopped = True
+        self.pool.clear()
+        self.pool.waitForDone(timeout)
@@ -0,0 +1,114 @@
+import threading
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from src.utils import tracing
+
+
+class LoadCancelled(Exception):
+    """Raised by a load function when its request has been superseded."""
+
+
+class MediaLoader(QObject):
+    """
+    Runs media loads on a worker thread, most recent request first.
+    
+    Every request gets a generation id. Only the latest request is kept:
+    requests made while the worker is busy replace each other, so a burst
+    of loads collapses into the last one. The load function is given a
+    callable to check whether its request is still current between its
+    blocking steps and raises LoadCancelled once it is not.
+    
+    Results are reported through signals emitted from the worker thread,
+    so receivers on the GUI thread get them as queued calls.
+    """
+    
+    # Signals
+    loaded = pyqtSignal(int, str, str)     # generation, media_path, result of the load function
+    failed = pyqtSignal(int, str, str)     # generation, media_path, error_message
+    
+    def __init__(self, load_fn, parent=None):
+        """
+        Args:
+            load_fn: Called on the worker thread as load_fn(media_path, is_current);
+                     returns a string passed back through loaded
+        """
+        super().__init__(parent)
+        self.load_fn = load_fn
+        
+        self._cond = threading.Condition()
+        self._generation = 0
+        self._pending = None
+        self._stopping = False
+        self._thread = None
+    
+    # Public API, called on the GUI thread
+    def request(self, media_path):
+        """
+        Queue a load, superseding any earlier one.
+        
+        Args:
+            media_path (str): Path or URL to load, or None to only stop playback
+        
+        Returns:
+            int: Generation id of the request
+        """
+        with self._cond:
+            self._generation += 1
+            self._pending = (self._generation, media_path)
+            self._ensure_thread()
+            self._cond.notify()
+            return self._generation
+    
+    def cancel(self):
+        """Drop the pending request and mark any running one as superseded."""
+        with self._cond:
+            self._generation += 1
+            self._pending = None
+    
+    def generation(self):
+        """Get the generation id of the latest request."""
+        return self._generation
+    
+    def is_current(self, generation):
+        """Check if a generation id belongs to the latest request."""
+        return generation == self._generation
+    
+    def shutdown(self, timeout=2.0):
+        """Cancel all requests and stop the worker thread."""
+        with self._cond:
+            self._stopping = True
+            self._generation += 1
+            self._pending = None
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+    
+    def _ensure_thread(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="MediaLoader", daemon=True)
+            self._thread.start()
+    
+    # Worker thread
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._pending is None and not self._stopping:
+                    self._cond.wait()
+                if self._stopping:
+                    break
+                generation, media_path = self._pending
+                self._pending = None
+            
+            try:
+                with tracing.span("open", "player", path=media_path):
+                    result = self.load_fn(media_path, lambda: self.is_current(generation))
+            except LoadCancelled:
+                continue
+            except Exception as e:
+                if self.is_current(generation):
+                    self.failed.emit(generation, media_path or '', str(e))
+                continue
+            
+            if self.is_current(generation):
+                self.loaded.emit(generation, media_path or '', result or '')
@@ -1,9 +1,19 @@
 import os
-import vlc
-from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot, QTimer, QUrl
-from PyQt5.QtWidgets import QApplication
+import time
+import threading
+from PyQt5.QtCore import Qt, QObject, QTimer, pyqtSignal, pyqtSlot, QUrl
 
+from src.core.media_loader import MediaLoader, LoadCancelled
+from src.core.media_probe import MediaProbeService, probe_media
+from src.core.metadata_cache import MetadataCache
+from src.core.vlc_events import VlcEventBridge
+from src.core.update_scheduler import PositionUpdateScheduler
+from src.core.playback_clock import PlaybackClock
+from src.core.seek_scheduler import SeekScheduler
 from src.utils.file_utils import get_asset_path
+from src.utils import tracing
+
+log = tracing.get_logger("player")
 
 class MediaPlayer(QObject):
     """
@@ -18,66 +28,215 @@ class MediaPlayer(QObject):
     error_occurred = pyqtSignal(str)            # error_message
     volume_changed = pyqtSignal(int)            # volume (0-100)
     playback_finished = pyqtSignal()           # when media finishes playing
+    current_media_changed = pyqtSignal(str)     # path of the media now playing
+    ready = pyqtSignal()                        # VLC initialization finished, see is_ready()
+    _vlc_created = pyqtSignal()                 # Emitted from the VLC init thread
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, vlc_args=None, metadata_cache=None):
+        """
+        Args:
+            vlc_args (list): Extra libvlc arguments, e.g. ['--vout=dummy', '--aout=dummy']
+                             for headless runs
+            metadata_cache (MetadataCache): Cache for probed metadata, defaults
+                                            to the one in the user cache dir
+        """
         super().__init__(parent)
         
-        # Create VLC instance with optimizations
-        vlc_args = [
-            '--no-xlib',  # No Xlib support (faster on Linux)
-            '--no-video-title-show',  # Don't show video title on top of the video
-            '--quiet',  # No console output
-            '--no-stats',  # No statistics
-            '--no-video-on-top',  # Don't force video on top
-        ]
+        # libvlc is loaded and its instance created on a background thread,
+        # so the window can show while VLC scans its plugins
+        self.instance = None
+        self.player = None
+        self.list_player = None
+        self.media_list = None
+        self.event_manager = None
+        self.vlc_init_time = None
+        self._vlc_ready = False
+        self._vlc_error = None
+        self._video_widget = None
+        self._extra_vlc_args = list(vlc_args or [])
+        self._vlc_created.connect(self._finish_vlc_setup, Qt.QueuedConnection)
+        self._vlc_thread = threading.Thread(target=self._create_vlc, name="VlcInit", daemon=True)
+        self._vlc_thread.start()
         
-        self.instance = vlc.Instance(' '.join(vlc_args))
-        self.player = self.instance.media_player_new()
+        # Background metadata probing, backed by the persistent cache
+        self.metadata_cache = metadata_cache if metadata_cache is not None else MetadataCache()
+        self.probe_service = MediaProbeService(None, self.metadata_cache, parent=self)
+        self.probe_service.probe_finished.connect(self._on_probe_finished, Qt.QueuedConnection)
+        self.probe_service.probe_failed.connect(self._on_probe_failed, Qt.QueuedConnection)
+        self._probe_request = None
         
         # Current media info
         self.current_media = None
+        self.current_path = None
+        
+        # Preloaded next item, handed over to when the current one ends
+        self._next_media = None
+        self._next_mrl = None
+        self._next_path = None
+        self._ended_at = None
+        self._skipping = False
+        self._handover_end_pending = False
+        self.last_gap = None
+        
+        # Loads run on a worker thread; only the latest request is carried out
+        self.url_timeout = 15000
+        self.loader = MediaLoader(self._load_media, parent=self)
+        self.loader.loaded.connect(self._on_loaded, Qt.QueuedConnection)
+        self.loader.failed.connect(self._on_load_failed, Qt.QueuedConnection)
+        self._open_generation = None
+        self._open_timer = QTimer(self)
+        self._open_timer.setSingleShot(True)
+        self._open_timer.timeout.connect(self._on_open_timeout)
+        
+        # Trace spans from a load request to the media starting and to its first frame
+        self._load_span = None
+        self._first_frame_span = None
         self._volume = 75  # Default volume
         self._is_muted = False
         self._last_volume = self._volume
         
-        # Setup timer for position updates
-        self.timer = QTimer(self)
-        self.timer.setInterval(200)  # Update every 200ms
-        self.timer.timeout.connect(self.update_position)
+        # Interpolated playback clock anchored on VLC time events
+        self.clock = PlaybackClock()
+        
+        # Position updates are paced to the timeline resolution
+        self.update_scheduler = PositionUpdateScheduler(self)
+        self.update_scheduler.update_due.connect(self.update_position)
+        
+        # Seeks are coalesced to the latest target and paced by VLC
+        self.seek_scheduler = SeekScheduler(parent=self)
+        
+        # VLC events are connected once VLC is ready; handlers run on the Qt thread
+        self._length = 0
+        self.event_bridge = VlcEventBridge(parent=self)
+    
+    # VLC initialization
+    def _create_vlc(self):
+        """Load libvlc and create the instance and players; runs on the init thread."""
+        started = time.perf_counter()
+        try:
+            import vlc
+            
+            # Create VLC instance with optimizations
+            vlc_args = [
+                '--no-xlib',  # No Xlib support (faster on Linux)
+                '--no-video-title-show',  # Don't show video title on top of the video
+                '--quiet',  # No console output
+                '--no-stats',  # No statistics
+                '--no-video-on-top',  # Don't force video on top
+            ] + self._extra_vlc_args
+            
+            instance = vlc.Instance(' '.join(vlc_args))
+            if instance is None:
+                raise Exception("libvlc could not be initialized")
+            player = instance.media_player_new()
+            
+            # The list player hands over to the preloaded next item inside VLC,
+            # without a round trip through the Qt thread
+            list_player = instance.media_list_player_new()
+            list_player.set_media_player(player)
+            media_list = instance.media_list_new()
+            list_player.set_media_list(media_list)
+            
+            self.instance = instance
+            self.player = player
+            self.list_player = list_player
+            self.media_list = media_list
+        except Exception as e:
+            self._vlc_error = str(e)
+        
+        self.vlc_init_time = (time.perf_counter() - started) * 1000
+        self._vlc_created.emit()
+    
+    @pyqtSlot()
+    def _finish_vlc_setup(self):
+        """Connect the freshly created VLC objects on the Qt thread."""
+        if self._vlc_ready:
+            return
+        self._vlc_ready = True
+        
+        if self._vlc_error is not None:
+            error_msg = f"Failed to initialize VLC: {self._vlc_error}"
+            self.error_occurred.emit(error_msg)
+            log.error(error_msg)
+            self.ready.emit()
+            return
         
-        # Connect VLC events
+        self.probe_service.instance = self.instance
+        self.seek_scheduler.set_player(self.player)
         self.event_manager = self.player.event_manager()
         self.setup_vlc_events()
         
-        # Set initial volume
-        self.set_volume(self._volume)
+        if self._video_widget is not None:
+            self.set_video_widget(self._video_widget)
+        
+        # Apply the volume chosen so far
+        self.player.audio_set_volume(0 if self._is_muted else self._volume)
+        self.ready.emit()
+    
+    def _require_vlc(self):
+        """
+        Make sure VLC is initialized, waiting for the init thread if needed.
+        
+        Returns:
+            bool: False if VLC could not be initialized
+        """
+        if not self._vlc_ready:
+            self._vlc_thread.join()
+            self._finish_vlc_setup()
+        return self.player is not None
+    
+    def is_ready(self):
+        """Check if VLC has been initialized."""
+        return self._vlc_ready and self.player is not None
     
     def setup_vlc_events(self):
-        """Connect VLC event callbacks."""
+        """Connect VLC event callbacks through the Qt thread event bridge."""
+        import vlc
+        
         events = [
-            (vlc.EventType.MediaPlayerTimeChanged, self.on_time_changed),
-            (vlc.EventType.MediaPlayerPositionChanged, self.on_position_changed),
-            (vlc.EventType.MediaPlayerLengthChanged, self.on_length_changed),
-            (vlc.EventType.MediaPlayerPlaying, self.on_playing),
-            (vlc.EventType.MediaPlayerPaused, self.on_paused),
-            (vlc.EventType.MediaPlayerStopped, self.on_stopped),
-            (vlc.EventType.MediaPlayerEndReached, self.on_ended),
-            (vlc.EventType.MediaPlayerEncounteredError, self.on_error),
-            (vlc.EventType.MediaPlayerVout, self.on_vout),
+            (vlc.EventType.MediaPlayerTimeChanged, self.on_time_changed,
+             lambda event: event.u.new_time, True),
+            (vlc.EventType.MediaPlayerLengthChanged, self.on_length_changed,
+             lambda event: event.u.new_length, True),
+            (vlc.EventType.MediaPlayerPlaying, self.on_playing,
+             lambda event: time.monotonic(), False),
+            (vlc.EventType.MediaPlayerPaused, self.on_paused, None, False),
+            (vlc.EventType.MediaPlayerStopped, self.on_stopped, None, False),
+            (vlc.EventType.MediaPlayerEndReached, self.on_ended,
+             lambda event: time.monotonic(), False),
+            (vlc.EventType.MediaPlayerEncounteredError, self.on_error, None, False),
         ]
         
-        for event_type, callback in events:
+        for event_type, handler, value, coalesce in events:
             try:
-                self.event_manager.event_attach(event_type, callback)
+                self.event_bridge.attach(self.event_manager, event_type, handler, value, coalesce)
             except Exception as e:
-                print(f"Failed to attach event {event_type}: {e}")
+                log.warning("Failed to attach event %s: %s", event_type, e)
+        
+        try:
+            self.event_bridge.attach(self.list_player.event_manager(),
+                                     vlc.EventType.MediaListPlayerNextItemSet,
+                                     self.on_next_item_set)
+        except Exception as e:
+            log.warning("Failed to attach list player events: %s", e)
     
     def cleanup(self):
         """Clean up resources."""
-        self.timer.stop()
-        self.stop()
+        self.update_scheduler.cancel()
+        self._open_timer.stop()
+        self.loader.shutdown()
+        self.probe_service.shutdown()
+        self._reset_playback()
+        if not self._require_vlc():
+            self.metadata_cache.close()
+            return
+        self.list_player.stop()
+        self.event_bridge.detach_all()
+        self.list_player.release()
+        self.media_list.release()
         self.player.release()
         self.instance.release()
+        self.metadata_cache.close()
     
     def set_video_widget(self, video_widget):
         """
@@ -88,6 +247,11 @@ class MediaPlayer(QObject):
         """
         if video_widget is None:
             return
+        
+        # Applied once VLC is ready
+        self._video_widget = video_widget
+        if not self.is_ready():
+            return
             
         try:
             if hasattr(video_widget, 'winId'):
@@ -97,7 +261,7 @@ class MediaPlayer(QObject):
                 # Linux/Unix with X11
                 self.player.set_xwindow(video_widget.window().winId())
             else:
-                print("Unsupported video widget type")
+                log.warning("Unsupported video widget type")
         except Exception as e:
             self.error_occurred.emit(f"Failed to set video widget: {str(e)}")
     
@@ -105,131 +269,253 @@ class MediaPlayer(QObject):
         """
         Load a media file or URL.
         
+        Loading runs on a worker thread, so this never blocks. Loads made
+        in quick succession collapse into the most recent one and superseded
+        loads are cancelled. current_media_changed is emitted once the media
+        has started; failures and URLs that do not open within url_timeout
+        are reported through error_occurred.
+        
         Args:
             media_path: Path to media file or URL
+        
+        Returns:
+            int: Generation id of the load request, or None
         """
         if not media_path:
+            return None
+        
+        self._reset_playback()
+        self._next_media = self._next_mrl = self._next_path = None
+        self._skipping = self._handover_end_pending = False
+        self._ended_at = None
+        self._open_timer.stop()
+        self.current_media = None
+        self.current_path = media_path
+        
+        tracing.end(self._load_span, cancelled=True)
+        tracing.end(self._first_frame_span, cancelled=True)
+        self._load_span = tracing.begin("load", "player", path=media_path)
+        self._first_frame_span = tracing.begin("first frame", "player", path=media_path)
+        return self.loader.request(media_path)
+    
+    def _load_media(self, media_path, is_current):
+        """
+        Stop the current media and start a new one.
+        
+        Runs on the loader thread. Returns the MRL of the started media, or
+        raises LoadCancelled as soon as a newer request has been made.
+        """
+        # Loads requested during startup wait here for VLC, not on the GUI thread
+        self._vlc_thread.join()
+        if self.player is None:
+            raise Exception(self._vlc_error or "VLC is not available")
+        
+        self.list_player.stop()
+        if media_path is None:
+            return ''
+        if not is_current():
+            raise LoadCancelled()
+        
+        # Convert to file URI if it's a local file
+        mrl = media_path
+        if os.path.exists(media_path):
+            mrl = QUrl.fromLocalFile(media_path).toString()
+        
+        # Create media; metadata is probed in the background
+        media = self.instance.media_new(mrl)
+        
+        # The media list starts over with this media. Gapless handovers
+        # append to it until the next load: VLC's list player tracks the
+        # playing item by index, so removing earlier items while playing
+        # would make it skip or stop at the next handover.
+        self.media_list.lock()
+        try:
+            while self.media_list.count() > 0:
+                self.media_list.remove_index(0)
+            self.media_list.add_media(media)
+        finally:
+            self.media_list.unlock()
+        
+        if not is_current():
+            raise LoadCancelled()
+        if self.list_player.play_item_at_index(0) == -1:
+            raise Exception("Failed to play media")
+        return mrl
+    
+    @pyqtSlot(int, str, str)
+    def _on_loaded(self, generation, media_path, mrl):
+        """Finish a load on the Qt thread once its media has started."""
+        if not self.loader.is_current(generation) or not mrl:
             return
-            
+        self._require_vlc()
+        tracing.end(self._load_span)
+        self._load_span = None
+        
+        self.current_media = mrl
+        
+        # media_changed is emitted once the probe has finished
+        self._probe_request = self.probe_service.request(mrl)
+        self.current_media_changed.emit(media_path)
+        
+        # Remote media may never start; give up after url_timeout
+        if '://' in media_path and not media_path.startswith('file:'):
+            self._open_generation = generation
+            self._open_timer.start(self.url_timeout)
+    
+    @pyqtSlot(int, str, str)
+    def _on_load_failed(self, generation, media_path, message):
+        """Report a failed load."""
+        if not self.loader.is_current(generation):
+            return
+        tracing.end(self._load_span, error=message)
+        tracing.end(self._first_frame_span, error=message)
+        self._load_span = self._first_frame_span = None
+        error_msg = f"Failed to load media: {message}"
+        self.error_occurred.emit(error_msg)
+        log.error(error_msg)
+    
+    def _on_open_timeout(self):
+        """Stop a URL that did not start playing in time."""
+        if not self.loader.is_current(self._open_generation):
+            return
+        
+        url = self.current_path
+        self._reset_playback()
+        self.current_media = None
+        self.loader.request(None)
+        
+        error_msg = f"Timed out opening {url}"
+        self.error_occurred.emit(error_msg)
+        log.error(error_msg)
+    
+    # Gapless playback
+    def set_next(self, media_path):
+        """
+        Preload the media to play when the current one ends.
+        
+        The next media is created and parsed in the background right away,
+        and queued behind the current one so VLC switches to it as soon as
+        the current media ends. Its metadata is probed into the cache too,
+        so media_changed follows the handover without waiting for VLC.
+        
+        Args:
+            media_path: Path or URL of the next media, or None to clear it
+        """
+        if media_path == self._next_path:
+            return
+        self._clear_next()
+        if not media_path or not self.current_media or not self.is_ready():
+            return
+        import vlc
+        
+        mrl = media_path
+        if os.path.exists(media_path):
+            mrl = QUrl.fromLocalFile(media_path).toString()
+        
         try:
-            self.stop()
-            
-            # Convert to file URI if it's a local file
-            if os.path.exists(media_path):
-                media_path = QUrl.fromLocalFile(media_path).toString()
-            
-            # Create and configure media
-            media = self.instance.media_new(media_path)
-            media.parse_with_options(vlc.MediaParseFlag.network, 0)
-            
-            # Set media
-            self.player.set_media(media)
-            self.current_media = media_path
-            
-            # Start playback
-            if self.player.play() == -1:
-                raise Exception("Failed to play media")
-                
-            # Wait a moment for media to start and get metadata
-            QApplication.processEvents()
-            
-            # Get and emit media info
-            media_info = self.get_media_info()
-            self.media_changed.emit(media_info)
-            
-            self.timer.start()
-            
+            media = self.instance.media_new(mrl)
+            media.parse_with_options(vlc.MediaParseFlag.local, 0)  # Asynchronous
+            self.media_list.lock()
+            try:
+                self.media_list.add_media(media)
+            finally:
+                self.media_list.unlock()
         except Exception as e:
-            error_msg = f"Failed to load media: {str(e)}"
-            self.error_occurred.emit(error_msg)
-            print(error_msg)
+            log.warning("Failed to preload %s: %s", media_path, e)
+            return
+        
+        self._next_media = media
+        self._next_mrl = mrl
+        self._next_path = media_path
+        self.probe_service.request(mrl)
+    
+    def _clear_next(self):
+        """Remove a preloaded next media that has not started playing."""
+        if self._next_media is None:
+            return
+        
+        media = self._next_media
+        self._next_media = self._next_mrl = self._next_path = None
+        
+        # Leave it in place if VLC has already switched to it
+        current = self.player.get_media()
+        if current is not None and current.get_mrl() == media.get_mrl():
+            return
+        
+        self.media_list.lock()
+        try:
+            index = self.media_list.index_of_item(media)
+            if index >= 0:
+                self.media_list.remove_index(index)
+        finally:
+            self.media_list.unlock()
+    
+    def has_next(self):
+        """Check if a next media is preloaded."""
+        return self._next_media is not None
+    
+    def next_path(self):
+        """Get the path of the preloaded next media, if any."""
+        return self._next_path
+    
+    def play_next(self):
+        """
+        Switch to the preloaded next media right away.
+        
+        Returns:
+            bool: False if no next media was preloaded
+        """
+        if self._next_media is None:
+            return False
+        self._skipping = True
+        if self.list_player.next() == -1:
+            self._skipping = False
+            return False
+        return True
     
     def get_media_info(self):
-        """Get detailed information about the current media."""
-        if not self.current_media:
+        """
+        Get detailed information about the current media.
+        
+        This probes the media synchronously (or reads it from the metadata
+        cache); load() probes in the background and reports the result
+        through media_changed instead.
+        """
+        if not self.current_media or not self.is_ready():
             return {}
             
-        media = self.player.get_media()
-        if not media:
+        if not self.player.get_media():
             return {}
             
-        # Get basic file info
-        file_path = self.current_media
-        if file_path.startswith('file://'):
-            file_path = QUrl(file_path).toLocalFile()
-            
-        file_size = 0
-        if os.path.exists(file_path):
-            file_size = os.path.getsize(file_path)
-            
-        # Get media tracks info
-        media.parse()
-        tracks = media.tracks_get()
-        
-        video_track = None
-        audio_track = None
-        
-        for track in tracks:
-            if track.contents.i_codec == vlc.FourCC('h264') or track.contents.i_codec == vlc.FourCC('avc1'):
-                video_track = track
-            elif track.contents.i_codec in [vlc.FourCC('mp4a'), vlc.FourCC('aac ')]:
-                audio_track = track
-        
-        # Format file size
-        def format_size(size):
-            for unit in ['B', 'KB', 'MB', 'GB']:
-                if size < 1024.0:
-                    return f"{size:.2f} {unit}"
-                size /= 1024.0
-            return f"{size:.2f} TB"
-            
-        # Get resolution if video track exists
-        resolution = "-"
-        fps = "-"
-        if video_track:
-            width = video_track.contents.u.video.i_width
-            height = video_track.contents.u.video.i_height
-            resolution = f"{width}×{height}"
-            fps_num = video_track.contents.u.video.i_frame_rate_num
-            fps_den = video_track.contents.u.video.i_frame_rate_den
-            if fps_den > 0:
-                fps = f"{fps_num / fps_den:.2f}"
-        
-        # Get audio info if audio track exists
-        audio_info = "-"
-        if audio_track:
-            channels = audio_track.contents.audio.i_channels
-            rate = audio_track.contents.audio.i_rate // 1000  # Convert to kHz
-            audio_info = f"{channels} channels, {rate} kHz"
-        
-        # Get codec info
-        video_codec = "-"
-        if video_track:
-            codec_name = vlc.fourcc_get_string(video_track.contents.i_codec) or "Unknown"
-            video_codec = f"{codec_name} ({video_track.contents.i_codec:08x})"
-        
-        info = {
-            'file': os.path.basename(file_path),
-            'path': file_path,
-            'size': format_size(file_size) if file_size > 0 else "-",
-            'duration': self.player.get_length(),
-            'format': media.get_mrl().split('.')[-1].upper() if '.' in media.get_mrl() else "-",
-            'resolution': resolution,
-            'fps': fps,
-            'video_codec': video_codec,
-            'audio': audio_info,
-            'bitrate': f"{media.get_mrl()}",  # This is a placeholder, VLC doesn't expose bitrate directly
-            'title': media.get_meta(vlc.Meta.Title) or os.path.basename(file_path),
-            'artist': media.get_meta(vlc.Meta.Artist) or 'Unknown',
-            'album': media.get_meta(vlc.Meta.Album) or 'Unknown',
-            'genre': media.get_meta(vlc.Meta.Genre) or 'Unknown',
-        }
-        
+        info = probe_media(self.instance, self.current_media, self.metadata_cache)
+        duration = self.player.get_length()
+        if duration > 0:
+            info['duration'] = duration
         return info
     
+    @pyqtSlot(int, dict)
+    def _on_probe_finished(self, request_id, info):
+        """Emit media_changed for the probe of the current media."""
+        if request_id != self._probe_request:
+            return  # Result for media that is no longer current
+        self._probe_request = None
+        
+        duration = self.player.get_length()
+        if duration > 0:
+            info['duration'] = duration
+        self.media_changed.emit(info)
+    
+    @pyqtSlot(int, str)
+    def _on_probe_failed(self, request_id, message):
+        """Report a failed probe of the current media."""
+        if request_id != self._probe_request:
+            return
+        self._probe_request = None
+        log.warning("Failed to read media info: %s", message)
+    
     def play_pause(self):
         """Toggle between play and pause."""
-        if not self.player.get_media():
+        if not self.is_ready() or not self.player.get_media():
             return
             
         if self.player.is_playing():
@@ -239,52 +525,83 @@ class MediaPlayer(QObject):
     
     def play(self):
         """Start or resume playback."""
-        if not self.player.get_media():
+        if not self.is_ready() or not self.player.get_media():
             return
             
         if self.player.play() == -1:
             self.error_occurred.emit("Failed to start playback")
-            return
-            
-        self.timer.start()
     
     def pause(self):
         """Pause playback."""
-        self.player.pause()
+        if self.is_ready():
+            self.player.pause()
     
     def stop(self):
-        """Stop playback and reset position."""
-        self.player.stop()
-        self.timer.stop()
+        """Stop playback and reset position; pending loads are cancelled."""
+        self._open_timer.stop()
+        self._reset_playback()
+        self.loader.request(None)
+    
+    def _reset_playback(self):
+        """Reset the playback state kept on the Qt thread."""
+        self._probe_request = None
+        self.probe_service.cancel_pending()
+        self.seek_scheduler.cancel()
+        self.update_scheduler.cancel()
+        self.clock.pause()
+        self.clock.reset(0)
+        self._length = 0
         self.position_changed.emit(0, 0)
     
-    def seek(self, position):
+    def seek(self, position, exact=True):
         """
         Seek to a specific position in the media.
         
+        Seeks are coalesced: while VLC is still busy with a seek, only the
+        latest requested position is kept and issued once it is done.
+        
         Args:
             position (int): Position in milliseconds
+            exact (bool): Seek precisely; pass False for fast seeks while
+                          scrubbing and finish with an exact seek
         """
-        if not self.player.get_media():
+        if not self.is_ready() or not self.player.get_media():
             return
             
-        duration = self.player.get_length()
+        duration = self._length or self.player.get_length()
         if duration <= 0:
             return
             
         # Ensure position is within bounds
         position = max(0, min(position, duration))
-        self.player.set_time(position)
+        self.seek_scheduler.request(position, exact)
+        
+        # Reflect the new position right away, even while paused
+        self.clock.reset(position)
+        self.update_scheduler.notify(force=True)
     
-    def seek_relative(self, offset_ms):
+    def seek_relative(self, offset_ms, exact=True):
         """Seek relative to current position."""
-        if not self.player.get_media():
+        if not self.is_ready() or not self.player.get_media():
             return
             
-        current = self.player.get_time()
-        duration = self.player.get_length()
+        current = self.clock.now()
+        duration = self._length or self.player.get_length()
         new_pos = max(0, min(current + offset_ms, duration))
-        self.seek(new_pos)
+        self.seek(new_pos, exact)
+    
+    def set_rate(self, rate):
+        """
+        Set the playback rate.
+        
+        Args:
+            rate (float): Playback rate, 1.0 is normal speed
+        """
+        if not self.is_ready() or self.player.set_rate(rate) == -1:
+            self.error_occurred.emit("Failed to change playback rate")
+            return
+        self.clock.set_rate(rate)
+        self.update_scheduler.set_rate(rate)
     
     # Volume control methods
     def set_volume(self, volume):
@@ -298,7 +615,8 @@ class MediaPlayer(QObject):
         self._volume = volume
         
         if not self._is_muted:
-            self.player.audio_set_volume(volume)
+            if self.is_ready():
+                self.player.audio_set_volume(volume)
             self.volume_changed.emit(volume)
     
     def get_volume(self):
@@ -309,10 +627,12 @@ class MediaPlayer(QObject):
         """Mute or unmute the audio."""
         if mute and not self._is_muted:
             self._last_volume = self._volume
-            self.player.audio_set_volume(0)
+            if self.is_ready():
+                self.player.audio_set_volume(0)
             self._is_muted = True
         elif not mute and self._is_muted:
-            self.player.audio_set_volume(self._last_volume)
+            if self.is_ready():
+                self.player.audio_set_volume(self._last_volume)
             self._volume = self._last_volume
             self._is_muted = False
             self.volume_changed.emit(self._volume)
@@ -321,78 +641,150 @@ class MediaPlayer(QObject):
         """Toggle mute state."""
         self.mute(not self._is_muted)
     
+    # Position update scheduling
+    def set_timeline_width(self, pixels):
+        """Set the width of the timeline so updates match its resolution."""
+        self.update_scheduler.set_resolution(pixels)
+    
+    def watch_window(self, window):
+        """Suspend position updates while the given QWindow is not visible."""
+        self.update_scheduler.watch_window(window)
+    
     # Playback information
     def get_time(self):
-        """Get current position in milliseconds."""
-        return self.player.get_time()
+        """
+        Get current position in milliseconds.
+        
+        This reads the interpolated playback clock and never calls into
+        libvlc, so it is cheap enough to call at display refresh rate.
+        """
+        return self.clock.now()
+    
+    def get_seek_stats(self):
+        """Get seek coalescing and seek-to-frame latency statistics."""
+        return self.seek_scheduler.stats()
+    
+    def get_clock_drift(self):
+        """Get drift statistics of the playback clock against VLC time."""
+        return self.clock.drift_stats()
     
     def get_duration(self):
         """Get total duration in milliseconds."""
+        if not self.is_ready():
+            return 0
         return self.player.get_length()
     
     def is_playing(self):
         """Check if media is currently playing."""
-        return self.player.is_playing()
+        return self.is_ready() and bool(self.player.is_playing())
     
     # Timer callback
     def update_position(self):
         """Update position and duration through signals."""
-        if not self.player.get_media():
+        if not self.current_media:
             return
             
-        position = self.player.get_time()
-        duration = self.player.get_length()
+        position = self.clock.now()
+        duration = self._length
         
         if position < 0 or duration <= 0:
             return
             
         self.position_changed.emit(position, duration)
     
-    # VLC event handlers
-    def on_time_changed(self, event):
+    # VLC event handlers, called on the Qt thread by the event bridge
+    def on_time_changed(self, new_time):
         """Handle time change event from VLC."""
-        QApplication.processEvents()
+        if self._first_frame_span is not None:
+            tracing.end(self._first_frame_span, time=new_time)
+            self._first_frame_span = None
+        self.seek_scheduler.on_time_reported(new_time)
+        if self.seek_scheduler.is_seeking():
+            return  # The clock already shows the newer seek target
+        self.clock.anchor(new_time)
+        self.update_scheduler.notify()
     
-    def on_position_changed(self, event):
-        """Handle position change event from VLC."""
-        pass
-    
-    def on_length_changed(self, event):
+    def on_length_changed(self, new_length):
         """Handle duration change event from VLC."""
-        duration = self.player.get_length()
-        if duration > 0:
-            self.duration_changed.emit(duration)
+        self._length = new_length
+        if new_length > 0:
+            self.clock.set_duration(new_length)
+            self.update_scheduler.set_duration(new_length)
+            self.seek_scheduler.set_duration(new_length)
+            self.duration_changed.emit(new_length)
     
-    def on_playing(self, event):
+    def on_next_item_set(self, _):
+        """Handle VLC switching to the next item of the media list."""
+        media = self.player.get_media()
+        if self._next_media is None or media is None or media.get_mrl() != self._next_mrl:
+            return  # The first item set by load()
+        
+        # Handover to the preloaded media. VLC may report the end of the
+        # previous item before or after this; only a natural end reports it.
+        self._handover_end_pending = not self._skipping and self._ended_at is None
+        self._skipping = False
+        self.current_media = self._next_mrl
+        self.current_path = self._next_path
+        self._next_media = self._next_mrl = self._next_path = None
+        
+        self.clock.pause()
+        self.clock.reset(0)
+        self._length = 0
+        self._probe_request = self.probe_service.request(self.current_media)
+        self.current_media_changed.emit(self.current_path)
+    
+    def on_playing(self, timestamp):
         """Handle playback started event."""
+        self._open_timer.stop()
         self.state_changed.emit(True)
         
+        # Time between the end of the previous item and the start of this one
+        if self._ended_at is not None:
+            self.last_gap = (timestamp - self._ended_at) * 1000
+            self._ended_at = None
+        
         # Emit duration when playback starts
         duration = self.player.get_length()
         if duration > 0:
+            self._length = duration
+            self.clock.set_duration(duration)
+            self.update_scheduler.set_duration(duration)
+            self.seek_scheduler.set_duration(duration)
             self.duration_changed.emit(duration)
+        
+        self.clock.start()
+        self.update_scheduler.set_running(True)
     
-    def on_paused(self, event):
+    def on_paused(self, _):
         """Handle playback paused event."""
+        self.clock.pause()
+        self.update_scheduler.set_running(False)
+        self.update_scheduler.notify(force=True)
         self.state_changed.emit(False)
     
-    def on_stopped(self, event):
+    def on_stopped(self, _):
         """Handle playback stopped event."""
-        self.timer.stop()
+        self.clock.pause()
+        self.update_scheduler.cancel()
         self.state_changed.emit(False)
     
-    def on_ended(self, event):
+    def on_ended(self, timestamp):
         """Handle playback finished event."""
-        self.timer.stop()
+        self.clock.pause()
+        self.update_scheduler.cancel()
+        
+        # VLC is already switching to the preloaded next media
+        if self._next_media is not None or self._handover_end_pending:
+            self._handover_end_pending = False
+            self._ended_at = timestamp
+            return
+        
         self.state_changed.emit(False)
         self.playback_finished.emit()
     
-    def on_error(self, event):
+    def on_error(self, _):
         """Handle playback error event."""
+        self._open_timer.stop()
         error_msg = "An error occurred during playback"
         self.error_occurred.emit(error_msg)
-        print(f"VLC Error: {error_msg}")
-    
-    def on_vout(self, event):
-        """Handle video output event."""
-        pass
+        log.error("VLC error: %s", error_msg)
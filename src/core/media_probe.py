@@ -0,0 +1,284 @@
+import os
+import itertools
+import threading
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, QUrl, pyqtSignal
+
+from src.core.audio_tags import read_audio_info
+from src.core.container_probe import read_container_info
+from src.utils.file_utils import get_file_info, format_size
+from src.utils import tracing
+
+
+def fourcc_to_string(fourcc):
+    """Convert a VLC codec fourcc to its four character string."""
+    return fourcc.to_bytes(4, 'little').decode('ascii', 'replace').strip()
+
+
+def describe_tracks(media):
+    """
+    Describe the elementary streams of a parsed VLC media.
+    
+    Args:
+        media: Parsed vlc.Media instance
+    
+    Returns:
+        list: One dict per track with its type, codec and stream details
+    """
+    import vlc
+    
+    tracks = []
+    for track in media.tracks_get() or []:
+        entry = {
+            'id': track.id,
+            'codec': fourcc_to_string(track.codec),
+            'fourcc': track.codec,
+            'bitrate': track.bitrate,
+            'language': (track.language or b'').decode('utf-8', 'replace'),
+        }
+        
+        if track.type == vlc.TrackType.video and track.video:
+            video = track.video.contents
+            entry['type'] = 'video'
+            entry['width'] = video.width
+            entry['height'] = video.height
+            entry['fps'] = video.frame_rate_num / video.frame_rate_den if video.frame_rate_den else 0.0
+        elif track.type == vlc.TrackType.audio and track.audio:
+            audio = track.audio.contents
+            entry['type'] = 'audio'
+            entry['channels'] = audio.channels
+            entry['rate'] = audio.rate
+        elif track.type == vlc.TrackType.ext:
+            entry['type'] = 'subtitle'
+        else:
+            entry['type'] = 'unknown'
+        
+        tracks.append(entry)
+    return tracks
+
+
+def build_media_info(media, file_path, duration):
+    """
+    Build the media information dict for a parsed VLC media.
+    
+    Args:
+        media: Parsed vlc.Media instance
+        file_path (str): Local path or URL of the media
+        duration (int): Duration in milliseconds
+    
+    Returns:
+        dict: Media information as shown in the info panel
+    """
+    import vlc
+    
+    file_size = 0
+    if os.path.exists(file_path):
+        file_size = os.path.getsize(file_path)
+    
+    tracks = describe_tracks(media)
+    
+    video_track = next((t for t in tracks if t['type'] == 'video'), None)
+    audio_track = next((t for t in tracks if t['type'] == 'audio'), None)
+    
+    # Get resolution if video track exists
+    resolution = "-"
+    fps = "-"
+    video_codec = "-"
+    if video_track:
+        resolution = f"{video_track['width']}×{video_track['height']}"
+        if video_track['fps'] > 0:
+            fps = f"{video_track['fps']:.2f}"
+        video_codec = f"{video_track['codec'] or 'Unknown'} ({video_track['fourcc']:08x})"
+    
+    # Get audio info if audio track exists
+    audio_info = "-"
+    if audio_track:
+        channels = audio_track['channels']
+        rate = audio_track['rate'] // 1000  # Convert to kHz
+        audio_info = f"{channels} channels, {rate} kHz"
+    
+    mrl = media.get_mrl()
+    
+    # VLC only knows stream bitrates of some codecs; fall back to the average
+    bitrate = sum(t['bitrate'] for t in tracks)
+    if bitrate > 0:
+        bitrate_info = f"{bitrate // 1000} kbps"
+    elif file_size > 0 and duration > 0:
+        bitrate_info = f"{file_size * 8 // duration} kbps"
+    else:
+        bitrate_info = "-"
+    
+    return {
+        'file': os.path.basename(file_path),
+        'path': file_path,
+        'size': format_size(file_size) if file_size > 0 else "-",
+        'duration': duration,
+        'format': mrl.split('.')[-1].upper() if '.' in mrl else "-",
+        'resolution': resolution,
+        'fps': fps,
+        'video_codec': video_codec,
+        'audio': audio_info,
+        'bitrate': bitrate_info,
+        'title': media.get_meta(vlc.Meta.Title) or os.path.basename(file_path),
+        'artist': media.get_meta(vlc.Meta.Artist) or 'Unknown',
+        'album': media.get_meta(vlc.Meta.Album) or 'Unknown',
+        'genre': media.get_meta(vlc.Meta.Genre) or 'Unknown',
+        'tracks': tracks,
+    }
+
+
+def parse_media(media, timeout=None):
+    """
+    Parse a VLC media, blocking until VLC is done with it.
+    
+    Args:
+        media: vlc.Media to parse
+        timeout (int): Milliseconds before VLC gives up, or None for no limit
+    
+    Raises:
+        TimeoutError: If parsing did not finish within the timeout
+        Exception: If VLC failed to parse the media
+    """
+    if timeout is None:
+        media.parse()
+        return
+    import vlc
+    
+    # parse_with_options is asynchronous and reports through MediaParsedChanged
+    done = threading.Event()
+    events = media.event_manager()
+    events.event_attach(vlc.EventType.MediaParsedChanged, lambda event: done.set())
+    try:
+        remote = '://' in media.get_mrl() and not media.get_mrl().startswith('file:')
+        flag = vlc.MediaParseFlag.network if remote else vlc.MediaParseFlag.local
+        if media.parse_with_options(flag, timeout) == -1:
+            raise Exception("VLC could not start parsing")
+        # VLC enforces the timeout itself; the margin covers a stuck parser
+        done.wait(timeout / 1000 + 1)
+    finally:
+        events.event_detach(vlc.EventType.MediaParsedChanged)
+    
+    status = media.get_parsed_status()
+    if status == vlc.MediaParsedStatus.timeout or not done.is_set():
+        raise TimeoutError(f"Parsing timed out after {timeout} ms")
+    if status == vlc.MediaParsedStatus.failed:
+        raise Exception("VLC failed to parse the media")
+
+
+def probe_media(instance, media_path, cache=None, timeout=None):
+    """
+    Parse a media file or URL and return its information dict.
+    
+    This blocks until VLC has finished parsing, so it must not be called
+    on the GUI thread. Local files are looked up in the metadata cache
+    first and VLC is skipped entirely on a hit. Audio files whose tags
+    mutagen can read and MP4/Matroska files whose headers can be read
+    skip VLC as well.
+    
+    Args:
+        instance: vlc.Instance used to create the media, may be None for
+                  media that do not need VLC
+        media_path (str): Local path, file URI or URL of the media
+        cache: Optional MetadataCache for local files
+        timeout (int): Milliseconds before parsing is given up, or None for no limit
+    
+    Returns:
+        dict: Media information (see build_media_info)
+    """
+    file_path = media_path
+    if file_path.startswith('file://'):
+        file_path = QUrl(file_path).toLocalFile()
+    
+    file_info = None
+    if cache is not None:
+        file_info = get_file_info(file_path)
+        if file_info is not None:
+            info = cache.get(file_path, file_info)
+            if info is not None:
+                return info
+    
+    # Audio tags and MP4/Matroska headers are read without VLC where possible
+    with tracing.span("read headers", "probe", path=file_path):
+        info = read_audio_info(file_path) or read_container_info(file_path)
+    if info is None:
+        if instance is None:
+            raise Exception("VLC is not available")
+        
+        mrl = media_path
+        if os.path.exists(file_path):
+            mrl = QUrl.fromLocalFile(file_path).toString()
+        
+        media = instance.media_new(mrl)
+        try:
+            with tracing.span("parse", "probe", path=media_path):
+                parse_media(media, timeout)
+            info = build_media_info(media, file_path, max(0, media.get_duration()))
+        finally:
+            media.release()
+    
+    if cache is not None and file_info is not None:
+        cache.put(file_path, info, file_info)
+    return info
+
+
+class _ProbeTask(QRunnable):
+    """Runnable that probes a single media on a pool thread."""
+    
+    def __init__(self, service, request_id, media_path):
+        super().__init__()
+        self.service = service
+        self.request_id = request_id
+        self.media_path = media_path
+    
+    def run(self):
+        try:
+            info = probe_media(self.service.instance, self.media_path, self.service.cache)
+        except Exception as e:
+            self.service.probe_failed.emit(self.request_id, str(e))
+            return
+        self.service.probe_finished.emit(self.request_id, info)
+
+
+class MediaProbeService(QObject):
+    """
+    Background media probing on a small worker thread pool.
+    
+    Results are delivered through signals emitted from the worker threads,
+    so receivers living on the GUI thread get them as queued calls. When a
+    MetadataCache is given, unchanged local files are served from it.
+    """
+    
+    # Signals
+    probe_finished = pyqtSignal(int, dict)     # request_id, media information dict
+    probe_failed = pyqtSignal(int, str)        # request_id, error_message
+    
+    def __init__(self, instance, cache=None, max_threads=2, parent=None):
+        super().__init__(parent)
+        self.instance = instance
+        self.cache = cache
+        self._ids = itertools.count(1)
+        
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max_threads)
+    
+    def request(self, media_path):
+        """
+        Queue a media for probing.
+        
+        Args:
+            media_path (str): Local path, file URI or URL of the media
+        
+        Returns:
+            int: Request id passed back with the result signals
+        """
+        request_id = next(self._ids)
+        self.pool.start(_ProbeTask(self, request_id, media_path))
+        return request_id
+    
+    def cancel_pending(self):
+        """Drop queued probes that have not started yet."""
+        self.pool.clear()
+    
+    def shutdown(self, timeout=2000):
+        """Drop queued probes and wait for running ones to finish."""
+        self.pool.clear()
+        self.pool.waitForDone(timeout)
@@ -0,0 +1,201 @@
+import os
+import json
+import time
+import sqlite3
+import threading
+
+from src.utils.file_utils import get_cache_dir, get_file_info
+
+
+class MetadataCache:
+    """
+    Persistent SQLite cache of media information dicts.
+    
+    Entries are keyed by path and are only returned while the file's size
+    and modification time still match the values stored with them. The
+    least recently used entries are evicted once the cache grows past
+    max_entries. The cache is safe to use from several threads.
+    
+    Hits only note their access time in memory; the times are written in
+    one go with the next put, before evicting, on flush or close, or once
+    MAX_TOUCHED have piled up, so lookups never commit a transaction.
+    """
+    
+    MAX_TOUCHED = 1000      # Access times kept in memory before they are written
+    
+    def __init__(self, db_path=None, max_entries=200000):
+        """
+        Open (or create) the cache database.
+        
+        Args:
+            db_path (str): Path to the SQLite file, defaults to the user cache dir
+            max_entries (int): Number of entries kept before evicting
+        """
+        if db_path is None:
+            db_path = os.path.join(get_cache_dir(), "metadata.db")
+        
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._puts_since_evict = 0
+        self._touched = {}      # Path to access time not written yet
+        
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS media_info (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime REAL NOT NULL,
+                info TEXT NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS media_info_last_access ON media_info (last_access)")
+        self._conn.commit()
+    
+    def get(self, file_path, file_info=None):
+        """
+        Look up the cached information for a file.
+        
+        Args:
+            file_path (str): Local path of the media file
+            file_info (dict): Result of get_file_info, looked up if omitted
+        
+        Returns:
+            dict: Cached media information, or None on a miss
+        """
+        if file_info is None:
+            file_info = get_file_info(file_path)
+        
+        if file_info is None:
+            with self._lock:
+                self.misses += 1
+            return None
+        
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT size, mtime, info FROM media_info WHERE path = ?",
+                (file_path,)).fetchone()
+            
+            if row is None or row[0] != file_info['size'] or row[1] != file_info['modified']:
+                self.misses += 1
+                return None
+            
+            self.hits += 1
+            self._touched[file_path] = time.time()
+            if len(self._touched) >= self.MAX_TOUCHED:
+                self._write_touched()
+                self._conn.commit()
+        
+        return json.loads(row[2])
+    
+    def put(self, file_path, info, file_info=None):
+        """
+        Store the information for a file.
+        
+        Args:
+            file_path (str): Local path of the media file
+            info (dict): Media information dict
+            file_info (dict): Result of get_file_info, looked up if omitted
+        """
+        if file_info is None:
+            file_info = get_file_info(file_path)
+        
+        if file_info is None:
+            return
+        
+        with self._lock:
+            self._touched.pop(file_path, None)
+            self._write_touched()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO media_info (path, size, mtime, info, last_access) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (file_path, file_info['size'], file_info['modified'],
+                 json.dumps(info), time.time()))
+            self._conn.commit()
+            
+            self._puts_since_evict += 1
+            if self._puts_since_evict >= 1000:
+                self._evict()
+    
+    def _write_touched(self):
+        """Write the pending access times; the caller commits."""
+        if self._touched:
+            self._conn.executemany(
+                "UPDATE media_info SET last_access = ? WHERE path = ?",
+                ((accessed, path) for path, accessed in self._touched.items()))
+            self._touched.clear()
+    
+    def flush(self):
+        """Write the access times of recent hits now."""
+        with self._lock:
+            self._write_touched()
+            self._conn.commit()
+    
+    def _evict(self):
+        """Drop the least recently used entries beyond max_entries."""
+        self._puts_since_evict = 0
+        self._write_touched()
+        self._conn.commit()
+        count = self._conn.execute("SELECT COUNT(*) FROM media_info").fetchone()[0]
+        excess = count - self.max_entries
+        if excess <= 0:
+            return
+        
+        self._conn.execute(
+            "DELETE FROM media_info WHERE path IN "
+            "(SELECT path FROM media_info ORDER BY last_access LIMIT ?)",
+            (excess,))
+        self._conn.commit()
+        self.evictions += excess
+    
+    def evict(self):
+        """Enforce the max_entries limit now."""
+        with self._lock:
+            self._evict()
+    
+    def remove(self, file_path):
+        """Remove the entry for a file."""
+        with self._lock:
+            self._touched.pop(file_path, None)
+            self._conn.execute("DELETE FROM media_info WHERE path = ?", (file_path,))
+            self._conn.commit()
+    
+    def clear(self):
+        """Remove all entries and reset the counters."""
+        with self._lock:
+            self._touched.clear()
+            self._conn.execute("DELETE FROM media_info")
+            self._conn.commit()
+            self.hits = self.misses = self.evictions = 0
+    
+    def stats(self):
+        """
+        Get cache statistics.
+        
+        Returns:
+            dict: Entry count, hits, misses, evictions and hit rate
+        """
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM media_info").fetchone()[0]
+            lookups = self.hits + self.misses
+            return {
+                'entries': entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
+    
+    def close(self):
+        """Write the pending access times and close the database connection."""
+        with self._lock:
+            self._write_touched()
+            self._conn.commit()
+            self._conn.close()
@@ -0,0 +1,129 @@
+import time
+
+
+class PlaybackClock:
+    """
+    Interpolated, high resolution media clock.
+    
+    VLC only reports the playback time in coarse steps. The clock is
+    anchored on those reports and extrapolated with the monotonic system
+    clock and the playback rate in between, so now() is smooth and never
+    needs a libvlc call. Small differences between the extrapolated time
+    and VLC's reports are tolerated instead of re-anchoring, which would
+    make the time jump back and forth; they are recorded as drift.
+    """
+    
+    def __init__(self, tolerance=40):
+        """
+        Args:
+            tolerance (int): Drift in milliseconds tolerated before re-anchoring
+        """
+        self.tolerance = tolerance
+        self._rate = 1.0
+        self._duration = 0
+        self._running = False
+        self._anchor_time = 0
+        self._anchor_wall = time.monotonic()
+        self._last_now = 0
+        self.reset_drift()
+    
+    def _extrapolate(self):
+        if not self._running:
+            return self._anchor_time
+        elapsed = (time.monotonic() - self._anchor_wall) * 1000 * self._rate
+        position = self._anchor_time + elapsed
+        if self._duration > 0:
+            position = min(position, self._duration)
+        return position
+    
+    def _set_anchor(self, media_time):
+        self._anchor_time = media_time
+        self._anchor_wall = time.monotonic()
+    
+    def now(self):
+        """
+        Get the current media time in milliseconds.
+        
+        The value never decreases except after reset().
+        """
+        position = max(self._extrapolate(), self._last_now)
+        self._last_now = position
+        return int(position)
+    
+    def anchor(self, media_time):
+        """
+        Synchronize with a time reported by VLC.
+        
+        Args:
+            media_time (int): Media time in milliseconds
+        """
+        drift = self._extrapolate() - media_time
+        if self._running:
+            self._record_drift(drift)
+        if not self._running or abs(drift) > self.tolerance:
+            self._set_anchor(media_time)
+            if media_time < self._last_now and abs(drift) > self.tolerance:
+                # Large backward corrections are real, e.g. seeks done by VLC
+                self._last_now = media_time
+    
+    def start(self):
+        """Start extrapolating from the current anchor."""
+        if not self._running:
+            self._set_anchor(self._anchor_time)
+            self._running = True
+    
+    def pause(self):
+        """Freeze the clock at its current time."""
+        if self._running:
+            self._set_anchor(self.now())
+            self._running = False
+    
+    def reset(self, media_time=0):
+        """Jump to a media time, e.g. after a seek or stop."""
+        self._set_anchor(media_time)
+        self._last_now = media_time
+    
+    def set_rate(self, rate):
+        """Set the playback rate used for extrapolation."""
+        self._set_anchor(self.now())
+        self._rate = rate
+    
+    def set_duration(self, duration):
+        """Set the media duration the clock is clamped to."""
+        self._duration = max(0, duration)
+    
+    def is_running(self):
+        """Check if the clock is advancing."""
+        return self._running
+    
+    # Diagnostics
+    def _record_drift(self, drift):
+        self._drift_last = drift
+        self._drift_samples += 1
+        self._drift_abs_total += abs(drift)
+        self._drift_max = max(self._drift_max, abs(drift))
+    
+    def reset_drift(self):
+        """Reset the drift statistics."""
+        self._drift_last = 0.0
+        self._drift_samples = 0
+        self._drift_abs_total = 0.0
+        self._drift_max = 0.0
+    
+    def drift_stats(self):
+        """
+        Get the drift of the interpolated clock against VLC time.
+        
+        Positive values mean the clock ran ahead of VLC.
+        
+        Returns:
+            dict: Last, mean absolute and maximum absolute drift in
+                  milliseconds, and the number of samples
+        """
+        samples = self._drift_samples
+        return {
+            'last': round(self._drift_last, 1),
+            'mean_abs': round(self._drift_abs_total / samples, 1) if samples else 0.0,
+            'max_abs': round(self._drift_max, 1),
+            'samples': samples,
+        }
@@ -0,0 +1,197 @@
+import time
+import inspect
+from PyQt5.QtCore import QObject, QTimer
+
+from src.utils import tracing
+
+
+class SeekScheduler(QObject):
+    """
+    Coalesces seek requests so VLC only ever works on one seek at a time.
+    
+    Only the latest requested target is kept. A seek is issued right away
+    when none is in flight; otherwise the target waits until VLC reports
+    the time of the seek in flight, which paces seeking to how fast the
+    demuxer and decoder can actually reposition. Targets requested while
+    waiting simply replace each other.
+    
+    Seeks made while scrubbing use set_position, as a fast keyframe seek
+    where libvlc supports one; exact seeks use set_time. The latency from
+    issuing a seek to VLC reporting the new time is kept in the stats.
+    
+    A seek counts as done once VLC reports a time near its target; times
+    reported in between are from before the seek, e.g. still queued in the
+    event bridge when the seek was issued.
+    """
+    
+    MIN_INTERVAL = 1000 // 30   # Minimum milliseconds between two seeks
+    SEEK_TIMEOUT = 500          # Milliseconds before a seek is no longer waited for
+    EXACT_TOLERANCE = 300       # Milliseconds an exact seek may land off its target
+    FAST_TOLERANCE = 2000       # Same for fast seeks, which land on a keyframe
+    
+    def __init__(self, player=None, parent=None):
+        """
+        Args:
+            player: vlc.MediaPlayer to seek, may be set later with set_player
+        """
+        super().__init__(parent)
+        self.player = None
+        self._fast_position = False
+        self._pending = None        # (target, exact)
+        self._in_flight = None      # (target, exact, issued at)
+        self._span = None           # Trace span of the seek in flight
+        self._last_issue = 0.0
+        self._duration = 0
+        if player is not None:
+            self.set_player(player)
+        
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._on_timer)
+        self.reset_stats()
+    
+    def set_player(self, player):
+        """Set the vlc.MediaPlayer to seek."""
+        self.player = player
+        
+        # libvlc 4 takes a fast flag on set_position, libvlc 3 is always precise
+        try:
+            self._fast_position = len(inspect.signature(player.set_position).parameters) > 1
+        except (TypeError, ValueError):
+            self._fast_position = False
+    
+    def set_duration(self, duration):
+        """Set the media duration used to convert targets to positions."""
+        self._duration = max(0, duration)
+    
+    def request(self, target, exact=True):
+        """
+        Seek to a media time, superseding any pending target.
+        
+        Args:
+            target (int): Target time in milliseconds
+            exact (bool): Seek precisely; False for fast seeks while scrubbing
+        """
+        if self._pending is not None:
+            self._coalesced += 1
+        self._pending = (target, exact)
+        self._schedule()
+    
+    def cancel(self):
+        """Drop the pending target and stop waiting for the seek in flight."""
+        self._pending = None
+        self._in_flight = None
+        self._timer.stop()
+        tracing.end(self._span, cancelled=True)
+        self._span = None
+    
+    def is_seeking(self):
+        """Check if a seek is in flight or waiting."""
+        return self._pending is not None or self._in_flight is not None
+    
+    def on_time_reported(self, media_time):
+        """
+        Handle a time reported by VLC.
+        
+        The first report near the target of the seek in flight marks it as
+        done. Other reports are ignored; if none comes near, the seek is
+        given up after SEEK_TIMEOUT.
+        """
+        if self._in_flight is None:
+            return
+        target, exact, issued_at = self._in_flight
+        tolerance = self.EXACT_TOLERANCE if exact else self.FAST_TOLERANCE
+        if abs(media_time - target) > tolerance:
+            return
+        self._in_flight = None
+        tracing.end(self._span, time=media_time)
+        self._span = None
+        self._record_latency((time.monotonic() - issued_at) * 1000)
+        self._schedule()
+    
+    # Scheduling
+    def _schedule(self):
+        now = time.monotonic()
+        if self._in_flight is not None:
+            waited = (now - self._in_flight[2]) * 1000
+            if waited < self.SEEK_TIMEOUT:
+                self._timer.start(int(self.SEEK_TIMEOUT - waited) + 1)
+                return
+            # VLC never reported the target, e.g. while paused on some inputs
+            self._in_flight = None
+            self._timeouts += 1
+            tracing.end(self._span, timed_out=True)
+            self._span = None
+        
+        if self._pending is None or self.player is None:
+            return
+        
+        since_last = (now - self._last_issue) * 1000
+        if since_last < self.MIN_INTERVAL:
+            self._timer.start(int(self.MIN_INTERVAL - since_last) + 1)
+            return
+        
+        self._timer.stop()
+        self._issue()
+    
+    def _on_timer(self):
+        self._schedule()
+    
+    def _issue(self):
+        target, exact = self._pending
+        self._pending = None
+        self._span = tracing.begin("seek", "player", target=target, exact=exact)
+        
+        if not exact and self._duration > 0:
+            position = target / self._duration
+            if self._fast_position:
+                self.player.set_position(position, True)
+            else:
+                self.player.set_position(position)
+        else:
+            self.player.set_time(int(target))
+        
+        self._last_issue = time.monotonic()
+        self._in_flight = (target, exact, self._last_issue)
+        self._issued += 1
+        
+        # Gives up on the seek if VLC never reports a time near the target
+        self._timer.start(self.SEEK_TIMEOUT + 1)
+    
+    # Statistics
+    def _record_latency(self, latency):
+        self._latencies.append(latency)
+        if len(self._latencies) > 256:
+            del self._latencies[:128]
+        self._latency_last = latency
+        self._latency_max = max(self._latency_max, latency)
+    
+    def reset_stats(self):
+        """Reset the seek statistics."""
+        self._issued = 0
+        self._coalesced = 0
+        self._timeouts = 0
+        self._latencies = []
+        self._latency_last = 0.0
+        self._latency_max = 0.0
+    
+    def stats(self):
+        """
+        Get seek statistics.
+        
+        Returns:
+            dict: Seeks issued, requests coalesced away, seeks that timed
+                  out, and the last, mean, 95th percentile and maximum
+                  seek-to-frame latency in milliseconds
+        """
+        latencies = sorted(self._latencies)
+        count = len(latencies)
+        return {
+            'issued': self._issued,
+            'coalesced': self._coalesced,
+            'timeouts': self._timeouts,
+            'latency_last': round(self._latency_last, 1),
+            'latency_mean': round(sum(latencies) / count, 1) if count else 0.0,
+            'latency_p95': round(latencies[min(count - 1, int(count * 0.95))], 1) if count else 0.0,
+            'latency_max': round(self._latency_max, 1),
+        }
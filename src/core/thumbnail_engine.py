@@ -0,0 +1,340 @@
+import os
+import time
+import ctypes
+import threading
+from collections import OrderedDict
+from PyQt5.QtCore import QObject, QTimer, QUrl, pyqtSignal
+from PyQt5.QtGui import QImage
+
+from src.utils import tracing
+
+log = tracing.get_logger("thumbnails")
+
+
+class ThumbnailCache:
+    """LRU cache of thumbnail images bounded by a memory budget."""
+    
+    def __init__(self, budget_bytes):
+        self.budget_bytes = budget_bytes
+        self.used_bytes = 0
+        self._images = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        """Get a cached image and mark it as recently used, or None."""
+        with self._lock:
+            image = self._images.get(key)
+            if image is not None:
+                self._images.move_to_end(key)
+            return image
+    
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._images
+    
+    def put(self, key, image):
+        """Store an image, evicting the least recently used ones if needed."""
+        size = image.sizeInBytes()
+        with self._lock:
+            old = self._images.pop(key, None)
+            if old is not None:
+                self.used_bytes -= old.sizeInBytes()
+            while self._images and self.used_bytes + size > self.budget_bytes:
+                _, evicted = self._images.popitem(last=False)
+                self.used_bytes -= evicted.sizeInBytes()
+            self._images[key] = image
+            self.used_bytes += size
+    
+    def clear(self):
+        """Remove all images."""
+        with self._lock:
+            self._images.clear()
+            self.used_bytes = 0
+
+
+class ThumbnailEngine(QObject):
+    """
+    Extracts timeline preview frames on a background thread.
+    
+    Frames are decoded by a separate headless libvlc player that renders
+    into memory through video callbacks, already scaled down to thumbnail
+    size. Requests are grouped into time buckets and served nearest to the
+    hover cursor first; requests far from the cursor or for a previous
+    media are dropped. request() never blocks: cached thumbnails are
+    emitted right away, everything else is delivered later through
+    thumbnail_ready.
+    """
+    
+    # Signals
+    thumbnail_ready = pyqtSignal(int, QImage)   # bucket time in ms, image
+    
+    FRAME_TIMEOUT = 3.0     # Seconds to wait for a frame after seeking
+    IDLE_PAUSE = 1.0        # Seconds without requests before pausing decoding
+    PREFETCH = 2            # Buckets prefetched on each side of the cursor
+    MAX_DISTANCE = 5        # Pending buckets further from the cursor are dropped
+    
+    def __init__(self, width=160, budget_bytes=24 * 1024 * 1024, parent=None):
+        """
+        Args:
+            width (int): Thumbnail width in pixels; height follows the aspect ratio
+            budget_bytes (int): Memory budget of the thumbnail cache
+        """
+        super().__init__(parent)
+        self.width = width
+        self.cache = ThumbnailCache(budget_bytes)
+        
+        self._cond = threading.Condition()
+        self._pending = set()
+        self._cursor = 0
+        self._media_path = None
+        self._duration = 0
+        self._bucket_ms = 1000
+        self._generation = 0
+        self._stopping = False
+        self._thread = None
+        
+        # Worker thread state
+        self._instance = None
+        self._player = None
+        self._opened_generation = -1
+        self._frame_size = (0, 0)
+        self._buffer = None
+        self._frame_data = None
+        self._frame_event = threading.Event()
+        self._callbacks = None
+    
+    # Public API, called on the GUI thread
+    def set_media(self, media_path, duration):
+        """
+        Switch to a new media and cancel all pending requests.
+        
+        Args:
+            media_path (str): Local path of the media, or None to disable
+            duration (int): Duration in milliseconds
+        """
+        with self._cond:
+            self._generation += 1
+            self._pending.clear()
+            self._media_path = media_path
+            self._duration = max(0, duration)
+            # Around 200 thumbnails per media, at most one per second
+            self._bucket_ms = max(1000, self._duration // 200)
+            self._cond.notify()
+    
+    def bucket_for(self, time_ms):
+        """Get the bucket time a media time is served from."""
+        bucket_ms = self._bucket_ms
+        return int(round(time_ms / bucket_ms)) * bucket_ms
+    
+    def request(self, time_ms):
+        """
+        Request the thumbnail for a media time.
+        
+        Args:
+            time_ms (int): Hovered media time in milliseconds
+        
+        Returns:
+            int: Bucket time the thumbnail will be delivered for, or -1;
+                 cached thumbnails too are only delivered after this returns
+        """
+        if not self._media_path or self._duration <= 0:
+            return -1
+        
+        bucket = self.bucket_for(max(0, min(time_ms, self._duration)))
+        image = self.cache.get((self._media_path, bucket))
+        if image is not None:
+            # Delivered once the caller knows which bucket it is waiting for
+            QTimer.singleShot(0, lambda: self.thumbnail_ready.emit(bucket, image))
+        
+        with self._cond:
+            self._cursor = bucket
+            bucket_ms = self._bucket_ms
+            # Cancel requests that have fallen far behind the cursor
+            limit = self.MAX_DISTANCE * bucket_ms
+            self._pending = {b for b in self._pending if abs(b - bucket) <= limit}
+            
+            for offset in range(-self.PREFETCH, self.PREFETCH + 1):
+                candidate = bucket + offset * bucket_ms
+                if 0 <= candidate <= self._duration and \
+                        (self._media_path, candidate) not in self.cache:
+                    self._pending.add(candidate)
+            
+            if self._pending:
+                self._ensure_thread()
+                self._cond.notify()
+        return bucket
+    
+    def cancel(self):
+        """Drop all pending requests, e.g. when the cursor leaves the timeline."""
+        with self._cond:
+            self._pending.clear()
+    
+    def shutdown(self, timeout=2.0):
+        """Stop the worker thread and release the headless player."""
+        with self._cond:
+            self._stopping = True
+            self._pending.clear()
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+    
+    def _ensure_thread(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="ThumbnailEngine", daemon=True)
+            self._thread.start()
+    
+    # Worker thread
+    def _run(self):
+        try:
+            while True:
+                with self._cond:
+                    if not self._pending and not self._stopping:
+                        self._cond.wait(self.IDLE_PAUSE)
+                    if self._stopping:
+                        break
+                    if not self._pending:
+                        bucket = None
+                    else:
+                        cursor = self._cursor
+                        bucket = min(self._pending, key=lambda b: abs(b - cursor))
+                        self._pending.discard(bucket)
+                    generation = self._generation
+                    media_path = self._media_path
+                
+                if bucket is None:
+                    self._pause()
+                    continue
+                
+                try:
+                    if generation != self._opened_generation:
+                        self._opened_generation = generation
+                        if not self._open(media_path):
+                            continue
+                    image = self._extract(bucket, generation)
+                except Exception as e:
+                    # Treat the media like one without video until the next set_media
+                    log.exception("Thumbnail extraction failed for %s: %s", media_path, e)
+                    self._close_player()
+                    continue
+                if image is None or generation != self._generation:
+                    continue
+                
+                self.cache.put((media_path, bucket), image)
+                self.thumbnail_ready.emit(bucket, image)
+        except Exception as e:
+            log.exception("Thumbnail engine error: %s", e)
+        finally:
+            self._release()
+            with self._cond:
+                if self._thread is threading.current_thread():
+                    self._thread = None     # Let _ensure_thread start a new one
+    
+    def _open(self, media_path):
+        """Open a media in the headless player; returns False if it has no video."""
+        import vlc  # Loaded on first use, off the GUI thread
+        
+        if self._instance is None:
+            self._instance = vlc.Instance(' '.join([
+                '--quiet',
+                '--no-audio',
+                '--no-xlib',
+                '--no-stats',
+                '--no-sub-autodetect-file',
+                '--no-video-title-show',
+                '--avcodec-skiploopfilter=4',  # Cheaper decoding, fine at thumbnail size
+                '--avcodec-fast',
+            ]))
+        
+        self._close_player()
+        if not media_path:
+            return False
+        
+        mrl = QUrl.fromLocalFile(media_path).toString() if os.path.exists(media_path) else media_path
+        media = self._instance.media_new(mrl)
+        media.parse()
+        
+        video = None
+        for track in media.tracks_get() or []:
+            if track.type == vlc.TrackType.video and track.video:
+                video = track.video.contents
+                break
+        if video is None or video.width <= 0 or video.height <= 0:
+            media.release()
+            return False
+        
+        # Let VLC scale frames down to thumbnail size while converting
+        width = self.width
+        height = max(2, int(round(width * video.height / video.width / 2)) * 2)
+        self._frame_size = (width, height)
+        self._buffer = ctypes.create_string_buffer(width * height * 4)
+        
+        self._player = self._instance.media_player_new()
+        self._player.set_media(media)
+        media.release()
+        
+        self._callbacks = (
+            vlc.CallbackDecorators.VideoLockCb(self._lock_cb),
+            vlc.CallbackDecorators.VideoUnlockCb(self._unlock_cb),
+            vlc.CallbackDecorators.VideoDisplayCb(self._display_cb),
+        )
+        self._player.video_set_callbacks(*self._callbacks, None)
+        self._player.video_set_format("RV32", width, height, width * 4)
+        return True
+    
+    def _extract(self, bucket, generation):
+        """Seek the headless player and grab the frame at a bucket time."""
+        player = self._player
+        if player is None:
+            return None
+        
+        if not player.is_playing():
+            player.play()
+        player.set_time(bucket)
+        
+        tolerance = max(500, self._bucket_ms // 2)
+        deadline = time.monotonic() + self.FRAME_TIMEOUT
+        while time.monotonic() < deadline:
+            if generation != self._generation or self._stopping:
+                return None
+            self._frame_event.clear()
+            if not self._frame_event.wait(0.1):
+                continue
+            if abs(player.get_time() - bucket) <= tolerance:
+                return self._frame_image()
+        return None
+    
+    def _frame_image(self):
+        data = self._frame_data
+        if data is None:
+            return None
+        width, height = self._frame_size
+        return QImage(data, width, height, width * 4, QImage.Format_RGB32).copy()
+    
+    def _pause(self):
+        if self._player is not None and self._player.is_playing():
+            self._player.set_pause(1)
+    
+    def _close_player(self):
+        player, self._player = self._player, None
+        if player is not None:
+            player.stop()
+            player.release()
+    
+    def _release(self):
+        self._close_player()
+        if self._instance is not None:
+            self._instance.release()
+            self._instance = None
+    
+    # libvlc video callbacks, called on VLC's decoder and vout threads
+    def _lock_cb(self, opaque, planes):
+        planes[0] = ctypes.addressof(self._buffer)
+        return None
+    
+    def _unlock_cb(self, opaque, picture, planes):
+        pass
+    
+    def _display_cb(self, opaque, picture):
+        self._frame_data = ctypes.string_at(self._buffer, len(self._buffer))
+        self._frame_event.set()
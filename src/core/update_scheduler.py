@@ -0,0 +1,144 @@
+import time
+from PyQt5.QtCore import Qt, QObject, QTimer, QEvent, pyqtSignal
+
+
+class PositionUpdateScheduler(QObject):
+    """
+    Decides when the UI should be told about a new playback position.
+    
+    While playback runs, updates are paced to what the timeline can actually
+    show: one update per timeline pixel, but never more than MAX_RATE per
+    second nor less than one per second for the time label. The position
+    itself comes from the interpolated playback clock. When playback is not
+    running, updates only follow notify() calls such as VLC time events and
+    seeks, so a paused player does no periodic work. While the window is
+    hidden, minimized or fully covered no updates are emitted at all; the
+    latest position is delivered once it becomes visible again.
+    """
+    
+    # Signals
+    update_due = pyqtSignal()
+    
+    MAX_RATE = 60          # Updates per second
+    MIN_INTERVAL = 1000 // MAX_RATE
+    MAX_INTERVAL = 1000    # Time labels show whole seconds
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._duration = 0
+        self._pixels = 0
+        self._rate = 1.0
+        self._visible = True
+        self._running = False
+        self._dirty = False
+        self._last_update = 0.0
+        self._window = None
+        
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._emit_update)
+    
+    def interval(self):
+        """Get the current minimum interval between updates in milliseconds."""
+        if self._duration <= 0 or self._pixels <= 0 or self._rate <= 0:
+            return self.MAX_INTERVAL
+        ms_per_pixel = self._duration / (self._pixels * self._rate)
+        return int(max(self.MIN_INTERVAL, min(self.MAX_INTERVAL, ms_per_pixel)))
+    
+    def set_duration(self, duration):
+        """Set the media duration in milliseconds."""
+        self._duration = max(0, duration)
+    
+    def set_resolution(self, pixels):
+        """Set the width of the timeline in pixels."""
+        self._pixels = max(0, pixels)
+    
+    def set_rate(self, rate):
+        """Set the playback rate."""
+        self._rate = rate
+    
+    def set_running(self, running):
+        """Start or stop pacing updates on their own while playback runs."""
+        if running == self._running:
+            return
+        self._running = running
+        if not running:
+            self._timer.stop()
+        elif self._visible:
+            self._emit_update()
+    
+    def is_visible(self):
+        """Check if updates are currently delivered."""
+        return self._visible
+    
+    def set_visible(self, visible):
+        """Enable or suspend updates, e.g. when the window is minimized."""
+        if visible == self._visible:
+            return
+        self._visible = visible
+        if not visible:
+            self._timer.stop()
+        elif self._dirty or self._running:
+            self._emit_update()
+    
+    def notify(self, force=False):
+        """
+        Report that the playback position changed.
+        
+        Args:
+            force (bool): Deliver the update immediately, e.g. after a seek
+        """
+        self._dirty = True
+        if not self._visible:
+            return
+        
+        elapsed = (time.monotonic() - self._last_update) * 1000
+        remaining = self.interval() - elapsed
+        if force or remaining <= 0:
+            self._timer.stop()
+            self._emit_update()
+        elif not self._timer.isActive():
+            self._timer.start(int(remaining))
+    
+    def cancel(self):
+        """Stop pacing and drop any pending update."""
+        self._running = False
+        self._dirty = False
+        self._timer.stop()
+    
+    def _emit_update(self):
+        self._dirty = False
+        self._last_update = time.monotonic()
+        self.update_due.emit()
+        if self._running and self._visible:
+            self._timer.start(self.interval())
+    
+    # Window visibility tracking
+    def watch_window(self, window):
+        """
+        Suspend updates while the given QWindow is not exposed.
+        
+        Args:
+            window: QWindow of the player's top-level widget
+        """
+        if window is None or window is self._window:
+            return
+        if self._window is not None:
+            self._window.removeEventFilter(self)
+        self._window = window
+        window.installEventFilter(self)
+        self._update_visibility()
+    
+    def eventFilter(self, obj, event):
+        if obj is self._window and event.type() in (QEvent.Expose, QEvent.Hide, QEvent.Show,
+                                                    QEvent.WindowStateChange):
+            self._update_visibility()
+        return False
+    
+    def _update_visibility(self):
+        window = self._window
+        self.set_visible(
+            window.isVisible()
+            and window.isExposed()
+            and not window.windowState() & Qt.WindowMinimized
+        )
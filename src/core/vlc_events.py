@@ -0,0 +1,121 @@
+import time
+from collections import deque
+from PyQt5.QtCore import Qt, QObject, QTimer, pyqtSignal
+
+from src.utils import tracing
+
+log = tracing.get_logger("vlc")
+
+
+class VlcEventBridge(QObject):
+    """
+    Moves libvlc events from VLC's event thread onto the Qt thread.
+    
+    VLC callbacks only append a compact (event_type, value) record to a
+    deque, which is safe without locking, and wake the bridge the first
+    time the queue becomes non-empty. Handlers are then called on the Qt
+    thread at most max_rate times per second. Frequent events such as time
+    updates are coalesced so only the latest value of a drain is handled.
+    """
+    
+    # Emitted from the VLC thread, delivered queued to the Qt thread
+    _wakeup = pyqtSignal()
+    
+    def __init__(self, max_rate=60, max_batch=64, parent=None):
+        """
+        Args:
+            max_rate (int): Maximum number of drains per second
+            max_batch (int): Maximum number of records handled per drain
+        """
+        super().__init__(parent)
+        self._queue = deque()
+        self._handlers = {}
+        self._coalesced = set()
+        self._attached = []
+        self._wakeup_pending = False
+        
+        self.max_batch = max_batch
+        self._min_interval = 1.0 / max_rate
+        self._last_drain = 0.0
+        
+        self._drain_timer = QTimer(self)
+        self._drain_timer.setSingleShot(True)
+        self._drain_timer.timeout.connect(self.drain)
+        self._wakeup.connect(self._schedule_drain, Qt.QueuedConnection)
+    
+    def attach(self, event_manager, event_type, handler, value=None, coalesce=False):
+        """
+        Attach a VLC event whose handler runs on the Qt thread.
+        
+        Args:
+            event_manager: vlc.EventManager to attach to
+            event_type: vlc.EventType to listen for
+            handler: Called on the Qt thread with the extracted value
+            value: Optional function(event) run on the VLC thread to extract
+                   a compact value from the event; it must not call libvlc
+            coalesce (bool): Only handle the latest record of a drain
+        """
+        queue = self._queue
+        
+        def callback(event):
+            queue.append((event_type, value(event) if value else None))
+            if not self._wakeup_pending:
+                self._wakeup_pending = True
+                self._wakeup.emit()
+        
+        event_manager.event_attach(event_type, callback)
+        self._handlers[event_type] = handler
+        if coalesce:
+            self._coalesced.add(event_type)
+        self._attached.append((event_manager, event_type))
+    
+    def detach_all(self):
+        """Detach all VLC events and drop queued records."""
+        for event_manager, event_type in self._attached:
+            try:
+                event_manager.event_detach(event_type)
+            except Exception as e:
+                log.warning("Failed to detach event %s: %s", event_type, e)
+        self._attached = []
+        self._drain_timer.stop()
+        self._queue.clear()
+    
+    def _schedule_drain(self):
+        """Start the drain timer, honouring the maximum drain rate."""
+        if self._drain_timer.isActive():
+            return
+        elapsed = time.monotonic() - self._last_drain
+        delay = max(0.0, self._min_interval - elapsed)
+        self._drain_timer.start(int(delay * 1000))
+    
+    def drain(self):
+        """Handle queued event records on the Qt thread."""
+        # Clear the flag before popping so a record appended meanwhile
+        # always triggers another wakeup
+        self._wakeup_pending = False
+        self._last_drain = time.monotonic()
+        
+        records = []
+        queue = self._queue
+        while queue and len(records) < self.max_batch:
+            records.append(queue.popleft())
+        
+        latest = {}
+        for index, (event_type, _) in enumerate(records):
+            if event_type in self._coalesced:
+                latest[event_type] = index
+        
+        for index, (event_type, value) in enumerate(records):
+            if latest.get(event_type, index) != index:
+                continue
+            handler = self._handlers.get(event_type)
+            if handler is None:
+                continue
+            try:
+                handler(value)
+            except Exception as e:
+                log.exception("Error handling VLC event %s: %s", event_type, e)
+        
+        if queue:
+            self._wakeup_pending = True
+            self._schedule_drain()
@@ -1,103 +1,325 @@
 from PyQt5.QtWidgets import (
     QWidget, QHBoxLayout, QPushButton, QSlider, QLabel, QStyle,
     QVBoxLayout, QSizePolicy, QToolButton, QFrame, QSpacerItem,
-    QSizePolicy
+    QSizePolicy, QAbstractSlider, QStyleOptionSlider
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QSize, QTimer, QEvent
-from PyQt5.QtGui import QIcon, QFont, QColor, QPainter, QPen, QLinearGradient
+from PyQt5.QtCore import Qt, pyqtSignal, QSize, QTimer, QEvent, QPoint, QRect, QRectF
+from PyQt5.QtGui import QIcon, QFont, QColor, QPainter, QPen, QLinearGradient, QPixmap
 import os
 import math
 from src.utils.file_utils import get_asset_path
 
+class ThumbnailPopup(QLabel):
+    """Frameless popup showing a preview frame above the timeline."""
+    def __init__(self, parent=None):
+        super().__init__(parent, Qt.ToolTip | Qt.FramelessWindowHint)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setAttribute(Qt.WA_ShowWithoutActivating)
+        self.setObjectName("thumbnailPopup")
+        self.setStyleSheet("QLabel#thumbnailPopup { border: 1px solid rgba(255, 255, 255, 80); background: black; }")
+    
+    def show_image(self, image, anchor):
+        """
+        Show an image centered horizontally above a global position.
+        
+        Args:
+            image (QImage): Thumbnail to show
+            anchor (QPoint): Global position of the hovered timeline point
+        """
+        self.setPixmap(QPixmap.fromImage(image))
+        self.adjustSize()
+        self.move(anchor.x() - self.width() // 2, anchor.y() - self.height() - 30)
+        if not self.isVisible():
+            self.show()
+
+
+class TimeTooltip(QLabel):
+    """Frameless popup showing the hovered time above the timeline."""
+    def __init__(self, parent=None):
+        super().__init__(parent, Qt.ToolTip | Qt.FramelessWindowHint)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setAttribute(Qt.WA_ShowWithoutActivating)
+        self.setObjectName("timeTooltip")
+        self.setStyleSheet("QLabel#timeTooltip { color: white; background: rgba(0, 0, 0, 200); "
+                           "border-radius: 3px; padding: 5px 10px; }")
+    
+    def show_text(self, text, anchor):
+        """
+        Show a text centered horizontally above a global position.
+        
+        Args:
+            text (str): Text to show
+            anchor (QPoint): Global position of the hovered timeline point
+        """
+        if text != self.text():
+            self.setText(text)
+            self.adjustSize()
+        self.move(anchor.x() - self.width() // 2, anchor.y() - self.height() - 4)
+        if not self.isVisible():
+            self.show()
+
+
 class TimelineSlider(QSlider):
-    """Custom timeline slider with progress indicator."""
+    """
+    Custom timeline slider with progress indicator.
+    
+    The groove, buffer band and progress gradient are rendered once into
+    pixmaps at the screen's pixel ratio and only re-rendered when the size
+    or style changes; painting just copies the visible parts of them. Value,
+    progress and hover changes only repaint the strips that changed, and
+    the hovered time is shown in a separate popup instead of being painted.
+    """
+    
+    # Signals
+    width_changed = pyqtSignal(int)        # Width in pixels
+    hover_time_changed = pyqtSignal(int)   # Hovered media time in milliseconds
+    hover_left = pyqtSignal()
+    
+    HOVER_LINE_WIDTH = 2
+    
     def __init__(self, parent=None):
         super().__init__(Qt.Horizontal, parent)
         self.setMouseTracking(True)
         self._progress = 0
         self._hover_pos = -1
         self._buffer = 0
+        self._thumbnail_popup = None
+        self._time_tooltip = None
+        self._layers = None
+        self._handle_rect = None
+        self._handle_span = None
         self.setCursor(Qt.PointingHandCursor)
     
+    def hover_time(self):
+        """Get the media time under the cursor, or -1 when not hovering."""
+        if self._hover_pos < 0 or self.width() <= 0:
+            return -1
+        return int((self._hover_pos / self.width()) * self.maximum())
+    
+    def show_thumbnail(self, image):
+        """Show a preview frame above the hovered position."""
+        if self._hover_pos < 0 or not self.underMouse():
+            return
+        if self._thumbnail_popup is None:
+            self._thumbnail_popup = ThumbnailPopup(self)
+        self._thumbnail_popup.show_image(image, self.mapToGlobal(QPoint(self._hover_pos, 0)))
+    
+    def hide_thumbnail(self):
+        """Hide the preview frame."""
+        if self._thumbnail_popup is not None:
+            self._thumbnail_popup.hide()
+    
+    # Geometry
+    def _band_rect(self):
+        """Get the rectangle covered by the buffer and progress bands."""
+        return self.rect().adjusted(1, 1, -1, -1)
+    
+    def _band_width(self, percent):
+        return int(self._band_rect().width() * (percent / 100))
+    
+    def _style_option(self):
+        option = QStyleOptionSlider()
+        self.initStyleOption(option)
+        return option
+    
+    def _handle_geometry(self):
+        return self.style().subControlRect(QStyle.CC_Slider, self._style_option(),
+                                           QStyle.SC_SliderHandle, self)
+    
+    def value_pixels(self, value, duration):
+        """
+        Get the pixel positions that show a media time.
+        
+        Two times with the same pixel positions look exactly the same on
+        the timeline.
+        
+        Args:
+            value (int): Media time in milliseconds
+            duration (int): Media duration in milliseconds
+        
+        Returns:
+            tuple: Offsets of the progress band edge and of the handle
+        """
+        band = self._band_width((value / duration) * 100) if duration > 0 else 0
+        return band, self.handle_pixel(value)
+    
+    def handle_pixel(self, value):
+        """Get the offset of the handle when the slider is at a value."""
+        if self._handle_span is None:
+            self._handle_span = max(0, self.width() - self._handle_geometry().width())
+        return QStyle.sliderPositionFromValue(self.minimum(), self.maximum(),
+                                              int(value), self._handle_span)
+    
+    def _update_strip(self, left, right):
+        """Repaint the full-height strip between two x positions."""
+        if left > right:
+            left, right = right, left
+        self.update(QRect(left - 1, 0, right - left + 2, self.height()))
+    
+    # Cached layers
+    def _new_layer(self):
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(int(self.width() * ratio), int(self.height() * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        return pixmap
+    
+    def _build_layers(self):
+        """Render the groove, buffer band and progress gradient for the current size."""
+        band = self._band_rect()
+        
+        # The groove without a handle or sub-page, which depend on the value
+        groove = self._new_layer()
+        option = self._style_option()
+        option.subControls = QStyle.SC_SliderGroove
+        option.activeSubControls = QStyle.SC_None
+        option.sliderPosition = option.sliderValue = option.minimum
+        painter = QPainter(groove)
+        self.style().drawComplexControl(QStyle.CC_Slider, option, painter, self)
+        painter.end()
+        
+        buffer = self._new_layer()
+        painter = QPainter(buffer)
+        painter.fillRect(band, QColor(100, 100, 100, 150))
+        painter.end()
+        
+        progress = self._new_layer()
+        painter = QPainter(progress)
+        gradient = QLinearGradient(band.topLeft(), band.topRight())
+        gradient.setColorAt(0, QColor(0, 150, 255))
+        gradient.setColorAt(1, QColor(0, 200, 255))
+        painter.fillRect(band, gradient)
+        painter.end()
+        
+        self._layers = {'groove': groove, 'buffer': buffer, 'progress': progress,
+                        'ratio': self.devicePixelRatioF()}
+    
+    def _invalidate_layers(self):
+        self._layers = None
+        self._handle_rect = None
+        self._handle_span = None
+        self.update()
+    
+    # State
     def set_progress(self, progress):
         """Set the progress percentage (0-100)."""
+        old_width = self._band_width(self._progress)
         self._progress = progress
-        self.update()
+        new_width = self._band_width(progress)
+        if new_width != old_width:
+            left = self._band_rect().left()
+            self._update_strip(left + old_width, left + new_width)
     
     def set_buffer(self, buffer):
         """Set the buffer percentage (0-100)."""
+        old_width = self._band_width(self._buffer)
         self._buffer = buffer
-        self.update()
+        new_width = self._band_width(buffer)
+        if new_width != old_width:
+            left = self._band_rect().left()
+            self._update_strip(left + old_width, left + new_width)
+    
+    def sliderChange(self, change):
+        """Repaint only the old and new handle area when the value changes."""
+        if change == QAbstractSlider.SliderValueChange and self._handle_rect is not None:
+            handle_rect = self._handle_geometry()
+            if handle_rect != self._handle_rect:
+                self.update(self._handle_rect.united(handle_rect))
+                self._handle_rect = handle_rect
+            return
+        super().sliderChange(change)
+    
+    def resizeEvent(self, event):
+        """Report the new width so position updates can match it."""
+        super().resizeEvent(event)
+        self._layers = None
+        self._handle_rect = None
+        self._handle_span = None
+        if event.size().width() != event.oldSize().width():
+            self.width_changed.emit(event.size().width())
+    
+    def changeEvent(self, event):
+        """Re-render the cached layers when the style changes."""
+        if event.type() in (QEvent.StyleChange, QEvent.PaletteChange, QEvent.EnabledChange):
+            self._invalidate_layers()
+        super().changeEvent(event)
+    
+    # Hover
+    def _set_hover_pos(self, pos):
+        if pos == self._hover_pos:
+            return
+        half = self.HOVER_LINE_WIDTH
+        for x in (self._hover_pos, pos):
+            if x >= 0:
+                self._update_strip(x - half, x + half)
+        self._hover_pos = pos
+    
+    def _show_time_tooltip(self):
+        if self.maximum() <= 0:
+            return
+        if self._time_tooltip is None:
+            self._time_tooltip = TimeTooltip(self)
+        self._time_tooltip.show_text(self.format_time(self.hover_time()),
+                                     self.mapToGlobal(QPoint(self._hover_pos, 0)))
     
     def mouseMoveEvent(self, event):
         """Update hover position for tooltip."""
-        self._hover_pos = event.pos().x()
-        self.update()
+        self._set_hover_pos(event.pos().x())
+        if self.maximum() > 0:
+            self._show_time_tooltip()
+            self.hover_time_changed.emit(self.hover_time())
         super().mouseMoveEvent(event)
     
     def leaveEvent(self, event):
         """Reset hover position when leaving the slider."""
-        self._hover_pos = -1
-        self.update()
+        self._set_hover_pos(-1)
+        if self._time_tooltip is not None:
+            self._time_tooltip.hide()
+        self.hide_thumbnail()
+        self.hover_left.emit()
         super().leaveEvent(event)
     
+    def hideEvent(self, event):
+        """Hide the popups along with the slider."""
+        if self._time_tooltip is not None:
+            self._time_tooltip.hide()
+        self.hide_thumbnail()
+        super().hideEvent(event)
+    
     def paintEvent(self, event):
-        """Custom paint event for the timeline."""
-        super().paintEvent(event)
+        """Compose the cached layers, handle and hover line for the dirty area."""
+        if self._layers is None or self._layers['ratio'] != self.devicePixelRatioF():
+            self._build_layers()
         
+        dirty = event.rect()
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        # Draw background
-        bg_rect = self.rect().adjusted(1, 1, -1, -1)
-        painter.setPen(Qt.NoPen)
-        
-        # Draw buffer progress
-        if self._buffer > 0:
-            buffer_width = int(bg_rect.width() * (self._buffer / 100))
-            buffer_rect = bg_rect.adjusted(0, 0, -bg_rect.width() + buffer_width, 0)
-            painter.fillRect(buffer_rect, QColor(100, 100, 100, 150))
-        
-        # Draw progress
-        if self._progress > 0:
-            progress_width = int(bg_rect.width() * (self._progress / 100))
-            progress_rect = bg_rect.adjusted(0, 0, -bg_rect.width() + progress_width, 0)
-            
-            # Gradient for progress
-            gradient = QLinearGradient(progress_rect.topLeft(), progress_rect.topRight())
-            gradient.setColorAt(0, QColor(0, 150, 255))
-            gradient.setColorAt(1, QColor(0, 200, 255))
-            painter.fillRect(progress_rect, gradient)
+        painter.drawPixmap(QRectF(dirty), self._layers['groove'], self._layer_source(dirty))
+        
+        # The handle, and the sub-page the style sheet draws with it, depend
+        # on the value and are drawn by the style, clipped to the dirty area
+        self._handle_rect = self._handle_geometry()
+        option = self._style_option()
+        option.subControls = QStyle.SC_SliderHandle
+        self.style().drawComplexControl(QStyle.CC_Slider, option, painter, self)
+        
+        band = self._band_rect()
+        for name, percent in (('buffer', self._buffer), ('progress', self._progress)):
+            if percent <= 0:
+                continue
+            visible = band.adjusted(0, 0, -band.width() + self._band_width(percent), 0)
+            visible = visible.intersected(dirty)
+            if not visible.isEmpty():
+                painter.drawPixmap(QRectF(visible), self._layers[name], self._layer_source(visible))
         
         # Draw hover indicator
         if self._hover_pos > 0 and self.underMouse():
-            painter.setPen(QPen(Qt.white, 2))
+            painter.setPen(QPen(Qt.white, self.HOVER_LINE_WIDTH))
             painter.drawLine(self._hover_pos, 0, self._hover_pos, self.height())
-            
-            # Draw time tooltip
-            hover_time = int((self._hover_pos / self.width()) * self.maximum())
-            time_text = self.format_time(hover_time)
-            
-            font_metrics = painter.fontMetrics()
-            text_rect = font_metrics.boundingRect(time_text)
-            text_rect.moveCenter(self.rect().center())
-            
-            tooltip_rect = text_rect.adjusted(-10, -5, 10, 5)
-            tooltip_rect.moveTop(-25)
-            tooltip_rect.moveLeft(self._hover_pos - tooltip_rect.width() // 2)
-            
-            # Keep tooltip within bounds
-            if tooltip_rect.left() < 0:
-                tooltip_rect.moveLeft(0)
-            elif tooltip_rect.right() > self.width():
-                tooltip_rect.moveRight(self.width())
-            
-            painter.setPen(Qt.NoPen)
-            painter.setBrush(QColor(0, 0, 0, 200))
-            painter.drawRoundedRect(tooltip_rect, 3, 3)
-            
-            painter.setPen(Qt.white)
-            painter.drawText(tooltip_rect, Qt.AlignCenter, time_text)
+    
+    def _layer_source(self, rect):
+        """Map a widget rectangle to the device pixels of a cached layer."""
+        ratio = self._layers['ratio']
+        return QRectF(rect.x() * ratio, rect.y() * ratio, rect.width() * ratio, rect.height() * ratio)
     
     @staticmethod
     def format_time(milliseconds):
@@ -118,7 +340,10 @@ class ControlBar(QWidget):
     # Signals
     play_pressed = pyqtSignal()
     stop_pressed = pyqtSignal()
+    previous_pressed = pyqtSignal()
+    next_pressed = pyqtSignal()
     seek_requested = pyqtSignal(int)  # Position in milliseconds
+    scrub_requested = pyqtSignal(int)  # Position in milliseconds while dragging
     volume_changed = pyqtSignal(int)   # Volume 0-100
     fullscreen_toggled = pyqtSignal()
     info_toggled = pyqtSignal()
@@ -134,6 +359,12 @@ class ControlBar(QWidget):
         self._auto_hide_timer.setSingleShot(True)
         self._auto_hide_timer.timeout.connect(self._auto_hide)
         self._is_mouse_over = False
+        
+        # What the timeline and labels currently show
+        self._shown_band = None
+        self._shown_position_second = None
+        self._shown_duration_second = None
+        self.reset_update_stats()
         self.setup_ui()
         
         # Set up auto-hide timer
@@ -294,7 +525,9 @@ class ControlBar(QWidget):
         self.timeline = TimelineSlider()
         self.timeline.setObjectName("timelineSlider")
         self.timeline.setRange(0, 0)
-        self.timeline.sliderMoved.connect(self.on_seek)
+        self.timeline.sliderMoved.connect(self.on_scrub)
+        self.timeline.sliderReleased.connect(self.on_seek_released)
+        self.timeline.width_changed.connect(self._on_timeline_resized)
         
         # Duration
         self.duration_label = QLabel("00:00")
@@ -337,12 +570,14 @@ class ControlBar(QWidget):
         self.prev_button.setObjectName("controlButton")
         self.prev_button.setIcon(self.style().standardIcon(QStyle.SP_MediaSkipBackward))
         self.prev_button.setFixedSize(32, 32)
+        self.prev_button.clicked.connect(self.previous_pressed.emit)
         
         # Next button
         self.next_button = QPushButton()
         self.next_button.setObjectName("controlButton")
         self.next_button.setIcon(self.style().standardIcon(QStyle.SP_MediaSkipForward))
         self.next_button.setFixedSize(32, 32)
+        self.next_button.clicked.connect(self.next_pressed.emit)
         
         left_layout.addWidget(self.prev_button)
         left_layout.addWidget(self.play_button)
@@ -420,27 +655,87 @@ class ControlBar(QWidget):
         """Handle timeline seek."""
         self.seek_requested.emit(position)
     
+    def on_scrub(self, position):
+        """Handle timeline drag; fast seeks until the slider is released."""
+        self.scrub_requested.emit(position)
+    
+    def on_seek_released(self):
+        """Finish a timeline drag with an exact seek."""
+        self.seek_requested.emit(self.timeline.value())
+    
     def update_position(self, position, duration):
-        """Update the timeline position and time labels."""
+        """
+        Update the timeline position and time labels.
+        
+        Widgets are only touched when what they show changes: the labels
+        when the displayed second changes and the timeline when the handle
+        or progress band moves by at least a pixel. The handle is compared
+        with where the slider actually shows it, since clicks and drags that
+        did not seek move it too. Updates that change
+        nothing visible are counted as skipped, see get_update_stats().
+        """
         self.current_position = position
         self.duration = duration if duration > 0 else 1  # Avoid division by zero
+        applied = False
         
-        if not self.timeline.isSliderDown():
+        # Update the timeline when it moves on screen
+        band, handle = self.timeline.value_pixels(position, self.duration)
+        if not self.timeline.isSliderDown() and \
+                handle != self.timeline.handle_pixel(self.timeline.value()):
             self.timeline.setValue(position)
-        
-        # Update timeline progress
-        progress = (position / self.duration) * 100 if self.duration > 0 else 0
-        self.timeline.set_progress(progress)
-        
-        # Update time labels
-        self.current_time_label.setText(self.format_time(position))
+            applied = True
+        
+        if band != self._shown_band:
+            progress = (position / self.duration) * 100 if self.duration > 0 else 0
+            self.timeline.set_progress(progress)
+            self._shown_band = band
+            applied = True
+        
+        # Update time labels when the displayed second changes
+        position_second = int(position / 1000)
+        if position_second != self._shown_position_second:
+            self.current_time_label.setText(self.format_time(position))
+            self._shown_position_second = position_second
+            applied = True
+        applied = self._show_duration(duration) or applied
+        
+        if applied:
+            self._updates_applied += 1
+        else:
+            self._updates_skipped += 1
+    
+    def _show_duration(self, duration):
+        """Update the duration label if its displayed second changed."""
+        duration_second = int(duration / 1000)
+        if duration_second == self._shown_duration_second:
+            return False
         self.duration_label.setText(self.format_time(duration))
+        self._shown_duration_second = duration_second
+        return True
+    
+    def _on_timeline_resized(self, width):
+        """Pixel positions shown so far no longer apply after a resize."""
+        self._shown_band = None
+    
+    def get_update_stats(self):
+        """
+        Get the number of position updates that changed something on screen.
+        
+        Returns:
+            dict: Updates applied and updates skipped because nothing visible changed
+        """
+        return {'applied': self._updates_applied, 'skipped': self._updates_skipped}
+    
+    def reset_update_stats(self):
+        """Reset the position update counters."""
+        self._updates_applied = 0
+        self._updates_skipped = 0
     
     def set_duration(self, duration):
         """Set the maximum duration of the timeline."""
         self.duration = duration
         self.timeline.setRange(0, duration)
-        self.duration_label.setText(self.format_time(duration))
+        self._show_duration(duration)
     
     def update_play_button(self, is_playing):
         """Update the play/pause button icon based on playback state."""
@@ -0,0 +1,186 @@
+import os
+import json
+from PyQt5.QtCore import Qt, QObject
+from PyQt5.QtGui import QKeySequence
+from PyQt5.QtWidgets import (QApplication, QShortcut, QAbstractItemView, QLineEdit,
+                             QAbstractSpinBox, QComboBox, QTextEdit, QPlainTextEdit)
+
+from src.utils import tracing
+from src.utils.file_utils import get_config_dir
+
+log = tracing.get_logger("ui")
+
+# Widgets that use plain keys themselves, for navigation or editing
+INPUT_WIDGETS = (QAbstractItemView, QLineEdit, QAbstractSpinBox, QComboBox,
+                 QTextEdit, QPlainTextEdit)
+
+_COMMAND_MODIFIERS = int(Qt.ControlModifier | Qt.AltModifier | Qt.MetaModifier)
+
+# Action name to the key sequences that trigger it
+DEFAULT_BINDINGS = {
+    'play_pause': ["Space"],
+    'seek_backward': ["Left"],
+    'seek_forward': ["Right"],
+    'volume_up': ["Up"],
+    'volume_down': ["Down"],
+    'toggle_mute': ["M"],
+    'toggle_fullscreen': ["F", "F11"],
+    'exit_fullscreen': ["Escape"],
+    'toggle_playlist': ["L"],
+    'toggle_info': ["I"],
+}
+
+
+def get_bindings_path():
+    """Get the path of the user's key binding file."""
+    return os.path.join(get_config_dir(), "keybindings.json")
+
+
+def load_bindings(path=None):
+    """
+    Load the key bindings: the defaults with the user's overrides applied.
+    
+    The file maps action names to a key sequence or a list of them, in
+    the portable text form QKeySequence understands, e.g.
+    {"seek_forward": ["Right", "Ctrl+Right"], "toggle_info": []}.
+    
+    Args:
+        path (str): Binding file, defaults to the one in the user config dir
+    
+    Returns:
+        dict: Action name to list of key sequence strings
+    """
+    bindings = {name: list(keys) for name, keys in DEFAULT_BINDINGS.items()}
+    path = path or get_bindings_path()
+    try:
+        with open(path, encoding='utf-8') as f:
+            overrides = json.load(f)
+    except FileNotFoundError:
+        return bindings
+    except (OSError, ValueError) as e:
+        log.warning("Ignoring key bindings in %s: %s", path, e)
+        return bindings
+    
+    if not isinstance(overrides, dict):
+        log.warning("Ignoring key bindings in %s: expected an object", path)
+        return bindings
+    for name, keys in overrides.items():
+        if name not in bindings:
+            log.warning("Ignoring key binding for unknown action: %s", name)
+            continue
+        bindings[name] = [keys] if isinstance(keys, str) else [str(key) for key in keys]
+    return bindings
+
+
+def save_bindings(bindings, path=None):
+    """
+    Save the bindings that differ from the defaults.
+    
+    Args:
+        bindings (dict): Action name to list of key sequence strings
+        path (str): Binding file, defaults to the one in the user config dir
+    """
+    overrides = {name: keys for name, keys in bindings.items()
+                 if keys != DEFAULT_BINDINGS.get(name)}
+    with open(path or get_bindings_path(), 'w', encoding='utf-8') as f:
+        json.dump(overrides, f, indent=2)
+
+
+def _is_plain_key(sequence):
+    """Check if a key sequence starts with a key without Ctrl, Alt or Meta that is no function key."""
+    key = sequence[0]
+    if key & _COMMAND_MODIFIERS:
+        return False
+    key &= ~int(Qt.KeyboardModifierMask)
+    return not Qt.Key_F1 <= key <= Qt.Key_F35
+
+
+class KeyBindings(QObject):
+    """
+    Keyboard shortcuts of a window, dispatched from a binding table.
+    
+    Every bound key sequence is a QShortcut scoped to the window, so Qt's
+    shortcut map looks the handler up directly and no event filter ever
+    sees key or other events. Plain keys like arrows, Space and letters
+    are disabled while a list, text input or other input widget has
+    focus, so it keeps them for navigation and editing; this is only
+    checked when the focus changes.
+    """
+    
+    def __init__(self, window, handlers, bindings=None):
+        """
+        Args:
+            window: QWidget whose window the shortcuts are active in
+            handlers (dict): Action name to the callable it triggers
+            bindings (dict): Action name to key sequence strings, defaults
+                             to load_bindings()
+        """
+        super().__init__(window)
+        self.window = window
+        self.handlers = handlers
+        self.bindings = {}
+        self._shortcuts = []
+        self._plain_shortcuts = []
+        self._input_focused = False
+        QApplication.instance().focusChanged.connect(self._on_focus_changed)
+        self.apply(bindings if bindings is not None else load_bindings())
+    
+    def apply(self, bindings):
+        """
+        Replace all shortcuts with the given bindings.
+        
+        Args:
+            bindings (dict): Action name to list of key sequence strings
+        """
+        for shortcut in self._shortcuts:
+            shortcut.setEnabled(False)
+            shortcut.deleteLater()
+        self._shortcuts = []
+        self._plain_shortcuts = []
+        self._input_focused = isinstance(QApplication.focusWidget(), INPUT_WIDGETS)
+        self.bindings = {name: list(keys) for name, keys in bindings.items()}
+        
+        for name, keys in self.bindings.items():
+            handler = self.handlers.get(name)
+            if handler is None:
+                continue
+            for key in keys:
+                sequence = QKeySequence(key)
+                if sequence.isEmpty():
+                    log.warning("Ignoring invalid key sequence for %s: %s", name, key)
+                    continue
+                shortcut = QShortcut(sequence, self.window)
+                shortcut.setContext(Qt.WindowShortcut)
+                shortcut.activated.connect(handler)
+                self._shortcuts.append(shortcut)
+                if _is_plain_key(sequence):
+                    shortcut.setEnabled(not self._input_focused)
+                    self._plain_shortcuts.append(shortcut)
+    
+    def _on_focus_changed(self, old, now):
+        """Give plain keys to input widgets while they have focus."""
+        input_focused = isinstance(now, INPUT_WIDGETS)
+        if input_focused == self._input_focused:
+            return
+        self._input_focused = input_focused
+        for shortcut in self._plain_shortcuts:
+            shortcut.setEnabled(not input_focused)
+    
+    def set_keys(self, name, keys, save=True):
+        """
+        Rebind an action.
+        
+        Args:
+            name (str): Action name
+            keys (list): Key sequence strings, empty to unbind the action
+            save (bool): Store the change in the user's binding file
+        """
+        bindings = dict(self.bindings)
+        bindings[name] = list(keys)
+        self.apply(bindings)
+        if save:
+            save_bindings(self.bindings)
+    
+    def keys_for(self, name):
+        """Get the key sequence strings bound to an action."""
+        return list(self.bindings.get(name, []))
@@ -1,23 +1,30 @@
-from PyQt5.QtCore import Qt, QPoint, QUrl, QEvent
+from PyQt5.QtCore import Qt, QPoint, QUrl
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, QWidget, QFileDialog, 
-                            QMessageBox, QLabel, QListWidget, QListWidgetItem,
-                            QSlider, QPushButton, QFrame, QSplitter, QScrollArea, QComboBox, QSizePolicy,
-                            QLineEdit, QSpinBox)
+                            QMessageBox, QLabel, QListView,
+                            QSlider, QPushButton, QFrame, QSplitter, QScrollArea, QSizePolicy,
+                            QLineEdit, QProgressDialog)
 from .control_bar import ControlBar
 from .video_widget import VideoWidget
 from src.core.media_player import MediaPlayer
 from PyQt5.QtCore import Qt, QSize, QTimer, QPoint, QUrl
 from PyQt5.QtGui import QIcon, QPalette, QColor, QFont, QFontDatabase, QPixmap, QLinearGradient, QGradient
 import os
-import traceback
+import time
 
 from src.core.media_player import MediaPlayer
+from src.core.thumbnail_engine import ThumbnailEngine
 from src.ui.video_widget import VideoWidget
 from src.ui.control_bar import ControlBar
-from src.ui.playlist_widget import PlaylistWidget
-from src.ui.menu_bar import MenuBar
-from src.ui.status_bar import StatusBar
-from src.utils.file_utils import get_asset_path
+from src.ui.playlist_model import PlaylistModel, PlaylistItemDelegate
+from src.ui.key_bindings import KeyBindings
+from src.core.import_worker import ImportWorker
+from src.core.media_library import MediaLibrary, LibraryIndexer
+from src.utils.file_utils import get_asset_path, get_media_file_filter, iter_media_files
+from src.utils import startup_profile, tracing
+from src.utils.playlist_io import (get_playlist_file_filter, is_playlist_file,
+                                   read_playlist, write_playlist)
+
+log = tracing.get_logger("ui")
 
 class TitleBar(QWidget):
     def __init__(self, parent=None):
@@ -115,25 +122,39 @@ class TitleBar(QWidget):
 
 
 class MainWindow(QMainWindow):
+    # Keyboard seek and volume steps
+    SEEK_STEP = 5000
+    VOLUME_STEP = 5
+    
+    # Key presses closer together than this come from a held key
+    KEY_REPEAT_INTERVAL = 0.1
+    
+    # Seconds between fullscreen control bar reveals
+    REVEAL_INTERVAL = 0.25
+    
     def showEvent(self, event):
-        print(f"MainWindow show event triggered. Window visible: {self.isVisible()}")
         super().showEvent(event)
-        print(f"After showEvent. Window visible: {self.isVisible()}")
-    
-    def paintEvent(self, event):
-        print(f"MainWindow paint event. Visible: {self.isVisible()}, Size: {self.size()}")
-        super().paintEvent(event)
+        
+        # Suspend position updates while the window is minimized or covered
+        if hasattr(self, 'media_player'):
+            self.media_player.watch_window(self.windowHandle())
     
-    def __init__(self):
+    def __init__(self, stall_watchdog=None):
+        """
+        Args:
+            stall_watchdog (StallWatchdog): Watchdog whose stalls the
+                                            stall report shows, if any
+        """
         try:
             super().__init__()
-            print("Initializing MainWindow...")
+            log.info("Initializing main window")
             
             # Set focus policy to ensure we can receive keyboard events
             self.setFocusPolicy(Qt.StrongFocus)
             
-            # Install event filter to capture key events globally
-            QApplication.instance().installEventFilter(self)
+            # Accept dropped files and folders
+            self.setAcceptDrops(True)
+            self._import_workers = set()
             
             # Ensure we can receive keyboard events
             self.setAttribute(Qt.WA_KeyCompression, False)
@@ -141,8 +162,8 @@ class MainWindow(QMainWindow):
             
             # Debug information
             primary_screen = QApplication.primaryScreen()
-            print(f"Primary screen: {primary_screen.name() if primary_screen else 'None'}")
-            print(f"Screens available: {[screen.name() for screen in QApplication.screens()]}")
+            log.debug("Primary screen: %s", primary_screen.name() if primary_screen else None)
+            log.debug("Screens available: %s", [screen.name() for screen in QApplication.screens()])
             
             # Set window properties with default flags
             self.setWindowTitle("OnaPlay")
@@ -151,20 +172,7 @@ class MainWindow(QMainWindow):
             self.setMinimumSize(1200, 700)
             self.resize(1280, 800)
             
-            # Set window style
-            self.setStyleSheet("""
-                QMainWindow {
-                    background-color: #1e1e1e;
-                }
-                
-                QWidget {
-                    color: #ffffff;
-                    font-family: Arial, sans-serif;
-                }
-            """)
-            
-            # Load and apply stylesheet
-            self.load_stylesheet()
+            # The stylesheet is applied once, application wide, by main.py
             
             # Create main container
             self.main_widget = QWidget()
@@ -176,6 +184,10 @@ class MainWindow(QMainWindow):
             # Add menu bar
             self.menu_bar = self.menuBar()
             
+            # Event loop stalls are listed in a report built on first show
+            self.stall_watchdog = stall_watchdog
+            self.stall_dialog = None
+            
             # Create menus
             self.setup_menus()
             
@@ -188,46 +200,62 @@ class MainWindow(QMainWindow):
             if os.path.exists(icon_path):
                 self.setWindowIcon(QIcon(icon_path))
             
-            # Initialize media player
-            print("Initializing media player...")
+            # Initialize media player; VLC itself is created in the background
+            log.debug("Initializing media player")
             self.media_player = MediaPlayer()
+            startup_profile.mark("media player")
+            
+            # Timeline preview thumbnails are decoded in the background
+            self.thumbnail_engine = ThumbnailEngine(parent=self)
+            self._hover_bucket = -1
+            
+            # Searchable library of every file that was imported or played
+            self.library = MediaLibrary()
+            self.library_indexer = LibraryIndexer(
+                self.library, None, self.media_player.metadata_cache, parent=self)
+            self.library_indexer.prune()
+            self.media_player.ready.connect(self.on_player_ready)
+            
+            # Playlist entries; the playlist panel itself is built on first show
+            self.playlist_model = PlaylistModel(self)
+            self.search_model = PlaylistModel(self)
+            self.playlist = None
+            self.playlist_widget = None
+            
+            # Media information shown in the info panel once it is built
+            self.info_panel = None
+            self.info_widgets = {}
+            self._last_media_info = {}
+            
+            # Search runs once typing pauses
+            self._search_timer = QTimer(self)
+            self._search_timer.setSingleShot(True)
+            self._search_timer.setInterval(150)
+            self._search_timer.timeout.connect(self.run_library_search)
             
             # Initialize UI components
-            print("Setting up UI...")
+            log.debug("Setting up UI")
             self.setup_ui()
+            startup_profile.mark("main window ui")
             
             # Connect signals
-            print("Setting up connections...")
+            log.debug("Setting up connections")
             self.setup_connections()
+            self.setup_key_bindings()
+            startup_profile.mark("connections")
             
-            print("MainWindow initialized successfully")
+            log.info("Main window initialized")
             
             # Show window
             self.show()
         except Exception as e:
-            print(f"Error initializing MainWindow: {str(e)}")
-            traceback.print_exc()
+            log.exception("Error initializing MainWindow: %s", e)
             raise
     
-    def load_stylesheet(self):
-        """Load and apply the stylesheet."""
-        style_path = get_asset_path("styles/dark_theme.qss")
-        print(f"Loading stylesheet from: {style_path}")
-        if os.path.exists(style_path):
-            try:
-                with open(style_path, 'r') as f:
-                    style = f.read()
-                    print(f"Stylesheet loaded successfully, length: {len(style)} characters")
-                    self.setStyleSheet(style)
-            except Exception as e:
-                print(f"Error loading stylesheet: {e}")
-        else:
-            print("Stylesheet file not found")
-    
     def setup_ui(self):
         """Initialize the main window UI components."""
         try:
-            print("Setting up main UI...")
+            log.debug("Setting up main UI")
             
             # Create main content area
             self.content_widget = QWidget()
@@ -250,10 +278,8 @@ class MainWindow(QMainWindow):
             # Create control bar
             self.control_bar = ControlBar()
             
-            # Create info panel (hidden by default)
-            self.info_panel = self.create_info_panel()
+            # The info panel is hidden by default and built on first show
             self.info_visible = False
-            self.info_panel.hide()  # Hide by default
             
             # Add widgets to video container
             self.video_layout.addWidget(self.video_widget, 1)
@@ -262,30 +288,23 @@ class MainWindow(QMainWindow):
             # Create splitter for video and playlist
             self.splitter = QSplitter(Qt.Horizontal)
             
-            # Create playlist
-            self.playlist_widget = self.create_playlist()
-            
-            # Add widgets to splitter
+            # Add widgets to splitter; the playlist joins it on first show
             self.splitter.addWidget(self.video_container)
-            self.splitter.addWidget(self.playlist_widget)
             self.splitter.setStretchFactor(0, 3)
-            self.splitter.setStretchFactor(1, 1)
             
             # Add splitter to content layout
             self.content_layout.addWidget(self.splitter, 1)
             
             # Hide playlist by default
             self.playlist_visible = False
-            self.toggle_playlist_visibility()
             
             # Add content to main layout
             self.main_layout.addWidget(self.content_widget, 1)
             
-            print("UI setup completed")
+            log.debug("UI setup completed")
             
         except Exception as e:
-            print(f"Error setting up UI: {str(e)}")
-            traceback.print_exc()
+            log.exception("Error setting up UI: %s", e)
             raise
     
     def create_playlist(self):
@@ -310,11 +329,20 @@ class MainWindow(QMainWindow):
         search_btn.setFlat(True)
         search_btn.setFixedSize(24, 24)
         search_btn.setObjectName("playlistSearchBtn")
+        search_btn.clicked.connect(self.toggle_library_search)
         
         header_layout.addWidget(title)
         header_layout.addStretch()
         header_layout.addWidget(search_btn)
         
+        # Library search box, hidden until the search button is clicked
+        self.search_edit = QLineEdit()
+        self.search_edit.setObjectName("playlistSearch")
+        self.search_edit.setPlaceholderText("Search library...")
+        self.search_edit.setClearButtonEnabled(True)
+        self.search_edit.textChanged.connect(self.on_search_text_changed)
+        self.search_edit.hide()
+        
         # Playlist tools
         tools = QWidget()
         tools.setObjectName("playlistTools")
@@ -328,20 +356,21 @@ class MainWindow(QMainWindow):
             btn.setFixedSize(24, 24)
             tools_layout.addWidget(btn)
         
-        # Playlist content
-        self.playlist = QListWidget()
+        # Playlist content; only the visible rows are ever painted
+        self.playlist = QListView()
         self.playlist.setObjectName("playlist")
+        self.playlist.setModel(self.playlist_model)
+        self.playlist.setItemDelegate(PlaylistItemDelegate(self.playlist))
+        self.playlist.setUniformItemSizes(True)
         self.playlist.setAlternatingRowColors(True)
-        self.playlist.setVerticalScrollMode(QListWidget.ScrollPerPixel)
-        
-        # Add sample items
-        for i in range(10):
-            item = QListWidgetItem(f"Media File {i+1}.mp4")
-            item.setData(Qt.UserRole, f"path/to/media_{i+1}.mp4")
-            self.playlist.addItem(item)
+        self.playlist.setSelectionMode(QListView.SingleSelection)
+        self.playlist.setEditTriggers(QListView.NoEditTriggers)
+        self.playlist.setVerticalScrollMode(QListView.ScrollPerPixel)
+        self.playlist.doubleClicked.connect(self.playlist_item_double_clicked)
         
         # Add widgets to layout
         layout.addWidget(header)
+        layout.addWidget(self.search_edit)
         layout.addWidget(tools)
         layout.addWidget(self.playlist)
         
@@ -415,11 +444,6 @@ class MainWindow(QMainWindow):
         layout.addWidget(tabs)
         layout.addWidget(self.info_content, 1)
         
-        # Connect media player signals
-        if hasattr(self, 'media_player'):
-            self.media_player.media_changed.connect(self.update_media_info)
-            self.media_player.media_changed.connect(self.on_media_changed)
-        
         return panel
         
     def on_media_changed(self, media_info):
@@ -436,10 +460,72 @@ class MainWindow(QMainWindow):
                 self.video_widget.set_aspect_ratio(width, height)
             except (ValueError, AttributeError):
                 pass  # Use default aspect ratio if resolution parsing fails
+        
+        # Fill in the playlist duration of the entry
+        path = media_info.get('path')
+        row = self.playlist_model.row_of(path) if path else -1
+        if row >= 0 and media_info.get('duration'):
+            self.playlist_model.set_duration(row, int(media_info['duration']))
+        
+        # Timeline previews are only extracted from local files
+        if path and '://' not in path:
+            self.thumbnail_engine.set_media(path, media_info.get('duration') or 0)
+            self.library_indexer.update(path, media_info)
+        else:
+            self.thumbnail_engine.set_media(None, 0)
+    
+    def toggle_library_search(self):
+        """Show or hide the library search box."""
+        self.ensure_playlist_panel()
+        if self.search_edit.isVisible():
+            self.search_edit.clear()
+            self.search_edit.hide()
+        else:
+            if not self.playlist_visible:
+                self.toggle_playlist_visibility()
+            self.search_edit.show()
+            self.search_edit.setFocus()
+    
+    def on_search_text_changed(self, text):
+        """Restart the search debounce, or go back to the playlist when cleared."""
+        if text.strip():
+            self._search_timer.start()
+        else:
+            self._search_timer.stop()
+            self.playlist.setModel(self.playlist_model)
+    
+    def run_library_search(self):
+        """Show the library entries matching the search box in the playlist view."""
+        try:
+            results = self.library.search(self.search_edit.text())
+        except Exception as e:
+            log.error("Error searching library: %s", e)
+            results = []
+        
+        self.search_model.clear()
+        if results:
+            paths, durations = zip(*results)
+            self.search_model.add_paths(paths, durations)
+        self.playlist.setModel(self.search_model)
+    
+    def on_timeline_hover(self, time_ms):
+        """Request a preview thumbnail for the hovered timeline position."""
+        self._hover_bucket = self.thumbnail_engine.request(time_ms)
+    
+    def on_timeline_hover_left(self):
+        """Cancel preview requests when the cursor leaves the timeline."""
+        self._hover_bucket = -1
+        self.thumbnail_engine.cancel()
+    
+    def on_thumbnail_ready(self, bucket, image):
+        """Show a preview thumbnail if it matches the hovered position."""
+        if bucket == self._hover_bucket:
+            self.control_bar.timeline.show_thumbnail(image)
             
     def update_media_info(self, media_info):
         """Update the media information display."""
-        if not hasattr(self, 'info_widgets') or not self.info_widgets:
+        self._last_media_info = media_info
+        if not self.info_widgets:
             return
             
         # Update each field if it exists in the provided media_info
@@ -480,9 +566,16 @@ class MainWindow(QMainWindow):
         # Add actions to File menu
         self.open_file_action = file_menu.addAction("&Open File...")
         self.open_file_action.setShortcut("Ctrl+O")
+        self.open_folder_action = file_menu.addAction("Open &Folder...")
+        self.open_folder_action.setShortcut("Ctrl+Shift+O")
         self.open_url_action = file_menu.addAction("Open &URL...")
         self.open_url_action.setShortcut("Ctrl+U")
         file_menu.addSeparator()
+        self.open_playlist_action = file_menu.addAction("Open &Playlist...")
+        self.open_playlist_action.setShortcut("Ctrl+L")
+        self.save_playlist_action = file_menu.addAction("&Save Playlist As...")
+        self.save_playlist_action.setShortcut("Ctrl+S")
+        file_menu.addSeparator()
         self.exit_action = file_menu.addAction("E&xit")
         self.exit_action.setShortcut("Alt+F4")
         
@@ -492,52 +585,164 @@ class MainWindow(QMainWindow):
         self.toggle_playlist_action.setCheckable(True)
         self.toggle_playlist_action.setChecked(False)
         self.toggle_playlist_action.triggered.connect(self.toggle_playlist_visibility)
+        self.search_library_action = view_menu.addAction("&Search Library")
+        self.search_library_action.setShortcut("Ctrl+F")
+        self.search_library_action.triggered.connect(self.toggle_library_search)
+        view_menu.addSeparator()
+        self.stall_report_action = view_menu.addAction("S&tall Report...")
+        self.stall_report_action.setEnabled(self.stall_watchdog is not None)
+        self.stall_report_action.triggered.connect(self.show_stall_report)
     
     def setup_connections(self):
         """Connect signals and slots."""
         try:
-            print("Setting up connections...")
+            log.debug("Setting up connections")
             
             # Connect control bar signals
             self.control_bar.play_pressed.connect(self.media_player.play_pause)
             self.control_bar.stop_pressed.connect(self.media_player.stop)
+            self.control_bar.previous_pressed.connect(self.play_previous)
+            self.control_bar.next_pressed.connect(self.play_next)
+            self.media_player.current_media_changed.connect(self.on_current_media_changed)
+            
+            # Keep the next entry preloaded as the playlist changes
+            for signal in (self.playlist_model.rowsInserted, self.playlist_model.rowsRemoved,
+                           self.playlist_model.rowsMoved, self.playlist_model.modelReset):
+                signal.connect(self.preload_next)
             self.control_bar.volume_changed.connect(self.media_player.set_volume)
             self.control_bar.seek_requested.connect(self.media_player.seek)
+            self.control_bar.scrub_requested.connect(
+                lambda position: self.media_player.seek(position, exact=False))
             self.control_bar.info_toggled.connect(self.toggle_info_panel)
             self.control_bar.playlist_toggled.connect(self.toggle_playlist_visibility)
             
+            self.control_bar.timeline.width_changed.connect(self.media_player.set_timeline_width)
+            self.control_bar.timeline.hover_time_changed.connect(self.on_timeline_hover)
+            self.control_bar.timeline.hover_left.connect(self.on_timeline_hover_left)
+            self.thumbnail_engine.thumbnail_ready.connect(self.on_thumbnail_ready)
+            self.video_widget.mouse_moved.connect(self.on_video_mouse_moved)
+            
             # Connect media player signals
             self.media_player.position_changed.connect(self.control_bar.update_position)
             self.media_player.duration_changed.connect(self.control_bar.set_duration)
             self.media_player.state_changed.connect(self.control_bar.update_play_button)
             
-            # Connect playlist signals
-            self.playlist.itemDoubleClicked.connect(self.playlist_item_double_clicked)
+            self.media_player.media_changed.connect(self.update_media_info)
+            self.media_player.media_changed.connect(self.on_media_changed)
             
             # Connect menu actions
             self.open_file_action.triggered.connect(self.open_file)
+            self.open_folder_action.triggered.connect(self.open_folder)
+            self.open_playlist_action.triggered.connect(self.open_playlist)
+            self.save_playlist_action.triggered.connect(self.save_playlist)
             self.open_url_action.triggered.connect(self.open_url)
             self.exit_action.triggered.connect(self.close)
             
-            print("Connections set up successfully")
+            log.debug("Connections set up")
             
         except Exception as e:
-            print(f"Error setting up connections: {str(e)}")
-            traceback.print_exc()
+            log.exception("Error setting up connections: %s", e)
+    
+    def setup_key_bindings(self):
+        """Bind the keyboard shortcuts of the player window."""
+        # Keys held down repeat faster than this; repeats seek fast
+        self._last_seek_key = 0.0
+        self._seek_settle_timer = QTimer(self)
+        self._seek_settle_timer.setSingleShot(True)
+        self._seek_settle_timer.setInterval(150)
+        self._seek_settle_timer.timeout.connect(self._finish_key_seek)
+        self._last_reveal = 0.0
+        
+        actions = {
+            'play_pause': self.media_player.play_pause,
+            'seek_backward': lambda: self._seek_by_key(-self.SEEK_STEP),
+            'seek_forward': lambda: self._seek_by_key(self.SEEK_STEP),
+            'volume_up': lambda: self.change_volume(self.VOLUME_STEP),
+            'volume_down': lambda: self.change_volume(-self.VOLUME_STEP),
+            'toggle_mute': self.media_player.toggle_mute,
+        }
+        handlers = {name: self._revealing(action) for name, action in actions.items()}
+        handlers.update({
+            'toggle_fullscreen': self.toggle_fullscreen,
+            'exit_fullscreen': self.exit_fullscreen,
+            'toggle_playlist': self.toggle_playlist_visibility,
+            'toggle_info': self.toggle_info_panel,
+        })
+        self.key_bindings = KeyBindings(self, handlers)
+    
+    def _revealing(self, action):
+        """Wrap a playback action so it also reveals the fullscreen controls."""
+        def handler():
+            action()
+            self.reveal_controls()
+        return handler
     
-    def playlist_item_double_clicked(self, item):
+    def _seek_by_key(self, offset):
+        """
+        Seek relative to the current position from the keyboard.
+        
+        While the key is held down the repeats seek fast, and one exact
+        seek follows once they stop.
+        """
+        now = time.monotonic()
+        held = now - self._last_seek_key < self.KEY_REPEAT_INTERVAL
+        self._last_seek_key = now
+        self.media_player.seek_relative(offset, exact=not held)
+        if held:
+            self._seek_settle_timer.start()
+    
+    def _finish_key_seek(self):
+        """Land exactly where a held seek key stopped."""
+        self.media_player.seek(self.media_player.get_time())
+    
+    def change_volume(self, delta):
+        """Change the volume by the given amount."""
+        self.media_player.set_volume(self.media_player.get_volume() + delta)
+    
+    def on_current_media_changed(self, path):
+        """Select the playing entry and preload the one after it."""
+        row = self.playlist_model.row_of(path)
+        if row >= 0 and self.playlist is not None and self.playlist.model() is self.playlist_model:
+            self.playlist.setCurrentIndex(self.playlist_model.index(row))
+        self.preload_next()
+    
+    def preload_next(self, *args):
+        """Preload the playlist entry after the current one for gapless playback."""
+        row = self.playlist_model.row_of(self.media_player.current_path)
+        if row >= 0 and row + 1 < self.playlist_model.rowCount():
+            self.media_player.set_next(self.playlist_model.path(row + 1))
+        else:
+            self.media_player.set_next(None)
+    
+    def play_next(self):
+        """Play the next playlist entry, using the preloaded media when possible."""
+        if self.media_player.play_next():
+            return
+        row = self.playlist_model.row_of(self.media_player.current_path)
+        if 0 <= row + 1 < self.playlist_model.rowCount():
+            self.media_player.load(self.playlist_model.path(row + 1))
+    
+    def play_previous(self):
+        """Restart the current entry, or play the previous one near its start."""
+        if self.media_player.get_time() > 3000:
+            self.media_player.seek(0)
+            return
+        row = self.playlist_model.row_of(self.media_player.current_path)
+        if row > 0:
+            self.media_player.load(self.playlist_model.path(row - 1))
+    
+    def playlist_item_double_clicked(self, index):
         """Handle double click on playlist item."""
-        file_path = item.data(Qt.UserRole)
-        if file_path and os.path.exists(file_path):
+        file_path = index.data(PlaylistModel.PathRole)
+        if file_path and ('://' in file_path or os.path.exists(file_path)):
             self.media_player.load(file_path)
-            self.media_player.play()
     
     def open_file(self):
         """Open a file dialog to select media files."""
         try:
             file_dialog = QFileDialog(self)
             file_dialog.setFileMode(QFileDialog.ExistingFiles)
-            file_dialog.setNameFilter("Media Files (*.mp4 *.avi *.mkv *.mp3 *.wav)")
+            file_dialog.setNameFilter(get_media_file_filter())
             
             if file_dialog.exec_():
                 file_paths = file_dialog.selectedFiles()
@@ -545,21 +750,181 @@ class MainWindow(QMainWindow):
                     self.media_player.load(file_paths[0])
                     
                     # Add to playlist if not already there
-                    for path in file_paths:
-                        exists = False
-                        for i in range(self.playlist.count()):
-                            if self.playlist.item(i).data(Qt.UserRole) == path:
-                                exists = True
-                                break
-                        
-                        if not exists:
-                            item = QListWidgetItem(os.path.basename(path))
-                            item.setData(Qt.UserRole, path)
-                            self.playlist.addItem(item)
+                    self.playlist_model.add_paths(file_paths)
+                    self.library_indexer.add_paths(file_paths)
         
         except Exception as e:
-            print(f"Error opening file: {str(e)}")
-            traceback.print_exc()
+            log.exception("Error opening file: %s", e)
+    
+    def open_paths(self, paths, enqueue=False):
+        """
+        Open files, folders, playlists and URLs, e.g. from the command line.
+        
+        Args:
+            paths (list): Absolute local paths and URLs
+            enqueue (bool): Only add to the playlist instead of playing the first entry
+        """
+        imports = [path for path in paths if os.path.isdir(path) or is_playlist_file(path)]
+        entries = [path for path in paths
+                   if path not in imports and ('://' in path or os.path.isfile(path))]
+        
+        if entries:
+            self.playlist_model.add_paths(entries)
+            self.library_indexer.add_paths(entries)
+            if not enqueue:
+                self.media_player.load(entries[0])
+        if imports:
+            self.import_paths(imports)
+    
+    def on_remote_open(self, paths, enqueue):
+        """Handle arguments handed over by a later launch of the application."""
+        self.open_paths(paths, enqueue)
+        if not enqueue:
+            if self.isMinimized():
+                self.showNormal()
+            self.raise_()
+            self.activateWindow()
+    
+    def open_folder(self):
+        """Open a directory dialog and import all media files below it."""
+        try:
+            directory = QFileDialog.getExistingDirectory(self, "Open Folder")
+            if directory:
+                self.import_paths([directory])
+        
+        except Exception as e:
+            log.exception("Error opening folder: %s", e)
+    
+    def import_paths(self, paths):
+        """
+        Import files and folders into the playlist on a worker thread.
+        
+        Folders are walked recursively; the playlist fills in batches while
+        the import runs and a progress dialog allows cancelling it.
+        
+        Args:
+            paths (list): Local files and/or directories
+        """
+        paths = list(paths)
+        playlists = [path for path in paths if is_playlist_file(path)]
+        media = [path for path in paths if not is_playlist_file(path)]
+        
+        for playlist_path in playlists:
+            self.import_playlist(playlist_path)
+        if media:
+            self._start_import(
+                lambda worker: iter_media_files(media, worker.is_cancelled, worker.report_scan,
+                                                with_stat=True),
+                self._add_imported_files)
+    
+    def import_playlist(self, file_path):
+        """
+        Append the entries of a playlist file on a worker thread.
+        
+        The playlist is parsed incrementally, so even very large playlists
+        load with flat memory while the playlist view fills in batches.
+        
+        Args:
+            file_path (str): Path of an M3U, M3U8, PLS or XSPF playlist
+        """
+        self._start_import(lambda worker: read_playlist(file_path), self._add_playlist_entries)
+    
+    def _start_import(self, source, on_batch):
+        """Run an ImportWorker over source with a cancellable progress dialog."""
+        worker = ImportWorker(source, parent=self)
+        
+        progress = QProgressDialog("Importing media...", "Cancel", 0, 0, self)
+        progress.setWindowTitle("Import")
+        progress.setWindowModality(Qt.NonModal)
+        progress.setMinimumDuration(500)
+        progress.canceled.connect(worker.cancel)
+        
+        # Files found, and entries scanned by sources that report it
+        counts = {'found': 0, 'scanned': None}
+        
+        def show_progress(**changed):
+            counts.update(changed)
+            text = f"Importing media... {counts['found']} files found"
+            if counts['scanned'] is not None:
+                text += f", {counts['scanned']} entries scanned"
+            progress.setLabelText(text)
+        
+        worker.batch_ready.connect(on_batch)
+        worker.progress.connect(lambda count: show_progress(found=count))
+        worker.scan_progress.connect(
+            lambda directories, entries: show_progress(scanned=entries))
+        worker.import_finished.connect(
+            lambda total, cancelled: self._on_import_finished(worker, progress, total, cancelled))
+        
+        self._import_workers.add(worker)
+        worker.start()
+    
+    def _add_imported_files(self, files):
+        """Append a batch of imported (path, stat) files to the playlist and the library."""
+        paths, stats = zip(*files)
+        self.playlist_model.add_paths(paths)
+        self.library_indexer.add_paths(paths, stats)
+    
+    def _add_playlist_entries(self, entries):
+        """Append a batch of (location, duration) playlist entries."""
+        paths, durations = zip(*entries)
+        self.playlist_model.add_paths(paths, durations)
+        self.library_indexer.add_paths(paths)
+    
+    def _on_import_finished(self, worker, progress, total, cancelled):
+        """Clean up after an import has finished or was cancelled."""
+        progress.close()
+        progress.deleteLater()
+        self._import_workers.discard(worker)
+        worker.wait()
+        worker.deleteLater()
+        
+        if not self.playlist_visible and total > 0:
+            self.toggle_playlist_visibility()
+    
+    def open_playlist(self):
+        """Open a file dialog to load a playlist file."""
+        try:
+            file_path, _ = QFileDialog.getOpenFileName(
+                self, "Open Playlist", "", get_playlist_file_filter())
+            if file_path:
+                self.import_playlist(file_path)
+        
+        except Exception as e:
+            log.exception("Error opening playlist: %s", e)
+    
+    def save_playlist(self):
+        """Save the playlist to an M3U, PLS or XSPF file."""
+        try:
+            file_path, _ = QFileDialog.getSaveFileName(
+                self, "Save Playlist", "playlist.m3u8", get_playlist_file_filter())
+            if not file_path:
+                return
+            if not is_playlist_file(file_path):
+                file_path += ".m3u8"
+            
+            # Entries are streamed straight from the model to the file
+            write_playlist(file_path, self.playlist_model.entries())
+        
+        except Exception as e:
+            log.exception("Error saving playlist: %s", e)
+            QMessageBox.warning(self, "Save Playlist", f"Could not save the playlist:\n{e}")
+    
+    def dragEnterEvent(self, event):
+        """Accept drags carrying local files or folders."""
+        if event.mimeData().hasUrls():
+            event.acceptProposedAction()
+        else:
+            super().dragEnterEvent(event)
+    
+    def dropEvent(self, event):
+        """Import dropped files and folders into the playlist."""
+        paths = [url.toLocalFile() for url in event.mimeData().urls() if url.isLocalFile()]
+        if paths:
+            self.import_paths(paths)
+            event.acceptProposedAction()
+        else:
+            super().dropEvent(event)
     
     def open_url(self):
         """Open a dialog to enter a media URL."""
@@ -577,16 +942,28 @@ class MainWindow(QMainWindow):
                 self.media_player.load(url)
                 
                 # Add to playlist
-                item = QListWidgetItem(url)
-                item.setData(Qt.UserRole, url)
-                self.playlist.addItem(item)
+                self.playlist_model.add_path(url)
         
         except Exception as e:
-            print(f"Error opening URL: {str(e)}")
-            traceback.print_exc()
+            log.exception("Error opening URL: %s", e)
+    
+    def on_player_ready(self):
+        """Start library indexing once VLC has been created in the background."""
+        if self.media_player.is_ready():
+            self.library_indexer.set_instance(self.media_player.instance)
+    
+    def ensure_playlist_panel(self):
+        """Build the playlist panel the first time it is needed."""
+        if self.playlist_widget is None:
+            self.playlist_widget = self.create_playlist()
+            self.playlist_widget.setVisible(False)
+            self.splitter.addWidget(self.playlist_widget)
+            self.splitter.setStretchFactor(1, 1)
+            self.on_current_media_changed(self.media_player.current_path)
     
     def toggle_playlist_visibility(self):
         """Toggle the visibility of the playlist."""
+        self.ensure_playlist_panel()
         self.playlist_visible = not self.playlist_visible
         self.playlist_widget.setVisible(self.playlist_visible)
         self.toggle_playlist_action.setChecked(self.playlist_visible)
@@ -594,6 +971,10 @@ class MainWindow(QMainWindow):
     def toggle_info_panel(self):
         """Toggle the visibility of the info panel."""
         self.info_visible = not self.info_visible
+        if self.info_panel is None:
+            self.info_panel = self.create_info_panel()
+            if self._last_media_info:
+                self.update_media_info(self._last_media_info)
         if self.info_visible:
             self.info_panel.show()
             self.video_layout.addWidget(self.info_panel)
@@ -607,81 +988,36 @@ class MainWindow(QMainWindow):
             total = sum(sizes) if sizes else self.width()
             self.splitter.setSizes([int(total * 0.75), int(total * 0.25)])
     
+    def show_stall_report(self):
+        """Show the event loop stalls recorded by the watchdog."""
+        if self.stall_watchdog is None:
+            return
+        if self.stall_dialog is None:
+            from src.ui.stall_report import StallReportDialog
+            self.stall_dialog = StallReportDialog(self.stall_watchdog, self)
+        self.stall_dialog.show()
+        self.stall_dialog.raise_()
+        self.stall_dialog.activateWindow()
+    
     def closeEvent(self, event):
         """Handle window close event."""
         try:
-            # Save window state
-            # TODO: Save window geometry, playlist, etc.
-            
-            # Clean up resources
+            # Clean up resources. Import sources check for cancellation at
+            # least every few hundred entries, so waiting returns soon; a
+            # QThread must not be destroyed while it is still running.
+            for worker in list(self._import_workers):
+                worker.cancel()
+                worker.wait()
+            self.thumbnail_engine.shutdown()
+            self.library_indexer.shutdown()
+            self.library.close()
             self.media_player.cleanup()
             event.accept()
             
         except Exception as e:
-            print(f"Error during close: {str(e)}")
-            traceback.print_exc()
+            log.exception("Error during close: %s", e)
             event.accept()
     
-    def eventFilter(self, obj, event):
-        """Global event filter to handle key events."""
-        if event.type() == QEvent.KeyPress:
-            # Don't handle key events when a text input widget has focus
-            if isinstance(obj, (QLineEdit, QComboBox)):
-                return super().eventFilter(obj, event)
-                
-            key = event.key()
-            
-            # Space: Play/Pause
-            if key == Qt.Key_Space and not isinstance(obj, QLineEdit):
-                self.media_player.play_pause()
-                return True
-                
-            # Left/Right arrows: Seek backward/forward 5 seconds
-            if key == Qt.Key_Left and not isinstance(obj, (QLineEdit, QSpinBox, QComboBox)):
-                self.media_player.seek(self.media_player.get_time() - 5000)  # Rewind 5s
-                return True
-            if key == Qt.Key_Right and not isinstance(obj, (QLineEdit, QSpinBox, QComboBox)):
-                self.media_player.seek(self.media_player.get_time() + 5000)  # Forward 5s
-                return True
-                
-            # Up/Down arrows: Volume up/down
-            if key == Qt.Key_Up and not isinstance(obj, (QLineEdit, QSpinBox, QComboBox)):
-                current_vol = self.media_player.get_volume()
-                self.media_player.set_volume(min(100, current_vol + 5))
-                return True
-            if key == Qt.Key_Down and not isinstance(obj, (QLineEdit, QSpinBox, QComboBox)):
-                current_vol = self.media_player.get_volume()
-                self.media_player.set_volume(max(0, current_vol - 5))
-                return True
-                
-            # F: Toggle fullscreen
-            if key == Qt.Key_F and not isinstance(obj, QLineEdit):
-                self.toggle_fullscreen()
-                return True
-                
-            # M: Mute/unmute
-            if key == Qt.Key_M and not isinstance(obj, QLineEdit):
-                self.media_player.toggle_mute()
-                return True
-                
-            # L: Toggle playlist
-            if key == Qt.Key_L and not isinstance(obj, QLineEdit):
-                self.toggle_playlist_visibility()
-                return True
-                
-            # I: Toggle info panel
-            if key == Qt.Key_I and not isinstance(obj, QLineEdit):
-                self.toggle_info_panel()
-                return True
-                
-            # Escape: Exit fullscreen
-            if key == Qt.Key_Escape and self.isFullScreen():
-                self.showNormal()
-                return True
-                
-        # Let other events be handled normally
-        return super().eventFilter(obj, event)
-    
     def toggle_fullscreen(self):
         """Toggle fullscreen mode."""
         if self.isFullScreen():
@@ -709,126 +1045,37 @@ class MainWindow(QMainWindow):
         # Update video widget geometry after toggling fullscreen
         QTimer.singleShot(100, self._update_video_geometry)
     
-    def eventFilter(self, obj, event):
-        """Global event filter to handle key events and mouse movements in fullscreen."""
-        # Handle mouse movements in fullscreen
-        if event.type() == QEvent.MouseMove and self.isFullScreen():
-            # Show control bar if mouse is near the bottom of the screen
-            mouse_pos = event.pos()
-            if mouse_pos.y() >= self.height() - 100:  # 100px from bottom
-                self.control_bar.show()
-                self.control_bar.raise_()
-                self.control_bar._start_auto_hide_timer()
-            # Hide control bar if mouse is near the top of the screen
-            elif mouse_pos.y() <= 20 and not self.control_bar.underMouse():
-                self.control_bar.hide()
-        
-        # Handle key events
-        if event.type() == QEvent.KeyPress:
-            # Don't handle key events when a text input widget has focus
-            if isinstance(obj, (QLineEdit, QComboBox, QSpinBox)):
-                return super().eventFilter(obj, event)
-            
-            # Only process key events for the main window, video widget, or control bar
-            if obj not in [self, self.video_widget, self.control_bar]:
-                return super().eventFilter(obj, event)
-            
-            # Don't process key events with modifiers (like Ctrl+Left, etc.)
-            if event.modifiers() != Qt.NoModifier:
-                return super().eventFilter(obj, event)
-                
-            key = event.key()
-            
-            # Space: Play/Pause
-            if key == Qt.Key_Space:
-                self.media_player.play_pause()
-                # Show control bar when using space to play/pause
-                if self.isFullScreen():
-                    self.control_bar.show()
-                    self.control_bar.raise_()
-                    self.control_bar._start_auto_hide_timer()
-                return True
-            
-            # F key or F11: Toggle fullscreen
-            if key in (Qt.Key_F, Qt.Key_F11):
-                self.toggle_fullscreen()
-                return True
-                
-            # Left/Right arrows: Seek backward/forward 5 seconds
-            if key == Qt.Key_Left:
-                self.media_player.seek(self.media_player.get_time() - 5000)  # Rewind 5s
-                if self.isFullScreen():
-                    self.control_bar.show()
-                    self.control_bar.raise_()
-                    self.control_bar._start_auto_hide_timer()
-                event.accept()
-                return True
-                
-            if key == Qt.Key_Right:
-                self.media_player.seek(self.media_player.get_time() + 5000)  # Forward 5s
-                if self.isFullScreen():
-                    self.control_bar.show()
-                    self.control_bar.raise_()
-                    self.control_bar._start_auto_hide_timer()
-                event.accept()
-                return True
-                
-            # Up/Down arrows: Volume up/down
-            if key == Qt.Key_Up:
-                current_vol = self.media_player.get_volume()
-                self.media_player.set_volume(min(100, current_vol + 5))
-                if self.isFullScreen():
-                    self.control_bar.show()
-                    self.control_bar.raise_()
-                    self.control_bar._start_auto_hide_timer()
-                event.accept()
-                return True
-                
-            if key == Qt.Key_Down:
-                current_vol = self.media_player.get_volume()
-                self.media_player.set_volume(max(0, current_vol - 5))
-                if self.isFullScreen():
-                    self.control_bar.show()
-                    self.control_bar.raise_()
-                    self.control_bar._start_auto_hide_timer()
-                event.accept()
-                return True
-                
-            # M key: Toggle mute
-            if key == Qt.Key_M:
-                self.media_player.toggle_mute()
-                if self.isFullScreen():
-                    self.control_bar.show()
-                    self.control_bar.raise_()
-                    self.control_bar._start_auto_hide_timer()
-                return True
-                
-            # F: Toggle fullscreen
-            if key == Qt.Key_F and not isinstance(obj, QLineEdit):
-                self.toggle_fullscreen()
-                return True
-                
-            # M: Mute/unmute
-            if key == Qt.Key_M and not isinstance(obj, QLineEdit):
-                self.media_player.toggle_mute()
-                return True
-                
-            # L: Toggle playlist
-            if key == Qt.Key_L and not isinstance(obj, QLineEdit):
-                self.toggle_playlist_visibility()
-                return True
-                
-            # I: Toggle info panel
-            if key == Qt.Key_I and not isinstance(obj, QLineEdit):
-                self.toggle_info_panel()
-                return True
-                
-            # Escape: Exit fullscreen
-            if key == Qt.Key_Escape and self.isFullScreen():
-                self.showNormal()
-                return True
+    def exit_fullscreen(self):
+        """Leave fullscreen mode."""
+        if self.isFullScreen():
+            self.toggle_fullscreen()
+    
+    def reveal_controls(self):
+        """
+        Show the control bar in fullscreen and restart its auto-hide timer.
         
-        return super().eventFilter(obj, event)
+        Reveals are throttled: while the bar is visible, a reveal within
+        REVEAL_INTERVAL of the previous one does nothing.
+        """
+        if not self.isFullScreen():
+            return
+        now = time.monotonic()
+        if self.control_bar.isVisible() and now - self._last_reveal < self.REVEAL_INTERVAL:
+            return
+        self._last_reveal = now
+        self.control_bar.show()
+        self.control_bar.raise_()
+        self.control_bar._start_auto_hide_timer()
+    
+    def on_video_mouse_moved(self, global_pos):
+        """Reveal or hide the fullscreen controls as the mouse moves."""
+        if not self.isFullScreen():
+            return
+        y = self.mapFromGlobal(global_pos).y()
+        if y >= self.height() - 100:    # 100px from bottom
+            self.reveal_controls()
+        elif y <= 20 and self.control_bar.isVisible() and not self.control_bar.underMouse():
+            self.control_bar.hide()
     
     def _update_video_geometry(self):
         """Update video widget geometry to maintain aspect ratio."""
@@ -0,0 +1,244 @@
+import os
+import itertools
+from array import array
+from PyQt5.QtWidgets import QStyledItemDelegate, QStyleOptionViewItem, QStyle, QApplication
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex, QSize
+from PyQt5.QtGui import QPalette
+
+
+def display_name(path):
+    """Get the name shown for a playlist entry: the file name, or the URL."""
+    if '://' in path:
+        return path
+    return os.path.basename(path)
+
+
+def format_duration(milliseconds):
+    """Format milliseconds to H:MM:SS or MM:SS."""
+    seconds = int(milliseconds / 1000)
+    hours = seconds // 3600
+    minutes = (seconds % 3600) // 60
+    seconds = seconds % 60
+    
+    if hours > 0:
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+    return f"{minutes:02d}:{seconds:02d}"
+
+
+class PlaylistModel(QAbstractListModel):
+    """
+    Playlist entries stored in flat arrays.
+    
+    Only the path of each entry is stored as an object; durations live in a
+    typed array and display names are derived on demand, so only the rows a
+    view actually paints cost anything beyond their path.
+    
+    Paths are unique within the playlist. A path to row index is kept in
+    sync on every change, so membership checks and lookups are O(1).
+    """
+    
+    PathRole = Qt.UserRole
+    DurationRole = Qt.UserRole + 1
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._paths = []
+        self._durations = array('q')   # Milliseconds, -1 when unknown
+        self._rows = {}                # Path to row index
+    
+    # Qt model interface
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._paths)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        row = index.row()
+        if role == Qt.DisplayRole:
+            return display_name(self._paths[row])
+        if role == self.PathRole or role == Qt.ToolTipRole:
+            return self._paths[row]
+        if role == self.DurationRole:
+            return self._durations[row]
+        return None
+    
+    # Playlist interface
+    def path(self, row):
+        """Get the path of the entry at a row."""
+        return self._paths[row]
+    
+    def paths(self):
+        """Iterate over all entry paths in playlist order."""
+        return iter(self._paths)
+    
+    def entries(self):
+        """Iterate over (path, duration) pairs in playlist order without copying."""
+        return zip(self._paths, self._durations)
+    
+    def row_of(self, path):
+        """Get the row of a path, or -1 if it is not in the playlist."""
+        return self._rows.get(path, -1)
+    
+    def contains(self, path):
+        """Check if a path is in the playlist."""
+        return path in self._rows
+    
+    def duration(self, row):
+        """Get the duration of the entry at a row in ms, or -1 if unknown."""
+        return self._durations[row]
+    
+    def add_path(self, path, duration=-1):
+        """Append a single entry unless it is already in the playlist."""
+        return self.add_paths([path], [duration])
+    
+    def add_paths(self, paths, durations=None):
+        """
+        Append entries in a single insertion, skipping duplicates.
+        
+        Args:
+            paths (iterable): Paths or URLs to append
+            durations (iterable): Optional durations in ms, -1 when unknown
+        
+        Returns:
+            int: Number of entries added
+        """
+        rows = self._rows
+        first = len(self._paths)
+        new_paths = []
+        new_durations = []
+        
+        if durations is None:
+            durations = itertools.repeat(-1)
+        
+        # Single pass deduplication against the playlist and the batch itself
+        for path, duration in zip(paths, durations):
+            if path in rows:
+                continue
+            rows[path] = first + len(new_paths)
+            new_paths.append(path)
+            new_durations.append(duration)
+        
+        if not new_paths:
+            return 0
+        
+        self.beginInsertRows(QModelIndex(), first, first + len(new_paths) - 1)
+        self._paths.extend(new_paths)
+        self._durations.extend(new_durations)
+        self.endInsertRows()
+        return len(new_paths)
+    
+    def remove_rows(self, rows):
+        """
+        Remove entries by row.
+        
+        A single row is removed in place; several rows are removed in one
+        pass followed by a single model reset.
+        """
+        rows = sorted(set(r for r in rows if 0 <= r < len(self._paths)))
+        if not rows:
+            return
+        
+        if len(rows) == 1:
+            row = rows[0]
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._rows[self._paths[row]]
+            del self._paths[row]
+            del self._durations[row]
+            self._reindex(row, len(self._paths))
+            self.endRemoveRows()
+            return
+        
+        removed = set(rows)
+        self.beginResetModel()
+        self._paths = [p for i, p in enumerate(self._paths) if i not in removed]
+        self._durations = array('q', (d for i, d in enumerate(self._durations) if i not in removed))
+        self._rows = {path: row for row, path in enumerate(self._paths)}
+        self.endResetModel()
+    
+    def move_row(self, source, destination):
+        """
+        Move an entry to another row.
+        
+        Args:
+            source (int): Current row of the entry
+            destination (int): Row the entry ends up at
+        """
+        count = len(self._paths)
+        if not (0 <= source < count and 0 <= destination < count) or source == destination:
+            return
+        
+        # Qt expects the destination as the row the entry is inserted before
+        qt_destination = destination + 1 if destination > source else destination
+        self.beginMoveRows(QModelIndex(), source, source, QModelIndex(), qt_destination)
+        path = self._paths.pop(source)
+        duration = self._durations.pop(source)
+        self._paths.insert(destination, path)
+        self._durations.insert(destination, duration)
+        self._reindex(min(source, destination), max(source, destination) + 1)
+        self.endMoveRows()
+    
+    def _reindex(self, start, end):
+        """Refresh the path index for rows in [start, end)."""
+        rows = self._rows
+        paths = self._paths
+        for row in range(start, min(end, len(paths))):
+            rows[paths[row]] = row
+    
+    def clear(self):
+        """Remove all entries."""
+        self.beginResetModel()
+        self._paths = []
+        self._durations = array('q')
+        self._rows = {}
+        self.endResetModel()
+    
+    def set_duration(self, row, duration):
+        """Set the duration of the entry at a row in ms."""
+        if 0 <= row < len(self._durations) and self._durations[row] != duration:
+            self._durations[row] = duration
+            index = self.index(row)
+            self.dataChanged.emit(index, index, [self.DurationRole])
+
+
+class PlaylistItemDelegate(QStyledItemDelegate):
+    """Paints a playlist row as an elided name with a right-aligned duration."""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._row_height = None
+    
+    def sizeHint(self, option, index):
+        if self._row_height is None:
+            self._row_height = option.fontMetrics.height() + 10
+        return QSize(0, self._row_height)
+    
+    def paint(self, painter, option, index):
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.text = ""
+        
+        # Background, selection and hover highlight
+        style = opt.widget.style() if opt.widget else QApplication.style()
+        style.drawControl(QStyle.CE_ItemViewItem, opt, painter, opt.widget)
+        
+        painter.save()
+        if opt.state & QStyle.State_Selected:
+            painter.setPen(opt.palette.color(QPalette.HighlightedText))
+        else:
+            painter.setPen(opt.palette.color(QPalette.Text))
+        
+        rect = opt.rect.adjusted(8, 0, -8, 0)
+        metrics = opt.fontMetrics
+        
+        duration = index.data(PlaylistModel.DurationRole)
+        if duration is not None and duration >= 0:
+            duration_text = format_duration(duration)
+            painter.drawText(rect, Qt.AlignRight | Qt.AlignVCenter, duration_text)
+            rect.setRight(rect.right() - metrics.horizontalAdvance(duration_text) - 8)
+        
+        name = metrics.elidedText(index.data(Qt.DisplayRole), Qt.ElideMiddle, rect.width())
+        painter.drawText(rect, Qt.AlignLeft | Qt.AlignVCenter, name)
+        painter.restore()
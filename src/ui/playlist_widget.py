@@ -1,10 +1,12 @@
 from PyQt5.QtWidgets import (
-    QListWidget, QListWidgetItem, QVBoxLayout, QWidget, QMenu, QAction
+    QListView, QVBoxLayout, QWidget, QMenu, QAction
 )
 from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtGui import QIcon
 import os
 
+from src.ui.playlist_model import PlaylistModel, PlaylistItemDelegate
+
 class PlaylistWidget(QWidget):
     """Playlist widget for managing media files."""
     
@@ -20,11 +22,16 @@ class PlaylistWidget(QWidget):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         
-        # Create playlist view
-        self.playlist_view = QListWidget()
+        # Create playlist view backed by a virtualized model
+        self.model = PlaylistModel(self)
+        self.playlist_view = QListView()
+        self.playlist_view.setModel(self.model)
+        self.playlist_view.setItemDelegate(PlaylistItemDelegate(self.playlist_view))
+        self.playlist_view.setUniformItemSizes(True)
         self.playlist_view.setAlternatingRowColors(True)
-        self.playlist_view.setSelectionMode(QListWidget.SingleSelection)
-        self.playlist_view.itemDoubleClicked.connect(self.on_item_double_clicked)
+        self.playlist_view.setSelectionMode(QListView.SingleSelection)
+        self.playlist_view.setEditTriggers(QListView.NoEditTriggers)
+        self.playlist_view.doubleClicked.connect(self.on_item_double_clicked)
         self.playlist_view.setContextMenuPolicy(Qt.CustomContextMenu)
         self.playlist_view.customContextMenuRequested.connect(self.show_context_menu)
         
@@ -34,30 +41,27 @@ class PlaylistWidget(QWidget):
         """Add a media file to the playlist."""
         if not os.path.exists(file_path):
             return
-            
-        item = QListWidgetItem(os.path.basename(file_path))
-        item.setData(Qt.UserRole, file_path)  # Store full path
-        self.playlist_view.addItem(item)
+        
+        self.model.add_path(file_path)
     
     def add_media_list(self, file_paths):
-        """Add multiple media files to the playlist."""
-        for file_path in file_paths:
-            self.add_media(file_path)
+        """Add multiple media files to the playlist in a single insertion."""
+        self.model.add_paths(file_paths)
     
     def clear_playlist(self):
         """Clear the playlist."""
-        self.playlist_view.clear()
+        self.model.clear()
     
     def get_current_media(self):
         """Get the currently selected media file path."""
-        current_item = self.playlist_view.currentItem()
-        if current_item:
-            return current_item.data(Qt.UserRole)
+        current_index = self.playlist_view.currentIndex()
+        if current_index.isValid():
+            return current_index.data(PlaylistModel.PathRole)
         return None
     
-    def on_item_double_clicked(self, item):
+    def on_item_double_clicked(self, index):
         """Handle double-click on playlist item."""
-        file_path = item.data(Qt.UserRole)
+        file_path = index.data(PlaylistModel.PathRole)
         self.item_double_clicked.emit(file_path)
     
     def show_context_menu(self, position):
@@ -78,6 +82,6 @@ class PlaylistWidget(QWidget):
     
     def remove_selected_item(self):
         """Remove the currently selected item from the playlist."""
-        current_row = self.playlist_view.currentRow()
-        if current_row >= 0:
-            self.playlist_view.takeItem(current_row)
+        current_index = self.playlist_view.currentIndex()
+        if current_index.isValid():
+            self.model.remove_rows([current_index.row()])
@@ -0,0 +1,114 @@
+import time
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
+                             QPlainTextEdit, QPushButton, QLabel, QSplitter, QHeaderView,
+                             QFileDialog, QMessageBox)
+
+
+class StallReportDialog(QDialog):
+    """Lists the event loop stalls recorded by a StallWatchdog."""
+    
+    def __init__(self, watchdog, parent=None):
+        """
+        Args:
+            watchdog (StallWatchdog): Watchdog whose records are shown
+        """
+        super().__init__(parent)
+        self.watchdog = watchdog
+        self.setWindowTitle("Stall Report")
+        self.resize(820, 520)
+        
+        layout = QVBoxLayout(self)
+        self.summary_label = QLabel()
+        layout.addWidget(self.summary_label)
+        
+        splitter = QSplitter(Qt.Vertical)
+        self.table = QTableWidget(0, 3)
+        self.table.setHorizontalHeaderLabels(["Time", "Duration", "Location"])
+        self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.table.setSelectionMode(QTableWidget.SingleSelection)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.currentCellChanged.connect(self.show_stack)
+        splitter.addWidget(self.table)
+        
+        self.stack_view = QPlainTextEdit()
+        self.stack_view.setReadOnly(True)
+        self.stack_view.setLineWrapMode(QPlainTextEdit.NoWrap)
+        splitter.addWidget(self.stack_view)
+        layout.addWidget(splitter, 1)
+        
+        buttons = QHBoxLayout()
+        refresh_button = QPushButton("Refresh")
+        refresh_button.clicked.connect(self.refresh)
+        save_button = QPushButton("Save as JSON...")
+        save_button.clicked.connect(self.save)
+        clear_button = QPushButton("Clear")
+        clear_button.clicked.connect(self.clear)
+        close_button = QPushButton("Close")
+        close_button.clicked.connect(self.accept)
+        for button in (refresh_button, save_button, clear_button):
+            buttons.addWidget(button)
+        buttons.addStretch(1)
+        buttons.addWidget(close_button)
+        layout.addLayout(buttons)
+        
+        self._records = []
+        self.watchdog.stall_detected.connect(self._on_stall)
+    
+    def showEvent(self, event):
+        """Reload the records whenever the dialog is shown."""
+        self.refresh()
+        super().showEvent(event)
+    
+    def _on_stall(self, record):
+        if self.isVisible():
+            self.refresh()
+    
+    def refresh(self):
+        """Reload the records from the watchdog, newest first."""
+        self._records = list(reversed(self.watchdog.get_records()))
+        self.table.setRowCount(len(self._records))
+        for row, record in enumerate(self._records):
+            cells = (
+                time.strftime("%H:%M:%S", time.localtime(record['time'])),
+                f"{record['duration']:.0f} ms",
+                record['location'] or "Unknown (no Python stack captured)",
+            )
+            for column, text in enumerate(cells):
+                self.table.setItem(row, column, QTableWidgetItem(text))
+        self.table.resizeColumnToContents(0)
+        self.table.resizeColumnToContents(1)
+        
+        state = "" if self.watchdog.is_running() else " (watchdog not running)"
+        self.summary_label.setText(
+            f"{len(self._records)} stalls over {self.watchdog.threshold} ms{state}")
+        if self._records:
+            self.table.setCurrentCell(0, 0)
+        else:
+            self.stack_view.clear()
+    
+    def show_stack(self, row, *args):
+        """Show the GUI thread stack of the selected stall, innermost call last."""
+        if 0 <= row < len(self._records):
+            stack = self._records[row]['stack']
+            self.stack_view.setPlainText("\n".join(stack) if stack else
+                                         "The stack could not be captured while the "
+                                         "event loop was blocked.")
+    
+    def save(self):
+        """Write the records to a JSON file."""
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "Save Stall Report", "stalls.json", "JSON Files (*.json)")
+        if not file_path:
+            return
+        try:
+            self.watchdog.dump(file_path)
+        except OSError as e:
+            QMessageBox.warning(self, "Save Stall Report", f"Could not save the report:\n{e}")
+    
+    def clear(self):
+        """Forget all recorded stalls."""
+        self.watchdog.clear()
+        self.refresh()
@@ -1,7 +1,7 @@
 from PyQt5.QtWidgets import (QWidget, QSizePolicy, QLabel, QVBoxLayout, 
                             QHBoxLayout, QGraphicsDropShadowEffect, QFrame,
                             QGraphicsOpacityEffect)
-from PyQt5.QtCore import Qt, QTimer, QPoint, QPropertyAnimation, QEasingCurve
+from PyQt5.QtCore import Qt, QTimer, QPoint, QPropertyAnimation, QEasingCurve, pyqtSignal
 from PyQt5.QtGui import QPainter, QColor, QLinearGradient, QPixmap, QPen, QBrush
 
 class VideoOverlay(QWidget):
@@ -86,6 +86,11 @@ class VideoOverlay(QWidget):
 
 class VideoWidget(QWidget):
     """Main video display widget with overlay controls."""
+    
+    # Emitted with the global mouse position when the mouse has moved
+    # noticeably, at most once per few pixels of movement
+    mouse_moved = pyqtSignal(QPoint)
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setAttribute(Qt.WA_OpaquePaintEvent)
@@ -181,6 +186,7 @@ class VideoWidget(QWidget):
         if self._last_mouse_pos is None or (current_pos - self._last_mouse_pos).manhattanLength() > 3:
             self.overlay.show_overlay()
             self._mouse_timer.start(3000)  # Hide after 3 seconds of no movement
+            self.mouse_moved.emit(event.globalPos())
         self._last_mouse_pos = current_pos
         super().mouseMoveEvent(event)
     
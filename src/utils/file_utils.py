@@ -1,6 +1,11 @@
 import os
+import stat
 from pathlib import Path
 
+from src.utils import tracing
+
+log = tracing.get_logger("files")
+
 def get_asset_path(relative_path):
     """
     Get the absolute path to an asset file.
@@ -17,6 +22,13 @@ def get_asset_path(relative_path):
     assets_dir = os.path.join(current_dir, "..", "..", "assets")
     return os.path.join(assets_dir, relative_path)
 
+SUPPORTED_EXTENSIONS = {
+    # Video formats
+    '.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm', '.m4v',
+    # Audio formats
+    '.mp3', '.wav', '.ogg', '.flac', '.m4a', '.aac', '.wma'
+}
+
 def is_supported_media_file(file_path):
     """
     Check if a file has a supported media extension.
@@ -27,15 +39,93 @@ def is_supported_media_file(file_path):
     Returns:
         bool: True if the file has a supported extension, False otherwise
     """
-    supported_extensions = {
-        # Video formats
-        '.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm', '.m4v',
-        # Audio formats
-        '.mp3', '.wav', '.ogg', '.flac', '.m4a', '.aac', '.wma'
-    }
-    
     _, ext = os.path.splitext(file_path)
-    return ext.lower() in supported_extensions
+    return ext.lower() in SUPPORTED_EXTENSIONS
+
+def get_media_file_filter():
+    """
+    Get a file dialog name filter matching all supported media files.
+    
+    Returns:
+        str: Filter such as "Media Files (*.mp4 *.mkv ...)"
+    """
+    patterns = " ".join(f"*{ext}" for ext in sorted(SUPPORTED_EXTENSIONS))
+    return f"Media Files ({patterns})"
+
+def iter_media_files(paths, is_cancelled=None, on_progress=None, check_every=256,
+                     with_stat=False):
+    """
+    Recursively yield the supported media files under the given paths.
+    
+    Directories are walked with os.scandir, whose entries already know
+    whether they are files or directories, so no per-file stat call is
+    made. Files are yielded one directory at a time in name order.
+    Symbolic links to directories are not followed to avoid cycles.
+    
+    Cancellation and progress are checked per directory and every
+    check_every entries, not only when a media file is found, so walking
+    large trees with few media files or slow network shares can be
+    followed and stopped.
+    
+    Args:
+        paths (iterable): Files and/or directories to import
+        is_cancelled (callable): Returns True to stop the walk
+        on_progress (callable): Called as on_progress(directories, entries)
+                                with the numbers scanned so far
+        check_every (int): Entries scanned between two checks
+        with_stat (bool): Yield (path, os.stat_result) pairs, so the size and
+                          modification time need not be looked up again;
+                          Windows fills them in while listing directories
+        
+    Yields:
+        str: Path of each supported media file, in directory order
+    """
+    directories_scanned = entries_scanned = 0
+    
+    def stop():
+        if on_progress is not None:
+            on_progress(directories_scanned, entries_scanned)
+        return is_cancelled is not None and is_cancelled()
+    
+    for path in paths:
+        if stop():
+            return
+        if not os.path.isdir(path):
+            if is_supported_media_file(path) and os.path.isfile(path):
+                yield (path, os.stat(path)) if with_stat else path
+            continue
+        
+        pending = [path]
+        while pending:
+            if stop():
+                return
+            directory = pending.pop()
+            files = []
+            subdirectories = []
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        entries_scanned += 1
+                        if entries_scanned % check_every == 0 and stop():
+                            return
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                subdirectories.append(entry.path)
+                            elif is_supported_media_file(entry.name) and entry.is_file():
+                                files.append((entry.path, entry.stat()) if with_stat
+                                             else entry.path)
+                        except OSError:
+                            continue
+            except OSError as e:
+                log.warning("Cannot read directory %s: %s", directory, e)
+                continue
+            directories_scanned += 1
+            
+            # Yield each directory's files, then visit subdirectories, in name order
+            files.sort()
+            yield from files
+            subdirectories.sort(reverse=True)
+            pending.extend(subdirectories)
 
 def get_file_info(file_path):
     """
@@ -50,13 +140,72 @@ def get_file_info(file_path):
     if not os.path.exists(file_path):
         return None
         
-    file_stat = os.stat(file_path)
+    return file_info_from_stat(file_path, os.stat(file_path))
+
+def file_info_from_stat(file_path, file_stat):
+    """
+    Build the get_file_info dictionary from a stat result already at hand.
     
+    Args:
+        file_path (str): Path to the file
+        file_stat (os.stat_result): Result of os.stat or DirEntry.stat
+        
+    Returns:
+        dict: Dictionary containing file information (size, modification time, etc.)
+    """
     return {
         'path': file_path,
         'name': os.path.basename(file_path),
         'size': file_stat.st_size,
         'created': file_stat.st_ctime,
         'modified': file_stat.st_mtime,
-        'is_dir': os.path.isdir(file_path)
+        'is_dir': stat.S_ISDIR(file_stat.st_mode)
     }
+
+def format_size(size):
+    """
+    Format a byte count as a human readable string.
+    
+    Args:
+        size (int): Size in bytes
+        
+    Returns:
+        str: Size such as "1.50 MB"
+    """
+    for unit in ['B', 'KB', 'MB', 'GB']:
+        if size < 1024.0:
+            return f"{size:.2f} {unit}"
+        size /= 1024.0
+    return f"{size:.2f} TB"
+
+def get_cache_dir():
+    """
+    Get the per-user cache directory for OnaPlay, creating it if needed.
+    
+    Returns:
+        str: Absolute path to the cache directory
+    """
+    if os.name == 'nt':
+        base_dir = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    else:
+        base_dir = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    
+    cache_dir = os.path.join(base_dir, 'onaplay')
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
+
+def get_config_dir():
+    """
+    Get the per-user configuration directory for OnaPlay, creating it if needed.
+    
+    Returns:
+        str: Absolute path to the configuration directory
+    """
+    if os.name == 'nt':
+        base_dir = os.environ.get('APPDATA') or os.path.expanduser('~')
+    else:
+        base_dir = os.environ.get('XDG_CONFIG_HOME') or os.path.join(os.path.expanduser('~'), '.config')
+    
+    config_dir = os.path.join(base_dir, 'onaplay')
+    os.makedirs(config_dir, exist_ok=True)
+    return config_dir
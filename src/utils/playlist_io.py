@@ -0,0 +1,310 @@
+import os
+import re
+from urllib.parse import unquote, urlparse
+from xml.etree import ElementTree
+from xml.sax.saxutils import escape
+
+from PyQt5.QtCore import QUrl
+
+
+PLAYLIST_EXTENSIONS = {'.m3u', '.m3u8', '.pls', '.xspf'}
+
+XSPF_NAMESPACE = 'http://xspf.org/ns/0/'
+
+
+def is_playlist_file(file_path):
+    """Check if a file is a supported playlist based on its extension."""
+    return os.path.splitext(file_path)[1].lower() in PLAYLIST_EXTENSIONS
+
+
+def get_playlist_file_filter():
+    """Get the file dialog name filter for supported playlist formats."""
+    return ("Playlists (*.m3u *.m3u8 *.pls *.xspf);;M3U Playlist (*.m3u8 *.m3u);;"
+            "PLS Playlist (*.pls);;XSPF Playlist (*.xspf)")
+
+
+def resolve_location(location, base_dir):
+    """
+    Resolve a playlist entry to a local path or URL.
+    
+    Args:
+        location (str): Entry as written in the playlist
+        base_dir (str): Directory of the playlist, for relative paths
+    
+    Returns:
+        str: Absolute local path, or the URL for remote entries
+    """
+    location = location.strip()
+    if location.startswith('file:'):
+        return QUrl(location).toLocalFile()
+    if re.match(r'^[a-zA-Z][a-zA-Z0-9+.-]+://', location):
+        return location
+    return os.path.normpath(os.path.join(base_dir, location))
+
+
+def _open_text(file_path):
+    """Open a playlist for reading, tolerating a BOM and stray bytes."""
+    return open(file_path, 'r', encoding='utf-8-sig', errors='replace')
+
+
+def iter_m3u(file_path):
+    """
+    Read an M3U/M3U8 playlist one entry at a time.
+    
+    Both plain and extended (#EXTINF) playlists are supported.
+    
+    Args:
+        file_path (str): Path of the playlist
+    
+    Yields:
+        tuple: (location, duration in ms or -1)
+    """
+    base_dir = os.path.dirname(os.path.abspath(file_path))
+    duration = -1
+    
+    with _open_text(file_path) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith('#'):
+                if line.startswith('#EXTINF:'):
+                    seconds = line[8:].split(',', 1)[0].split(' ', 1)[0]
+                    try:
+                        duration = int(float(seconds) * 1000) if float(seconds) >= 0 else -1
+                    except ValueError:
+                        duration = -1
+                continue
+            
+            yield resolve_location(line, base_dir), duration
+            duration = -1
+
+
+def iter_pls(file_path):
+    """
+    Read a PLS playlist one entry at a time.
+    
+    Entries are yielded as soon as the playlist moves on to the next entry
+    number, so only the entry being read is kept in memory.
+    
+    Args:
+        file_path (str): Path of the playlist
+    
+    Yields:
+        tuple: (location, duration in ms or -1)
+    """
+    base_dir = os.path.dirname(os.path.abspath(file_path))
+    current = None
+    entry = {}
+    
+    def finish():
+        if 'file' in entry:
+            return resolve_location(entry['file'], base_dir), entry.get('length', -1)
+        return None
+    
+    with _open_text(file_path) as f:
+        for line in f:
+            match = re.match(r'^\s*(File|Title|Length)(\d+)\s*=(.*)$', line, re.IGNORECASE)
+            if not match:
+                continue
+            key, number, value = match.group(1).lower(), int(match.group(2)), match.group(3).strip()
+            
+            if number != current:
+                finished = finish()
+                if finished:
+                    yield finished
+                current = number
+                entry = {}
+            
+            if key == 'length':
+                try:
+                    entry['length'] = int(value) * 1000 if int(value) >= 0 else -1
+                except ValueError:
+                    pass
+            else:
+                entry[key] = value
+    
+    finished = finish()
+    if finished:
+        yield finished
+
+
+def iter_xspf(file_path):
+    """
+    Read an XSPF playlist one track at a time.
+    
+    The XML is parsed incrementally and every track element is cleared once
+    it has been read, so memory stays flat for any playlist size.
+    
+    Args:
+        file_path (str): Path of the playlist
+    
+    Yields:
+        tuple: (location, duration in ms or -1)
+    """
+    base_dir = os.path.dirname(os.path.abspath(file_path))
+    track_list = None
+    
+    for event, element in ElementTree.iterparse(file_path, events=('start', 'end')):
+        tag = element.tag.rsplit('}', 1)[-1]
+        if event == 'start':
+            if tag == 'trackList':
+                track_list = element
+            continue
+        
+        if tag != 'track':
+            continue
+        
+        location = None
+        duration = -1
+        for child in element:
+            tag = child.tag.rsplit('}', 1)[-1]
+            if tag == 'location' and location is None and child.text:
+                location = child.text
+            elif tag == 'duration' and child.text:
+                try:
+                    duration = int(child.text.strip())
+                except ValueError:
+                    pass
+        
+        # Drop finished tracks, the parser keeps appending to their parent
+        if track_list is not None:
+            track_list.clear()
+        else:
+            element.clear()
+        
+        if location:
+            # Relative locations are URI references and may be percent-encoded
+            if '://' not in location and not location.startswith('file:'):
+                location = unquote(location)
+            yield resolve_location(location, base_dir), duration
+
+
+def read_playlist(file_path):
+    """
+    Read any supported playlist one entry at a time.
+    
+    Args:
+        file_path (str): Path of the playlist
+    
+    Yields:
+        tuple: (location, duration in ms or -1)
+    
+    Raises:
+        ValueError: If the playlist format is not supported
+    """
+    ext = os.path.splitext(file_path)[1].lower()
+    if ext in ('.m3u', '.m3u8'):
+        return iter_m3u(file_path)
+    if ext == '.pls':
+        return iter_pls(file_path)
+    if ext == '.xspf':
+        return iter_xspf(file_path)
+    raise ValueError(f"Unsupported playlist format: {ext}")
+
+
+def _display_title(location):
+    """Get the title written for an entry: its file name without extension."""
+    if '://' in location:
+        return unquote(os.path.basename(urlparse(location).path)) or location
+    return os.path.splitext(os.path.basename(location))[0]
+
+
+def write_m3u(file_path, entries):
+    """
+    Write an extended M3U playlist (UTF-8).
+    
+    Args:
+        file_path (str): Path of the playlist
+        entries (iterable): (location, duration in ms or -1) tuples
+    
+    Returns:
+        int: Number of entries written
+    """
+    count = 0
+    with open(file_path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write('#EXTM3U\n')
+        for location, duration in entries:
+            seconds = duration // 1000 if duration >= 0 else -1
+            f.write(f'#EXTINF:{seconds},{_display_title(location)}\n{location}\n')
+            count += 1
+    return count
+
+
+def write_pls(file_path, entries):
+    """
+    Write a PLS playlist.
+    
+    The entry count has to appear in the footer, so it is written after the
+    entries and never requires a second pass.
+    
+    Args:
+        file_path (str): Path of the playlist
+        entries (iterable): (location, duration in ms or -1) tuples
+    
+    Returns:
+        int: Number of entries written
+    """
+    count = 0
+    with open(file_path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write('[playlist]\n')
+        for location, duration in entries:
+            count += 1
+            seconds = duration // 1000 if duration >= 0 else -1
+            f.write(f'File{count}={location}\nTitle{count}={_display_title(location)}\n'
+                    f'Length{count}={seconds}\n')
+        f.write(f'NumberOfEntries={count}\nVersion=2\n')
+    return count
+
+
+def write_xspf(file_path, entries):
+    """
+    Write an XSPF playlist.
+    
+    Args:
+        file_path (str): Path of the playlist
+        entries (iterable): (location, duration in ms or -1) tuples
+    
+    Returns:
+        int: Number of entries written
+    """
+    count = 0
+    with open(file_path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        f.write(f'<playlist version="1" xmlns="{XSPF_NAMESPACE}">\n  <trackList>\n')
+        for location, duration in entries:
+            title = _display_title(location)
+            if '://' not in location:
+                location = QUrl.fromLocalFile(os.path.abspath(location)).toString(QUrl.FullyEncoded)
+            f.write(f'    <track>\n      <location>{escape(location)}</location>\n'
+                    f'      <title>{escape(title)}</title>\n')
+            if duration >= 0:
+                f.write(f'      <duration>{duration}</duration>\n')
+            f.write('    </track>\n')
+            count += 1
+        f.write('  </trackList>\n</playlist>\n')
+    return count
+
+
+def write_playlist(file_path, entries):
+    """
+    Write a playlist in the format given by the file extension.
+    
+    Args:
+        file_path (str): Path of the playlist
+        entries (iterable): (location, duration in ms or -1) tuples
+    
+    Returns:
+        int: Number of entries written
+    
+    Raises:
+        ValueError: If the playlist format is not supported
+    """
+    ext = os.path.splitext(file_path)[1].lower()
+    if ext in ('.m3u', '.m3u8'):
+        return write_m3u(file_path, entries)
+    if ext == '.pls':
+        return write_pls(file_path, entries)
+    if ext == '.xspf':
+        return write_xspf(file_path, entries)
+    raise ValueError(f"Unsupported playlist format: {ext}")
@@ -0,0 +1,141 @@
+import os
+import re
+import json
+import getpass
+from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtNetwork import QLocalServer, QLocalSocket
+
+from src.utils import tracing
+
+log = tracing.get_logger("instance")
+
+
+def get_server_name():
+    """Get the local socket name of the running instance for the current user."""
+    try:
+        user = getpass.getuser()
+    except Exception:
+        user = "default"
+    return "onaplay-" + re.sub(r'[^A-Za-z0-9_.-]', '_', user)
+
+
+def normalize_arguments(paths):
+    """
+    Make command line paths independent of the working directory.
+    
+    Local paths become absolute; URLs are kept as they are.
+    
+    Args:
+        paths (list): Paths and URLs as given on the command line
+    
+    Returns:
+        list: Absolute paths and URLs
+    """
+    result = []
+    for path in paths:
+        if re.match(r'^[a-zA-Z][a-zA-Z0-9+.-]+://', path):
+            result.append(path)
+        else:
+            result.append(os.path.abspath(path))
+    return result
+
+
+def forward_to_running_instance(paths, enqueue=False, timeout=200):
+    """
+    Hand the arguments over to an already running instance.
+    
+    This only needs QtNetwork and no QApplication, so a second launch can
+    exit right away without starting Qt widgets or libvlc.
+    
+    Args:
+        paths (list): Absolute paths and URLs to open
+        enqueue (bool): Add to the playlist instead of playing right away
+        timeout (int): Milliseconds to wait for the running instance
+    
+    Returns:
+        bool: True if a running instance accepted the arguments
+    """
+    socket = QLocalSocket()
+    socket.connectToServer(get_server_name())
+    if not socket.waitForConnected(timeout):
+        return False
+    
+    message = json.dumps({'paths': paths, 'enqueue': enqueue}) + '\n'
+    socket.write(message.encode('utf-8'))
+    ok = socket.waitForBytesWritten(timeout)
+    socket.disconnectFromServer()
+    if socket.state() != QLocalSocket.UnconnectedState:
+        socket.waitForDisconnected(timeout)
+    return ok
+
+
+class InstanceServer(QObject):
+    """
+    Receives arguments forwarded by later launches of the application.
+    
+    Each launch sends one JSON line with the paths to open and whether to
+    enqueue them; it is delivered through message_received.
+    """
+    
+    # Signals
+    message_received = pyqtSignal(list, bool)   # paths, enqueue
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.server = QLocalServer(self)
+        self.server.newConnection.connect(self._on_new_connection)
+        self._buffers = {}
+    
+    def listen(self, remove_stale=True):
+        """
+        Start accepting hand-offs.
+        
+        Args:
+            remove_stale (bool): If the name is taken, remove its socket and
+                                 try again. Only pass True once forwarding to
+                                 that name has failed, i.e. the socket was
+                                 left behind by a crashed instance; otherwise
+                                 a racing launch's live socket gets deleted.
+        
+        Returns:
+            bool: True if the server is listening
+        """
+        name = get_server_name()
+        if self.server.listen(name):
+            return True
+        if not remove_stale:
+            return False
+        
+        QLocalServer.removeServer(name)
+        if self.server.listen(name):
+            return True
+        
+        log.warning("Single instance server unavailable: %s", self.server.errorString())
+        return False
+    
+    def close(self):
+        """Stop accepting hand-offs."""
+        self.server.close()
+    
+    def _on_new_connection(self):
+        while self.server.hasPendingConnections():
+            socket = self.server.nextPendingConnection()
+            self._buffers[socket] = b''
+            socket.readyRead.connect(lambda s=socket: self._on_ready_read(s))
+            socket.disconnected.connect(lambda s=socket: self._on_disconnected(s))
+    
+    def _on_ready_read(self, socket):
+        self._buffers[socket] = self._buffers.get(socket, b'') + bytes(socket.readAll())
+    
+    def _on_disconnected(self, socket):
+        data = self._buffers.pop(socket, b'') + bytes(socket.readAll())
+        socket.deleteLater()
+        
+        for line in data.splitlines():
+            try:
+                message = json.loads(line.decode('utf-8'))
+            except (ValueError, UnicodeDecodeError) as e:
+                log.warning("Ignoring invalid hand-off message: %s", e)
+                continue
+            paths = [str(path) for path in message.get('paths', [])]
+            self.message_received.emit(paths, bool(message.get('enqueue', False)))
@@ -0,0 +1,164 @@
+import os
+import sys
+import json
+import time
+import threading
+import traceback
+from collections import deque
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+from src.utils import tracing
+
+log = tracing.get_logger("stall")
+
+# Frames from files under this directory are the project's own code
+_SOURCE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _describe_frame(frame):
+    """Format a traceback.FrameSummary as "file:line in function"."""
+    path = frame.filename
+    try:
+        path = os.path.relpath(path, os.path.dirname(_SOURCE_DIR))
+    except ValueError:
+        pass    # Different drive on Windows
+    return f"{path}:{frame.lineno} in {frame.name}"
+
+
+def _find_location(frames):
+    """Get the innermost frame of the project's own code, else the innermost frame."""
+    for frame in reversed(frames):
+        if frame.filename.startswith(_SOURCE_DIR):
+            return frame
+    return frames[-1] if frames else None
+
+
+class StallWatchdog(QObject):
+    """
+    Detects event loop stalls and records what the GUI thread was doing.
+    
+    A heartbeat timer runs on the GUI thread and a watchdog thread checks
+    that it keeps beating. Once the heartbeat is more than threshold
+    milliseconds overdue, the watchdog captures the GUI thread's Python
+    stack while the stall is still going on. The next heartbeat measures
+    how long the stall lasted and files the record in a ring buffer.
+    
+    Calls that keep the GIL while blocking prevent the watchdog from
+    capturing the stack; such stalls are still recorded, without stack.
+    """
+    
+    HEARTBEAT_INTERVAL = 50     # Milliseconds between heartbeats
+    MAX_RECORDS = 100           # Stall records kept, oldest dropped first
+    
+    stall_detected = pyqtSignal(dict)   # Stall record, emitted once the stall is over
+    
+    def __init__(self, threshold=200, parent=None):
+        """
+        Args:
+            threshold (int): Milliseconds the event loop must be blocked
+                             before it counts as a stall
+        """
+        super().__init__(parent)
+        self.threshold = threshold
+        self.records = deque(maxlen=self.MAX_RECORDS)
+        
+        self._lock = threading.Lock()
+        self._last_beat = time.monotonic()
+        self._capture = None        # Stack captured during the current stall
+        self._gui_thread = threading.main_thread().ident
+        self._stop = threading.Event()
+        self._thread = None
+        
+        self._timer = QTimer(self)
+        self._timer.setInterval(self.HEARTBEAT_INTERVAL)
+        self._timer.timeout.connect(self._beat)
+    
+    def start(self):
+        """Start the heartbeat and the watchdog thread."""
+        if self._thread is not None:
+            return
+        self._gui_thread = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stop.clear()
+        self._timer.start()
+        self._thread = threading.Thread(target=self._watch, name="StallWatchdog", daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        """Stop watching; recorded stalls are kept."""
+        self._timer.stop()
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(1)
+            self._thread = None
+    
+    def is_running(self):
+        """Check if the watchdog is active."""
+        return self._thread is not None
+    
+    # Watchdog thread
+    def _watch(self):
+        poll = max(0.01, self.threshold / 4000)
+        while not self._stop.wait(poll):
+            with self._lock:
+                overdue = (time.monotonic() - self._last_beat) * 1000 - self.HEARTBEAT_INTERVAL
+                if overdue < self.threshold or self._capture is not None:
+                    continue
+                frame = sys._current_frames().get(self._gui_thread)
+                if frame is None:
+                    continue
+                self._capture = traceback.extract_stack(frame)
+    
+    # GUI thread
+    def _beat(self):
+        now = time.monotonic()
+        with self._lock:
+            stalled_for = (now - self._last_beat) * 1000 - self.HEARTBEAT_INTERVAL
+            started = self._last_beat
+            self._last_beat = now
+            frames, self._capture = self._capture, None
+        
+        if stalled_for < self.threshold:
+            return
+        self._record(started, stalled_for, frames)
+    
+    def _record(self, started, duration, frames):
+        location = _find_location(frames) if frames else None
+        record = {
+            'time': time.time() - (time.monotonic() - started),
+            'duration': round(duration, 1),
+            'location': _describe_frame(location) if location else None,
+            'stack': [_describe_frame(frame) for frame in frames] if frames else [],
+        }
+        self.records.append(record)
+        # Modal dialogs block the loop too, so stalls are no warning by themselves
+        log.info("Event loop stalled for %.0f ms in %s",
+                 duration, record['location'] or "unknown code")
+        if tracing.enabled:
+            tracing.instant("stall", "stall", duration=record['duration'],
+                            location=record['location'])
+        self.stall_detected.emit(record)
+    
+    # Records
+    def get_records(self):
+        """Get the recorded stalls, oldest first."""
+        return list(self.records)
+    
+    def clear(self):
+        """Forget all recorded stalls."""
+        self.records.clear()
+    
+    def dump(self, path):
+        """
+        Write the recorded stalls as JSON.
+        
+        Args:
+            path (str): Output file
+        
+        Returns:
+            int: Number of stalls written
+        """
+        records = self.get_records()
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'threshold': self.threshold, 'stalls': records}, f, indent=2)
+        return len(records)
@@ -0,0 +1,68 @@
+import sys
+import time
+
+# Reference point for all phases: the first import of this module
+_origin = time.perf_counter()
+_enabled = False
+_marks = []
+_background = []
+_waiting_for = set()
+_reported = False
+
+
+def enable(report_after=()):
+    """
+    Start recording startup phases.
+    
+    Args:
+        report_after (iterable): Phase names that must all be marked before
+                                 the breakdown is printed
+    """
+    global _enabled
+    _enabled = True
+    _waiting_for.update(report_after)
+
+
+def is_enabled():
+    """Check if startup profiling is active."""
+    return _enabled
+
+
+def mark(phase):
+    """
+    Record the end of a startup phase.
+    
+    The phase covers the time since the previous mark. This is a no-op
+    unless profiling has been enabled.
+    
+    Args:
+        phase (str): Name of the phase that just finished
+    """
+    if not _enabled:
+        return
+    _marks.append((phase, time.perf_counter()))
+    _waiting_for.discard(phase)
+    if not _waiting_for and not _reported:
+        report()
+
+
+def add(phase, duration_ms):
+    """Record a phase measured elsewhere, e.g. on a background thread."""
+    if _enabled:
+        _background.append((phase, duration_ms))
+
+
+def report(file=None):
+    """Print the per-phase timing breakdown."""
+    global _reported
+    _reported = True
+    file = file or sys.stderr
+    
+    print("Startup profile:", file=file)
+    previous = _origin
+    for phase, at in _marks:
+        print(f"  {phase:<32} {(at - previous) * 1000:8.1f} ms  "
+              f"(at {(at - _origin) * 1000:8.1f} ms)", file=file)
+        previous = at
+    for phase, duration_ms in _background:
+        print(f"  {phase:<32} {duration_ms:8.1f} ms  (background)", file=file)
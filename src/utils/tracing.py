@@ -0,0 +1,226 @@
+import os
+import sys
+import json
+import time
+import logging
+import itertools
+import threading
+from collections import deque
+
+# Every logger is a child of this one, named after its category
+ROOT_LOGGER = "onaplay"
+LEVELS = ('debug', 'info', 'warning', 'error')
+
+# Trace events are kept in a ring buffer, oldest dropped first
+MAX_EVENTS = 200000
+
+# Whether spans are recorded; read before doing any tracing work
+enabled = False
+
+_origin = time.perf_counter()
+_events = deque(maxlen=MAX_EVENTS)
+_thread_names = {}
+_span_ids = itertools.count(1)
+_handler = None
+
+
+def get_logger(category):
+    """
+    Get the logger of a category, e.g. "player" or "ui".
+    
+    Logging is done with the standard logging module; pass arguments
+    separately ("Loaded %s", path) so disabled levels cost no formatting.
+    """
+    return logging.getLogger(f"{ROOT_LOGGER}.{category}")
+
+
+def configure(level='warning', categories=None, stream=None):
+    """
+    Set up log output.
+    
+    Args:
+        level (str): Lowest level logged, one of LEVELS
+        categories (iterable): Only these categories log at the given level;
+                               all others keep logging warnings and errors
+        stream: Text stream for the log, defaults to standard error
+    """
+    global _handler
+    root = logging.getLogger(ROOT_LOGGER)
+    if _handler is None:
+        _handler = logging.StreamHandler(stream or sys.stderr)
+        _handler.setFormatter(logging.Formatter(
+            "%(relativeCreated)9.1f %(levelname)-7s %(name)s: %(message)s"))
+        root.addHandler(_handler)
+        root.propagate = False
+    elif stream is not None:
+        _handler.setStream(stream)
+    
+    level = getattr(logging, level.upper())
+    if categories:
+        root.setLevel(max(level, logging.WARNING))
+        for category in categories:
+            get_logger(category).setLevel(level)
+    else:
+        root.setLevel(level)
+
+
+def enable(max_events=MAX_EVENTS):
+    """
+    Start recording trace spans.
+    
+    Args:
+        max_events (int): Number of events kept before the oldest are dropped
+    """
+    global enabled, _events
+    if _events.maxlen != max_events:
+        _events = deque(_events, maxlen=max_events)
+    enabled = True
+
+
+def disable():
+    """Stop recording trace spans; recorded events are kept."""
+    global enabled
+    enabled = False
+
+
+def clear():
+    """Drop all recorded events."""
+    _events.clear()
+
+
+def _record(phase, name, category, args, span_id=None, ts=None, dur=None):
+    thread = threading.current_thread()
+    if thread.ident not in _thread_names:
+        _thread_names[thread.ident] = thread.name
+    event = {
+        'name': name,
+        'cat': category,
+        'ph': phase,
+        'ts': ts if ts is not None else (time.perf_counter() - _origin) * 1e6,
+        'pid': os.getpid(),
+        'tid': thread.ident,
+    }
+    if dur is not None:
+        event['dur'] = dur
+    elif phase == 'i':
+        event['s'] = 't'    # Instant events are scoped to their thread
+    if span_id is not None:
+        event['id'] = span_id
+    if args:
+        event['args'] = args
+    _events.append(event)
+
+
+class _Span:
+    """A timed block on one thread, recorded as a complete event."""
+    
+    __slots__ = ('name', 'category', 'args', 'started')
+    
+    def __init__(self, name, category, args):
+        self.name = name
+        self.category = category
+        self.args = args
+    
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, tb):
+        ended = time.perf_counter()
+        if exc_type is not None:
+            self.args['error'] = str(exc_value) or exc_type.__name__
+        _record('X', self.name, self.category, self.args,
+                ts=(self.started - _origin) * 1e6, dur=(ended - self.started) * 1e6)
+        return False
+
+
+class _NullSpan:
+    """Stand-in for _Span while tracing is disabled."""
+    
+    __slots__ = ()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name, category, **args):
+    """
+    Time a block of code on the current thread.
+        
+        with tracing.span("parse", "probe", path=path):
+            ...
+    
+    While tracing is disabled this returns a shared no-op context manager.
+    """
+    if not enabled:
+        return _NULL_SPAN
+    return _Span(name, category, args)
+
+
+def begin(name, category, **args):
+    """
+    Start a span that ends elsewhere, e.g. in an event handler.
+    
+    Returns:
+        tuple: Token to pass to end(), or None while tracing is disabled
+    """
+    if not enabled:
+        return None
+    token = (next(_span_ids), name, category)
+    _record('b', name, category, args, span_id=token[0])
+    return token
+
+
+def end(token, **args):
+    """
+    End a span started with begin().
+    
+    Args:
+        token (tuple): Token returned by begin(); None is ignored
+    """
+    if token is None:
+        return
+    span_id, name, category = token
+    _record('e', name, category, args, span_id=span_id)
+
+
+def instant(name, category, **args):
+    """Record a single point in time."""
+    if enabled:
+        _record('i', name, category, args)
+
+
+def get_events():
+    """Get a copy of the recorded events."""
+    return list(_events)
+
+
+def export(path):
+    """
+    Write the recorded events as Chrome trace event JSON.
+    
+    The file opens in chrome://tracing or https://ui.perfetto.dev.
+    
+    Args:
+        path (str): Output file
+    
+    Returns:
+        int: Number of events written
+    """
+    events = list(_events)
+    pid = os.getpid()
+    metadata = [{'name': 'process_name', 'ph': 'M', 'pid': pid, 'tid': 0,
+                 'args': {'name': 'OnaPlay'}}]
+    for tid, name in list(_thread_names.items()):
+        metadata.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid,
+                         'args': {'name': name}})
+    
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'traceEvents': metadata + events, 'displayTimeUnit': 'ms'}, f)
+    return len(events)